@@ -0,0 +1,16 @@
+from cache.counts import CountCache, movie_count_cache
+from cache.interfaces import CacheInterface
+from cache.memory import InMemoryCache, TTLCache
+from cache.movies import create_movie_cache, movie_cache, movie_cache_key
+from cache.principals import PrincipalCache, principal_cache
+from cache.reference import (
+    REFERENCE_CHANNEL,
+    REFERENCE_MODELS,
+    ReferenceDataCache,
+    reference_cache,
+)
+from cache.suggestions import (
+    PrefixIndex,
+    load_suggestion_index,
+    suggestion_index,
+)
@@ -0,0 +1,28 @@
+import os
+from typing import Hashable, Optional
+
+from cache.memory import TTLCache
+
+
+class CountCache:
+    """
+    Process-local cache of row counts keyed by a normalized filter tuple.
+
+    Entries expire after ``ttl`` seconds so that writes made by other workers
+    become visible eventually; writes made by this process call ``clear()``.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 1024) -> None:
+        self._entries: TTLCache[int] = TTLCache(ttl, max_entries)
+
+    def get(self, key: Hashable) -> Optional[int]:
+        return self._entries.get(key)
+
+    def set(self, key: Hashable, count: int) -> None:
+        self._entries.set(key, count)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+movie_count_cache = CountCache(ttl=float(os.getenv("MOVIE_COUNT_CACHE_TTL", 60)))
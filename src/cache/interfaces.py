@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheInterface(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored under a key.
+
+        :param key: The cache key.
+        :return: The cached bytes, or None on a miss or after expiry.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Store a value under a key.
+
+        :param key: The cache key.
+        :param value: The bytes to store.
+        :param ttl: Seconds until the entry expires; the backend default if None.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Remove the given keys. Missing keys are ignored.
+
+        :param keys: The cache keys to remove.
+        """
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove every entry owned by this cache.
+        """
+        pass
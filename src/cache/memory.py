@@ -0,0 +1,84 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+from cache.interfaces import CacheInterface
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Process-local LRU map with per-entry expiry.
+
+    Once ``max_entries`` is reached the least recently used entry is evicted.
+    Expired entries are dropped when they are next looked up.
+    """
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` for ``ttl`` seconds, or the default TTL if not given.
+        """
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[V], bool]) -> None:
+        """
+        Remove every entry whose value matches ``predicate``.
+        """
+        for key in [
+            key for key, (_, value) in self._entries.items() if predicate(value)
+        ]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class InMemoryCache(CacheInterface):
+    """
+    Process-local LRU cache with per-entry expiry.
+
+    Once ``max_entries`` is reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 4096) -> None:
+        self._entries: TTLCache[bytes] = TTLCache(ttl, max_entries)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
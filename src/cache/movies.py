@@ -0,0 +1,34 @@
+import os
+
+from cache.interfaces import CacheInterface
+from cache.memory import InMemoryCache
+
+
+def movie_cache_key(movie_id: int) -> str:
+    return f"movie:{movie_id}"
+
+
+def create_movie_cache() -> CacheInterface:
+    """
+    Build the movie detail cache selected by ``MOVIE_CACHE_BACKEND``.
+
+    ``memory`` (the default) keeps entries in this process; ``redis`` shares
+    them between workers through ``REDIS_URL``.
+    """
+    backend = os.getenv("MOVIE_CACHE_BACKEND", "memory")
+    ttl = float(os.getenv("MOVIE_CACHE_TTL", 300))
+
+    if backend == "redis":
+        from cache.redis import RedisCache
+
+        return RedisCache(
+            url=os.getenv("REDIS_URL", "redis://localhost:6379/0"), ttl=ttl
+        )
+    if backend == "memory":
+        return InMemoryCache(
+            ttl=ttl, max_entries=int(os.getenv("MOVIE_CACHE_MAX_ENTRIES", 4096))
+        )
+    raise ValueError(f"Unknown MOVIE_CACHE_BACKEND: {backend}")
+
+
+movie_cache = create_movie_cache()
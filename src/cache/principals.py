@@ -0,0 +1,53 @@
+import hashlib
+import os
+import time
+from typing import Optional
+
+from cache.memory import TTLCache
+from security.principal import Principal
+
+
+class PrincipalCache:
+    """
+    Process-local LRU cache of the principal behind each access token.
+
+    Entries are keyed by the SHA-256 digest of the token, so raw tokens are
+    not kept around, and live for ``ttl`` seconds but never past the token's
+    own expiry. A hit skips both the JWT decode and the user lookup; group or
+    activation changes made meanwhile show up once the entry expires. The
+    writer calls ``discard_user`` so its own worker sees the change at once;
+    other workers pick it up within ``ttl``.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_entries: int = 10000) -> None:
+        self._ttl = ttl
+        self._entries: TTLCache[Principal] = TTLCache(ttl, max_entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Principal]:
+        return self._entries.get(self._key(token))
+
+    def set(self, token: str, principal: Principal, token_expires_at: float) -> None:
+        """
+        Cache ``principal`` for ``token``, which expires at the Unix time
+        ``token_expires_at``.
+        """
+        ttl = min(self._ttl, token_expires_at - time.time())
+        if ttl <= 0:
+            return
+        self._entries.set(self._key(token), principal, ttl)
+
+    def discard_user(self, user_id: int) -> None:
+        self._entries.discard_if(lambda principal: principal.id == user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl=float(os.getenv("PRINCIPAL_CACHE_TTL", 60)),
+    max_entries=int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", 10000)),
+)
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from cache.interfaces import CacheInterface
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+class RedisCache(CacheInterface):
+    """
+    Cache backed by Redis, shared by every worker.
+
+    Keys are namespaced with ``prefix`` so that ``clear()`` only touches this
+    cache's entries. Any client exposing the ``redis.asyncio`` API can be
+    passed in, e.g. a local fake in tests; otherwise one is created from
+    ``url``, which requires the optional ``redis`` package.
+    """
+
+    def __init__(
+        self,
+        url: str = None,
+        client=None,
+        ttl: float = 300.0,
+        prefix: str = "online-cinema:",
+    ) -> None:
+        if client is None:
+            if aioredis is None:
+                raise RuntimeError(
+                    "The redis package is required for the Redis cache backend."
+                )
+            client = aioredis.from_url(url)
+        self._client = client
+        self._ttl = ttl
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        expires_in = self._ttl if ttl is None else ttl
+        await self._client.set(self._prefix + key, value, px=int(expires_in * 1000))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(match=self._prefix + "*")]
+        if keys:
+            await self._client.delete(*keys)
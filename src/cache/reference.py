@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from cache.suggestions import (
+    SUGGESTION_KINDS,
+    load_suggestion_index,
+    suggestion_index,
+)
+from database.models import CertificationModel, DirectorModel, GenreModel, StarModel
+
+REFERENCE_MODELS = {
+    "genre": GenreModel,
+    "star": StarModel,
+    "director": DirectorModel,
+    "certification": CertificationModel,
+}
+REFERENCE_CHANNEL = "reference_data"
+
+
+class ReferenceDataCache:
+    """
+    In-process id → name maps for genres, stars, directors and certifications.
+
+    Repositories write through ``publish()`` inside their transaction, which
+    sends a ``NOTIFY`` that Postgres delivers on commit, and apply the change
+    locally with ``put()`` / ``discard()`` once committed. ``listen()`` keeps
+    every worker subscribed to those notifications and reloads the maps after
+    (re)connecting so that nothing missed while disconnected goes stale; its
+    first load is the one done at startup, see ``wait_loaded()``.
+
+    Until a kind has been loaded, ``all()`` returns None and ``lookup()``
+    reports every id as missing, so callers fall back to the database.
+
+    The same notifications keep ``suggestion_index`` in step across workers:
+    changes to genre, star, director and ``movie`` entries are applied to it
+    too, and reloading any of those kinds rebuilds it from the database, once
+    for all the reloads announced together.
+    """
+
+    def __init__(self) -> None:
+        self._names: dict[str, dict[int, str]] = {}
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._tasks: set[asyncio.Task] = set()
+        self._loaded = asyncio.Event()
+        self._suggestions_reload_pending = False
+
+    def all(self, kind: str) -> Optional[list[dict]]:
+        """
+        Return every entry of a kind ordered by id, or None if not loaded.
+        """
+        names = self._names.get(kind)
+        if names is None:
+            return None
+        return [{"id": entry_id, "name": names[entry_id]} for entry_id in sorted(names)]
+
+    def lookup(self, kind: str, ids: Iterable[int]) -> tuple[dict[int, str], list[int]]:
+        """
+        Split ids into the ``{id: name}`` entries known to the cache and the
+        ids that still have to be looked up.
+        """
+        names = self._names.get(kind, {})
+        found, missing = {}, []
+        for entry_id in ids:
+            name = names.get(entry_id)
+            if name is None:
+                missing.append(entry_id)
+            else:
+                found[entry_id] = name
+        return found, missing
+
+    def put(self, kind: str, entry_id: int, name: str) -> None:
+        names = self._names.get(kind)
+        if names is not None:
+            names[entry_id] = name
+
+    def discard(self, kind: str, entry_id: int) -> None:
+        names = self._names.get(kind)
+        if names is not None:
+            names.pop(entry_id, None)
+
+    async def load(self, session: AsyncSession, *kinds: str) -> None:
+        """
+        Replace the maps of the given kinds, or of every kind, from the database.
+        """
+        for kind in kinds or REFERENCE_MODELS:
+            model = REFERENCE_MODELS[kind]
+            result = await session.execute(select(model.id, model.name))
+            self._names[kind] = dict(result.all())
+
+    async def wait_loaded(self, timeout: float) -> bool:
+        """
+        Wait until ``listen()`` has loaded the maps and the suggestion index
+        for the first time; return False if that takes over ``timeout``
+        seconds.
+        """
+        try:
+            await asyncio.wait_for(self._loaded.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def publish(
+        self,
+        session: AsyncSession,
+        kind: str,
+        entry_id: Optional[int] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        Announce a change to every worker once the session's transaction commits.
+
+        With a name the entry is added, without one it is removed, and without
+        an id the whole kind is reloaded. ``kind`` is a reference data kind or
+        ``movie``, which only feeds the suggestion index.
+        """
+        payload = {"kind": kind}
+        if entry_id is not None:
+            payload.update(id=entry_id, name=name)
+        await session.execute(
+            select(func.pg_notify(REFERENCE_CHANNEL, json.dumps(payload)))
+        )
+
+    async def listen(
+        self,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker,
+        retry_interval: float = 5.0,
+    ) -> None:
+        """
+        Apply change notifications until cancelled, reconnecting on failure.
+        """
+        self._session_factory = session_factory
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    raw_connection = await connection.get_raw_connection()
+                    driver_connection = raw_connection.driver_connection
+                    lost = asyncio.Event()
+                    driver_connection.add_termination_listener(lambda _: lost.set())
+                    await driver_connection.add_listener(
+                        REFERENCE_CHANNEL, self._on_notification
+                    )
+                    async with session_factory() as session:
+                        await self.load(session)
+                        await load_suggestion_index(session)
+                    self._loaded.set()
+                    await lost.wait()
+                logging.error("Lost the reference data listener connection")
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                logging.error(f"Reference data listener failed: {error}")
+            await asyncio.sleep(retry_interval)
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            kind = change["kind"]
+            if kind not in REFERENCE_MODELS and kind not in SUGGESTION_KINDS:
+                raise ValueError(f"Unknown kind {kind!r}")
+        except (ValueError, KeyError, TypeError) as error:
+            logging.error(f"Ignoring reference data notification {payload!r}: {error}")
+            return
+
+        if "id" not in change:
+            if kind in REFERENCE_MODELS:
+                self._spawn(self._reload(kind))
+            if kind in SUGGESTION_KINDS and not self._suggestions_reload_pending:
+                self._suggestions_reload_pending = True
+                self._spawn(self._reload_suggestions())
+        elif change.get("name") is None:
+            self.discard(kind, change["id"])
+            if kind in SUGGESTION_KINDS:
+                suggestion_index.remove(kind, change["id"])
+        else:
+            self.put(kind, change["id"], change["name"])
+            if kind in SUGGESTION_KINDS:
+                suggestion_index.add(kind, change["id"], change["name"])
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _reload(self, kind: str) -> None:
+        try:
+            async with self._session_factory() as session:
+                await self.load(session, kind)
+        except Exception as error:
+            logging.error(f"Failed to reload {kind} reference data: {error}")
+
+    async def _reload_suggestions(self) -> None:
+        # Reloads announced from here on need a rebuild of their own.
+        self._suggestions_reload_pending = False
+        try:
+            async with self._session_factory() as session:
+                await load_suggestion_index(session)
+        except Exception as error:
+            logging.error(f"Failed to rebuild the suggestion index: {error}")
+
+
+reference_cache = ReferenceDataCache()
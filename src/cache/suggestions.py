@@ -0,0 +1,290 @@
+import asyncio
+import heapq
+import logging
+from array import array
+from bisect import bisect_left, insort
+from contextlib import asynccontextmanager
+from itertools import accumulate
+from typing import AsyncIterator, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import DirectorModel, GenreModel, MovieModel, StarModel
+
+SUGGESTION_KINDS = ("movie", "genre", "star", "director")
+_KIND_CODES = {kind: code for code, kind in enumerate(SUGGESTION_KINDS)}
+
+
+def _normalize(text: str) -> bytes:
+    return " ".join(text.casefold().split()).encode()
+
+
+class _SortedEntries:
+    """
+    Immutable, sorted and array-backed entries of a ``PrefixIndex``.
+
+    Normalized keys and display names are concatenated into two UTF-8 blobs
+    addressed by ``array`` offsets, with parallel arrays for ids and kinds and
+    a sorted array of identities for membership tests. That keeps per-entry
+    overhead at a few bytes instead of several Python objects.
+    """
+
+    def __init__(self, entries: list[tuple[bytes, int, int, bytes]]) -> None:
+        keys = [entry[0] for entry in entries]
+        names = [entry[3] for entry in entries]
+        self.keys = b"".join(keys)
+        self.names = b"".join(names)
+        self.key_offsets = array("I", [0])
+        self.key_offsets.extend(accumulate(map(len, keys)))
+        self.name_offsets = array("I", [0])
+        self.name_offsets.extend(accumulate(map(len, names)))
+        self.kinds = array("B", [entry[1] for entry in entries])
+        self.ids = array("q", [entry[2] for entry in entries])
+        self.identities = array(
+            "q", sorted(_identity_key(entry[1:3]) for entry in entries)
+        )
+
+    @classmethod
+    def from_names(cls, entries: Iterable[tuple[str, int, str]]) -> "_SortedEntries":
+        return cls(
+            sorted(
+                (_normalize(name), _KIND_CODES[kind], entry_id, name.encode())
+                for kind, entry_id, name in entries
+            )
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.keys)
+            + len(self.names)
+            + sum(
+                values.itemsize * len(values)
+                for values in (
+                    self.key_offsets,
+                    self.name_offsets,
+                    self.ids,
+                    self.kinds,
+                    self.identities,
+                )
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, identity: tuple[int, int]) -> bool:
+        key = _identity_key(identity)
+        position = bisect_left(self.identities, key)
+        return position < len(self.identities) and self.identities[position] == key
+
+    def key(self, position: int) -> bytes:
+        return self.keys[self.key_offsets[position] : self.key_offsets[position + 1]]
+
+    def name(self, position: int) -> bytes:
+        return self.names[self.name_offsets[position] : self.name_offsets[position + 1]]
+
+    def lower_bound(self, needle: bytes) -> int:
+        low, high = 0, len(self.ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self.key(middle) < needle:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def merged(
+        self,
+        added: list[tuple[bytes, int, int, bytes]],
+        removed: set[tuple[int, int]],
+    ) -> "_SortedEntries":
+        """
+        Return new entries with ``removed`` identities left out and the sorted
+        ``added`` entries merged in.
+        """
+        kept = (
+            (self.key(position), code, entry_id, self.name(position))
+            for position, (code, entry_id) in enumerate(zip(self.kinds, self.ids))
+            if (code, entry_id) not in removed
+        )
+        return _SortedEntries(list(heapq.merge(kept, added)))
+
+
+def _identity_key(identity: tuple[int, int]) -> int:
+    code, entry_id = identity
+    return entry_id * len(SUGGESTION_KINDS) + code
+
+
+class PrefixIndex:
+    """
+    In-memory, case-insensitive prefix index over names.
+
+    The bulk of the entries lives in an immutable ``_SortedEntries`` layout.
+    Mutations go to a sorted overlay (``_added``) plus a set of shadowed
+    identities that the layout holds (``_removed``); both are merged into a
+    new layout once they grow past ``compact_threshold`` entries.
+
+    Building and compacting sort up to millions of entries, so they run in a
+    worker thread. Mutations made meanwhile are applied to the overlay as
+    usual and also journaled; when the new layout is ready it is swapped in
+    and the journal is replayed on top of it in one step of the event loop,
+    so readers never see a half-built index.
+    """
+
+    def __init__(self, compact_threshold: int = 16384) -> None:
+        self._compact_threshold = compact_threshold
+        self._entries = _SortedEntries([])
+        self._added: list[tuple[bytes, int, int, bytes]] = []
+        self._added_by_identity: dict[tuple[int, int], tuple] = {}
+        self._removed: set[tuple[int, int]] = set()
+        # Mutations since the running build or compaction took its snapshot.
+        self._journal: Optional[list[tuple[str, int, Optional[str]]]] = None
+        self._rebuild_lock = asyncio.Lock()
+        self._compaction: Optional[asyncio.Task] = None
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory held by the sorted arrays.
+        """
+        return self._entries.nbytes
+
+    @asynccontextmanager
+    async def rebuild(self) -> AsyncIterator[list[tuple[str, int, str]]]:
+        """
+        Replace the index contents with the ``(kind, id, name)`` entries that
+        the caller appends to the yielded list.
+
+        Mutations from the moment the block is entered are replayed on top of
+        the new contents, so entries changed while they were being read from
+        the database are not lost.
+        """
+        async with self._rebuild_lock:
+            self._journal = []
+            try:
+                entries: list[tuple[str, int, str]] = []
+                yield entries
+                sorted_entries = await asyncio.to_thread(
+                    _SortedEntries.from_names, entries
+                )
+            except BaseException:
+                self._journal = None
+                raise
+            self._install(sorted_entries)
+
+    def add(self, kind: str, entry_id: int, name: str) -> None:
+        if self._journal is not None:
+            self._journal.append((kind, entry_id, name))
+        self._add(kind, entry_id, name)
+        self._compact_if_needed()
+
+    def remove(self, kind: str, entry_id: int) -> None:
+        if self._journal is not None:
+            self._journal.append((kind, entry_id, None))
+        self._remove((_KIND_CODES[kind], entry_id))
+        self._compact_if_needed()
+
+    def suggest(self, prefix: str, limit: int = 10) -> list[dict]:
+        needle = _normalize(prefix)
+        if not needle or limit <= 0:
+            return []
+
+        matches = []
+        entries = self._entries
+        position = entries.lower_bound(needle)
+        while position < len(entries) and len(matches) < limit:
+            key = entries.key(position)
+            if not key.startswith(needle):
+                break
+            identity = (entries.kinds[position], entries.ids[position])
+            if identity not in self._removed:
+                matches.append((key, *identity, entries.name(position)))
+            position += 1
+
+        position = bisect_left(self._added, (needle,))
+        for entry in self._added[position : position + limit]:
+            if not entry[0].startswith(needle):
+                break
+            matches.append(entry)
+
+        return [
+            {"kind": SUGGESTION_KINDS[code], "id": entry_id, "name": name.decode()}
+            for _, code, entry_id, name in sorted(matches)[:limit]
+        ]
+
+    def _add(self, kind: str, entry_id: int, name: str) -> None:
+        entry = (_normalize(name), _KIND_CODES[kind], entry_id, name.encode())
+        self._remove(entry[1:3])
+        insort(self._added, entry)
+        self._added_by_identity[entry[1:3]] = entry
+
+    def _remove(self, identity: tuple[int, int]) -> None:
+        entry = self._added_by_identity.pop(identity, None)
+        if entry is not None:
+            del self._added[bisect_left(self._added, entry)]
+        if identity in self._entries:
+            self._removed.add(identity)
+
+    def _install(self, entries: _SortedEntries) -> None:
+        journal, self._journal = self._journal or [], None
+        self._entries = entries
+        self._added = []
+        self._added_by_identity = {}
+        self._removed = set()
+        for kind, entry_id, name in journal:
+            if name is None:
+                self._remove((_KIND_CODES[kind], entry_id))
+            else:
+                self._add(kind, entry_id, name)
+
+    def _compact_if_needed(self) -> None:
+        if (
+            len(self._added) + len(self._removed) < self._compact_threshold
+            or self._compaction is not None
+            or self._rebuild_lock.locked()
+        ):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._install(self._entries.merged(self._added, self._removed))
+            return
+        self._compaction = loop.create_task(self._compact())
+        self._compaction.add_done_callback(self._compaction_done)
+
+    async def _compact(self) -> None:
+        async with self._rebuild_lock:
+            self._journal = []
+            try:
+                entries = await asyncio.to_thread(
+                    self._entries.merged, list(self._added), set(self._removed)
+                )
+            except BaseException:
+                self._journal = None
+                raise
+            self._install(entries)
+
+    def _compaction_done(self, task: asyncio.Task) -> None:
+        self._compaction = None
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"Failed to compact the suggestion index: {task.exception()}")
+
+
+suggestion_index = PrefixIndex()
+
+
+async def load_suggestion_index(session: AsyncSession) -> None:
+    """
+    Fill ``suggestion_index`` with every movie, genre, star and director name.
+    """
+    async with suggestion_index.rebuild() as entries:
+        for kind, model in (
+            ("movie", MovieModel),
+            ("genre", GenreModel),
+            ("star", StarModel),
+            ("director", DirectorModel),
+        ):
+            result = await session.execute(select(model.id, model.name))
+            entries.extend((kind, entry_id, name) for entry_id, name in result)
@@ -0,0 +1,60 @@
+"""
+Rebuild the related-movies index in ``movie_similarity``.
+
+Needs the optional ``jobs`` dependency group (``poetry install --with jobs``).
+Usage (from the ``src`` directory)::
+
+    python -m cli.compute_similarity
+    python -m cli.compute_similarity --top-k 50 --star-weight 3
+"""
+
+import argparse
+import asyncio
+import logging
+
+from database.session import AsyncPostgresqlSessionLocal
+from services.movie_service.similarity import SIMILARITY_WEIGHTS, MovieSimilarityJob
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--top-k", type=int, default=20, help="related movies kept per movie"
+    )
+    parser.add_argument(
+        "--max-df",
+        type=int,
+        default=2000,
+        help="genres, stars or directors linked to more movies than this only "
+        "re-rank candidates instead of producing them",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=2000, help="movies scored per product"
+    )
+    for kind, weight in SIMILARITY_WEIGHTS.items():
+        parser.add_argument(
+            f"--{kind[:-1]}-weight",
+            dest=kind,
+            metavar="WEIGHT",
+            type=float,
+            default=weight,
+            help=f"score of one shared {kind[:-1]}",
+        )
+    args = parser.parse_args()
+    if min(args.top_k, args.max_df, args.chunk_size) < 1:
+        parser.error("--top-k, --max-df and --chunk-size must be positive")
+
+    logging.basicConfig(level=logging.INFO)
+    job = MovieSimilarityJob(
+        AsyncPostgresqlSessionLocal,
+        weights={kind: getattr(args, kind) for kind in SIMILARITY_WEIGHTS},
+        top_k=args.top_k,
+        max_df=args.max_df,
+        chunk_size=args.chunk_size,
+    )
+    written = asyncio.run(job.run())
+    print(f"Wrote {written} movie similarity rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Bulk-import movies from a CSV or JSON Lines file.
+
+Usage (from the ``src`` directory)::
+
+    python -m cli.import_movies movies.csv
+    python -m cli.import_movies movies.jsonl --batch-size 10000
+"""
+
+import argparse
+import asyncio
+import json
+
+from database.session import AsyncPostgresqlSessionLocal
+from repositories.movies_rep.importer import MovieImportRepository
+from services.movie_service.importer import (
+    IMPORT_FORMATS,
+    MAX_BATCH_SIZE,
+    MovieImportService,
+)
+
+
+async def import_movies(path: str, file_format: str, batch_size: int) -> dict:
+    async with AsyncPostgresqlSessionLocal() as session:
+        service = MovieImportService(
+            import_rep=MovieImportRepository(db=session), db=session
+        )
+        with open(path, "rb") as file:
+            return await service.import_file(file, file_format, batch_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="CSV or JSON Lines file to import")
+    parser.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        help="file format; guessed from the file extension if omitted",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    file_format = args.format or args.path.rsplit(".", 1)[-1].lower()
+    if file_format not in IMPORT_FORMATS:
+        parser.error("cannot guess the file format, pass --format")
+    if not 1 <= args.batch_size <= MAX_BATCH_SIZE:
+        parser.error(f"--batch-size must be between 1 and {MAX_BATCH_SIZE}")
+
+    report = asyncio.run(import_movies(args.path, file_format, args.batch_size))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+# Keys of the transaction-level advisory locks (``pg_advisory_xact_lock``)
+# that let one worker at a time run a job shared by every worker. The values
+# are arbitrary but must stay distinct within the database.
+
+TRENDING_LOCK_ID = 7_468_101
+KEY_ROTATION_LOCK_ID = 7_468_102
+PASSWORD_POLICY_LOCK_ID = 7_468_103
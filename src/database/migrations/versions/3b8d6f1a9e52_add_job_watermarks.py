@@ -0,0 +1,61 @@
+"""add job watermarks
+
+Revision ID: 3b8d6f1a9e52
+Revises: 9c4e7b2d5f18
+Create Date: 2026-10-19 01:12:40.318275
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8d6f1a9e52"
+down_revision: Union[str, None] = "9c4e7b2d5f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "job_watermarks",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Carry on from the last aggregation instead of counting its events again.
+    op.execute(
+        "INSERT INTO job_watermarks (name, watermark) "
+        "SELECT 'trending', max(updated_at) FROM movie_trending "
+        "HAVING max(updated_at) IS NOT NULL"
+    )
+    op.drop_index("ix_movie_reactions_updated_at", table_name="movie_reactions")
+    op.drop_index("ix_movie_ratings_updated_at", table_name="movie_ratings")
+    op.create_index(
+        "ix_movie_reactions_created_at",
+        "movie_reactions",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_movie_ratings_created_at", "movie_ratings", ["created_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movie_ratings_created_at", table_name="movie_ratings")
+    op.drop_index("ix_movie_reactions_created_at", table_name="movie_reactions")
+    op.create_index(
+        "ix_movie_ratings_updated_at", "movie_ratings", ["updated_at"], unique=False
+    )
+    op.create_index(
+        "ix_movie_reactions_updated_at",
+        "movie_reactions",
+        ["updated_at"],
+        unique=False,
+    )
+    op.drop_table("job_watermarks")
@@ -0,0 +1,49 @@
+"""add person name indexes
+
+Revision ID: 3c8e5a1f9d27
+Revises: f1b6e2d47a05
+Create Date: 2026-10-18 17:12:44.908153
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8e5a1f9d27"
+down_revision: Union[str, None] = "f1b6e2d47a05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_stars_name_key",
+        "stars",
+        [sa.text('(lower(name) COLLATE "C")'), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_directors_name_key",
+        "directors",
+        [sa.text('(lower(name) COLLATE "C")'), "id"],
+        unique=False,
+    )
+    op.create_index("ix_movie_stars_star_id", "movie_stars", ["star_id"], unique=False)
+    op.create_index(
+        "ix_movie_directors_director_id",
+        "movie_directors",
+        ["director_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movie_directors_director_id", table_name="movie_directors")
+    op.drop_index("ix_movie_stars_star_id", table_name="movie_stars")
+    op.drop_index("ix_directors_name_key", table_name="directors")
+    op.drop_index("ix_stars_name_key", table_name="stars")
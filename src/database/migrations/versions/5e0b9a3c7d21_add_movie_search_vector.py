@@ -0,0 +1,65 @@
+"""add movie search vector
+
+Revision ID: 5e0b9a3c7d21
+Revises: c41d7e2a9f10
+Create Date: 2026-10-18 11:24:37.902145
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5e0b9a3c7d21"
+down_revision: Union[str, None] = "c41d7e2a9f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "movies", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True)
+    )
+    op.execute(
+        """
+        UPDATE movies SET search_vector =
+            setweight(to_tsvector('english', movies.name), 'A')
+            || setweight(to_tsvector('english', concat_ws(' ',
+                (SELECT string_agg(stars.name, ' ')
+                 FROM stars JOIN movie_stars ON movie_stars.star_id = stars.id
+                 WHERE movie_stars.movie_id = movies.id),
+                (SELECT string_agg(directors.name, ' ')
+                 FROM directors
+                 JOIN movie_directors ON movie_directors.director_id = directors.id
+                 WHERE movie_directors.movie_id = movies.id)
+            )), 'B')
+            || setweight(to_tsvector('english', movies.description), 'C')
+        """
+    )
+    op.create_index(
+        "ix_movies_search_vector",
+        "movies",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_movies_name_trgm",
+        "movies",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movies_name_trgm", table_name="movies")
+    op.drop_index("ix_movies_search_vector", table_name="movies")
+    op.drop_column("movies", "search_vector")
@@ -0,0 +1,49 @@
+"""add jwt signing keys
+
+Revision ID: 5e2a9c7d1f40
+Revises: d6b19e47c3a8
+Create Date: 2026-10-18 21:04:37.218654
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e2a9c7d1f40"
+down_revision: Union[str, None] = "d6b19e47c3a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "jwt_signing_keys",
+        sa.Column("kid", sa.String(length=64), nullable=False),
+        sa.Column("private_key", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("activates_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("kid"),
+    )
+    op.create_index(
+        op.f("ix_jwt_signing_keys_activates_at"),
+        "jwt_signing_keys",
+        ["activates_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_jwt_signing_keys_activates_at"), table_name="jwt_signing_keys"
+    )
+    op.drop_table("jwt_signing_keys")
@@ -0,0 +1,40 @@
+"""add password hash policies
+
+Revision ID: 6f3c1d8e2a47
+Revises: 5e2a9c7d1f40
+Create Date: 2026-10-18 23:12:05.431870
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6f3c1d8e2a47"
+down_revision: Union[str, None] = "5e2a9c7d1f40"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "password_hash_policies",
+        sa.Column("scheme", sa.String(length=16), nullable=False),
+        sa.Column("rounds", sa.Integer(), nullable=False),
+        sa.Column("memory_cost", sa.Integer(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("scheme"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("password_hash_policies")
@@ -0,0 +1,38 @@
+"""add movie updated_at
+
+Revision ID: 7d2f61b0c8e4
+Revises: 5e0b9a3c7d21
+Create Date: 2026-10-18 13:41:27.905318
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2f61b0c8e4"
+down_revision: Union[str, None] = "5e0b9a3c7d21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "movies",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index("ix_movies_updated_at", "movies", ["updated_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movies_updated_at", table_name="movies")
+    op.drop_column("movies", "updated_at")
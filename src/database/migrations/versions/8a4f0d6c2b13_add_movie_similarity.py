@@ -0,0 +1,43 @@
+"""add movie similarity
+
+Revision ID: 8a4f0d6c2b13
+Revises: 3c8e5a1f9d27
+Create Date: 2026-10-18 18:03:57.126490
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4f0d6c2b13"
+down_revision: Union[str, None] = "3c8e5a1f9d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movie_similarity",
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("other_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["movie_id"], ["movies.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["other_id"], ["movies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("movie_id", "other_id"),
+    )
+    op.create_index(
+        "ix_movie_similarity_movie_id_score",
+        "movie_similarity",
+        ["movie_id", "score"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movie_similarity_movie_id_score", table_name="movie_similarity")
+    op.drop_table("movie_similarity")
@@ -0,0 +1,34 @@
+"""add catalog versions
+
+Revision ID: 9c4e7b2d5f18
+Revises: 6f3c1d8e2a47
+Create Date: 2026-10-18 23:48:19.602114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c4e7b2d5f18"
+down_revision: Union[str, None] = "6f3c1d8e2a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    catalog_versions = op.create_table(
+        "catalog_versions",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.bulk_insert(catalog_versions, [{"name": "movie_deletions", "version": 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("catalog_versions")
@@ -0,0 +1,51 @@
+"""add movie reactions
+
+Revision ID: a93c5d18e7b6
+Revises: e58a0c3b9f12
+Create Date: 2026-10-18 15:12:44.560917
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a93c5d18e7b6"
+down_revision: Union[str, None] = "e58a0c3b9f12"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movie_reactions",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "kind", sa.Enum("LIKE", "DISLIKE", name="reactionkindenum"), nullable=False
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["movie_id"], ["movies.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "movie_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("movie_reactions")
+    sa.Enum(name="reactionkindenum").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,31 @@
+"""add movie keyset indexes
+
+Revision ID: c41d7e2a9f10
+Revises: b3afc544d230
+Create Date: 2026-10-18 10:02:11.413562
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41d7e2a9f10"
+down_revision: Union[str, None] = "b3afc544d230"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_movies_price_id", "movies", ["price", "id"], unique=False)
+    op.create_index("ix_movies_year_id", "movies", ["year", "id"], unique=False)
+    op.create_index("ix_movies_votes_id", "movies", ["votes", "id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_movies_votes_id", table_name="movies")
+    op.drop_index("ix_movies_year_id", table_name="movies")
+    op.drop_index("ix_movies_price_id", table_name="movies")
@@ -0,0 +1,69 @@
+"""add movie trending
+
+Revision ID: d6b19e47c3a8
+Revises: 8a4f0d6c2b13
+Create Date: 2026-10-18 19:21:06.553817
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d6b19e47c3a8"
+down_revision: Union[str, None] = "8a4f0d6c2b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movie_trending",
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["movie_id"], ["movies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("movie_id"),
+    )
+    op.create_index("ix_movie_trending_rank", "movie_trending", ["rank"], unique=False)
+    # Existing purchases keep a NULL timestamp so they do not all look recent.
+    op.add_column(
+        "user_purchased_movies",
+        sa.Column("purchased_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.alter_column(
+        "user_purchased_movies", "purchased_at", server_default=sa.text("now()")
+    )
+    op.create_index(
+        "ix_user_purchased_movies_purchased_at",
+        "user_purchased_movies",
+        ["purchased_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_movie_reactions_updated_at",
+        "movie_reactions",
+        ["updated_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_movie_ratings_updated_at", "movie_ratings", ["updated_at"], unique=False
+    )
+    op.create_index("ix_cart_items_added_at", "cart_items", ["added_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_cart_items_added_at", table_name="cart_items")
+    op.drop_index("ix_movie_ratings_updated_at", table_name="movie_ratings")
+    op.drop_index("ix_movie_reactions_updated_at", table_name="movie_reactions")
+    op.drop_index(
+        "ix_user_purchased_movies_purchased_at", table_name="user_purchased_movies"
+    )
+    op.drop_column("user_purchased_movies", "purchased_at")
+    op.drop_index("ix_movie_trending_rank", table_name="movie_trending")
+    op.drop_table("movie_trending")
@@ -0,0 +1,45 @@
+"""add movie comment count
+
+Revision ID: e58a0c3b9f12
+Revises: 7d2f61b0c8e4
+Create Date: 2026-10-18 14:26:03.118240
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e58a0c3b9f12"
+down_revision: Union[str, None] = "7d2f61b0c8e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "movies",
+        sa.Column("comment_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE movies
+        SET comment_count = counts.total
+        FROM (
+            SELECT movie_id, count(*) AS total FROM comments GROUP BY movie_id
+        ) AS counts
+        WHERE counts.movie_id = movies.id
+        """
+    )
+    op.create_index(
+        "ix_comments_movie_id_id", "comments", ["movie_id", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_comments_movie_id_id", table_name="comments")
+    op.drop_column("movies", "comment_count")
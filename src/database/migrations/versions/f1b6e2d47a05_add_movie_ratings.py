@@ -0,0 +1,89 @@
+"""add movie ratings
+
+Revision ID: f1b6e2d47a05
+Revises: a93c5d18e7b6
+Create Date: 2026-10-18 15:58:30.271604
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f1b6e2d47a05"
+down_revision: Union[str, None] = "a93c5d18e7b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "movie_ratings",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("movie_id", sa.Integer(), nullable=False),
+        sa.Column("rating", sa.Numeric(precision=4, scale=2), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["movie_id"], ["movies.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "movie_id"),
+    )
+    op.add_column(
+        "movies",
+        sa.Column(
+            "rating_sum",
+            sa.Numeric(precision=14, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        "movies",
+        sa.Column("rating_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    # The first rating used to leave rate_count at 0, so any rated movie
+    # counts at least one rating.
+    op.execute(
+        """
+        UPDATE movies
+        SET rating_count = CASE
+                WHEN coalesce(rate, 0) > 0 THEN greatest(coalesce(rate_count, 0), 1)
+                ELSE 0
+            END
+        """
+    )
+    op.execute("UPDATE movies SET rating_sum = coalesce(rate, 0) * rating_count")
+    op.drop_column("movies", "rate_count")
+    op.drop_column("movies", "rate")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("movies", sa.Column("rate", sa.Float(), nullable=True))
+    op.add_column("movies", sa.Column("rate_count", sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE movies
+        SET rate = CASE
+                WHEN rating_count > 0 THEN round(rating_sum / rating_count, 2)
+                ELSE 0
+            END,
+            rate_count = rating_count
+        """
+    )
+    op.drop_column("movies", "rating_count")
+    op.drop_column("movies", "rating_sum")
+    op.drop_table("movie_ratings")
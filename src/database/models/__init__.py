@@ -1,15 +1,24 @@
 from database.models.accounts import (
     ActivationTokenModel,
+    JWTSigningKeyModel,
+    PasswordHashPolicyModel,
     UserGroupModel,
     UserModel,
     UserPurchasedMoviesModel,
 )
 from database.models.movies import (
+    CatalogVersionModel,
     CertificationModel,
     CommentModel,
     DirectorModel,
     GenreModel,
+    JobWatermarkModel,
     MovieModel,
+    MovieRatingModel,
+    MovieReactionModel,
+    MovieSimilarityModel,
+    MovieTrendingModel,
+    ReactionKindEnum,
     StarModel,
 )
 from database.models.orders import OrderItemModel, OrderModel
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -24,7 +25,7 @@ from sqlalchemy.orm import (
 
 from database import validators
 from database.models.base import Base
-from security.passwords import hash_password, verify_password
+from security.passwords import password_hasher
 from security.utils import generate_secure_token
 
 
@@ -68,6 +69,8 @@ UserPurchasedMoviesModel = Table(
         primary_key=True,
         nullable=False,
     ),
+    Column("purchased_at", DateTime(timezone=True), server_default=func.now()),
+    Index("ix_user_purchased_movies_purchased_at", "purchased_at"),
 )
 
 
@@ -137,26 +140,28 @@ class UserModel(Base):
         return self.group.name == group_name
 
     @classmethod
-    def create(
+    async def create(
         cls, email: str, raw_password: str, group_id: int | Mapped[int]
     ) -> "UserModel":
         user = cls(email=email, group_id=group_id)
-        user.password = raw_password
+        await user.set_password(raw_password)
         return user
 
-    @property
-    def password(self) -> None:
-        raise AttributeError(
-            "Password is write-only. Use the setter to set the password."
-        )
-
-    @password.setter
-    def password(self, raw_password: str) -> None:
+    async def set_password(self, raw_password: str) -> None:
         validators.validate_password_strength(raw_password)
-        self._hashed_password = hash_password(raw_password)
+        self._hashed_password = await password_hasher.hash(raw_password)
 
-    def verify_password(self, raw_password: str) -> bool:
-        return verify_password(raw_password, self._hashed_password)
+    async def verify_password(self, raw_password: str) -> bool:
+        """
+        Check the password and, when it is correct but was hashed under an
+        outdated policy, replace the stored hash; the caller commits it.
+        """
+        is_valid, new_hash = await password_hasher.verify_and_update(
+            raw_password, self._hashed_password
+        )
+        if new_hash:
+            self._hashed_password = new_hash
+        return is_valid
 
 
 class UserProfileModel(Base):
@@ -252,3 +257,36 @@ class RefreshTokenModel(TokenBaseModel):
 
     def __repr__(self):
         return f"<RefreshTokenModel(id={self.id}, token={self.token}, expires_at={self.expires_at})>"
+
+
+class JWTSigningKeyModel(Base):
+    __tablename__ = "jwt_signing_keys"
+
+    kid: Mapped[str] = mapped_column(String(64), primary_key=True)
+    private_key: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    activates_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<JWTSigningKeyModel(kid={self.kid}, activates_at={self.activates_at})>"
+
+
+class PasswordHashPolicyModel(Base):
+    __tablename__ = "password_hash_policies"
+
+    scheme: Mapped[str] = mapped_column(String(16), primary_key=True)
+    rounds: Mapped[int] = mapped_column(Integer, nullable=False)
+    memory_cost: Mapped[Optional[int]] = mapped_column(Integer)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self):
+        return f"<PasswordHashPolicyModel(scheme={self.scheme}, rounds={self.rounds})>"
@@ -1,16 +1,25 @@
+import enum
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    BigInteger,
     Column,
+    DateTime,
+    Enum,
+    Float,
     ForeignKey,
+    Index,
     Numeric,
     String,
     Table,
     Text,
     UniqueConstraint,
+    func,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.models.base import Base
@@ -47,6 +56,7 @@ MovieStarsModel = Table(
         primary_key=True,
         nullable=False,
     ),
+    Index("ix_movie_stars_star_id", "star_id"),
 )
 
 MovieDirectorsModel = Table(
@@ -64,6 +74,7 @@ MovieDirectorsModel = Table(
         primary_key=True,
         nullable=False,
     ),
+    Index("ix_movie_directors_director_id", "director_id"),
 )
 
 
@@ -95,6 +106,9 @@ class StarModel(Base):
         return f"<Star(name='{self.name}')>"
 
 
+Index("ix_stars_name_key", func.lower(StarModel.name).collate("C"), StarModel.id)
+
+
 class DirectorModel(Base):
     __tablename__ = "directors"
 
@@ -109,6 +123,13 @@ class DirectorModel(Base):
         return f"<Director(name='{self.name}')>"
 
 
+Index(
+    "ix_directors_name_key",
+    func.lower(DirectorModel.name).collate("C"),
+    DirectorModel.id,
+)
+
+
 class CertificationModel(Base):
     __tablename__ = "certifications"
 
@@ -130,6 +151,122 @@ class CommentModel(Base):
     movie_id: Mapped[int] = mapped_column(ForeignKey("movies.id"))
     movie: Mapped["MovieModel"] = relationship(back_populates="comments")
 
+    __table_args__ = (Index("ix_comments_movie_id_id", "movie_id", "id"),)
+
+
+class ReactionKindEnum(str, enum.Enum):
+    LIKE = "like"
+    DISLIKE = "dislike"
+
+
+class MovieReactionModel(Base):
+    __tablename__ = "movie_reactions"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    kind: Mapped[ReactionKindEnum] = mapped_column(
+        Enum(ReactionKindEnum), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("ix_movie_reactions_created_at", "created_at"),)
+
+    def __repr__(self):
+        return f"<MovieReaction(user_id={self.user_id}, movie_id={self.movie_id}, kind={self.kind})>"
+
+
+class MovieRatingModel(Base):
+    __tablename__ = "movie_ratings"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    rating: Mapped[Decimal] = mapped_column(Numeric(4, 2), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("ix_movie_ratings_created_at", "created_at"),)
+
+    def __repr__(self):
+        return f"<MovieRating(user_id={self.user_id}, movie_id={self.movie_id}, rating={self.rating})>"
+
+
+class MovieSimilarityModel(Base):
+    __tablename__ = "movie_similarity"
+
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    other_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+
+    __table_args__ = (Index("ix_movie_similarity_movie_id_score", "movie_id", "score"),)
+
+    def __repr__(self):
+        return f"<MovieSimilarity(movie_id={self.movie_id}, other_id={self.other_id}, score={self.score})>"
+
+
+class MovieTrendingModel(Base):
+    __tablename__ = "movie_trending"
+
+    movie_id: Mapped[int] = mapped_column(
+        ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True
+    )
+    score: Mapped[float] = mapped_column(Float, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    rank: Mapped[Optional[int]] = mapped_column(nullable=True)
+
+    __table_args__ = (Index("ix_movie_trending_rank", "rank"),)
+
+    def __repr__(self):
+        return f"<MovieTrending(movie_id={self.movie_id}, score={self.score}, rank={self.rank})>"
+
+
+class CatalogVersionModel(Base):
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CatalogVersion(name={self.name}, version={self.version})>"
+
+
+class JobWatermarkModel(Base):
+    __tablename__ = "job_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<JobWatermark(name={self.name}, watermark={self.watermark})>"
+
 
 class MovieModel(Base):
     __tablename__ = "movies"
@@ -168,13 +305,53 @@ class MovieModel(Base):
     certification: Mapped["CertificationModel"] = relationship(back_populates="movies")
     likes: Mapped[Optional[int]] = mapped_column(nullable=True, default=0)
     dislikes: Mapped[Optional[int]] = mapped_column(nullable=True, default=0)
-    rate: Mapped[Optional[float]] = mapped_column(nullable=True, default=0.0)
-    rate_count: Mapped[Optional[int]] = mapped_column(nullable=True, default=0)
+    rating_sum: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), default=0, server_default="0", nullable=False
+    )
+    rating_count: Mapped[int] = mapped_column(
+        default=0, server_default="0", nullable=False
+    )
+    comment_count: Mapped[int] = mapped_column(
+        default=0, server_default="0", nullable=False
+    )
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, nullable=True, deferred=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
 
     __table_args__ = (
         UniqueConstraint("name", "year", "time", name="unique_movie_constraint"),
+        Index("ix_movies_price_id", "price", "id"),
+        Index("ix_movies_year_id", "year", "id"),
+        Index("ix_movies_votes_id", "votes", "id"),
+        Index("ix_movies_updated_at", "updated_at"),
+        Index("ix_movies_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_movies_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
 
+    @property
+    def rate(self) -> float:
+        """
+        Average user rating, derived from ``rating_sum`` and ``rating_count``.
+        """
+        if not self.rating_count:
+            return 0.0
+        return round(float(self.rating_sum) / self.rating_count, 2)
+
+    @property
+    def rate_count(self) -> int:
+        return self.rating_count
+
     @classmethod
     def default_order_by(cls):
         return [cls.id.desc()]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import DateTime, ForeignKey, Integer, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.models.base import Base
@@ -47,4 +47,5 @@ class CartItemModel(Base):
 
     __table_args__ = (
         UniqueConstraint("cart_id", "movie_id", name="unique_movie_in_cart_constraint"),
+        Index("ix_cart_items_added_at", "added_at"),
     )
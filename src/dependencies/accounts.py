@@ -1,15 +1,21 @@
 import os
 
 from dotenv import load_dotenv
-from fastapi import Depends
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from database import get_db
+from cache import principal_cache
+from database import UserModel, get_db
+from exceptions import BaseSecurityError, TokenExpiredError
 from notifications import EmailSender, EmailSenderInterface
 from repositories.accounts_rep import UserRepository
 from security.http import get_token
 from security.interfaces import JWTAuthManagerInterface
 from security.jwt_auth_manager import JWTAuthManager
+from security.key_ring import JWT_KEY_RING_ENABLED, jwt_key_ring
+from security.principal import Principal
 from storages import S3StorageClient, S3StorageInterface
 
 load_dotenv()
@@ -20,11 +26,20 @@ def get_jwt_auth_manager() -> JWTAuthManagerInterface:
     secret_key_refresh = os.getenv("SECRET_KEY_REFRESH")
     algorithm = os.getenv("JWT_SIGNING_ALGORITHM", "HS256")
 
-    if not secret_key_access or not isinstance(secret_key_access, (str, bytes)):
-        raise ValueError("SECRET_KEY_ACCESS must be a string or bytes.")
     if not secret_key_refresh or not isinstance(secret_key_refresh, (str, bytes)):
         raise ValueError("SECRET_KEY_REFRESH must be a string or bytes.")
 
+    if JWT_KEY_RING_ENABLED:
+        return JWTAuthManager(
+            secret_key_access=None,
+            secret_key_refresh=secret_key_refresh,
+            algorithm="HS256",
+            key_ring=jwt_key_ring,
+        )
+
+    if not secret_key_access or not isinstance(secret_key_access, (str, bytes)):
+        raise ValueError("SECRET_KEY_ACCESS must be a string or bytes.")
+
     return JWTAuthManager(
         secret_key_access=secret_key_access,
         secret_key_refresh=secret_key_refresh,
@@ -32,12 +47,54 @@ def get_jwt_auth_manager() -> JWTAuthManagerInterface:
     )
 
 
+async def get_principal(
+    request: Request,
+    token: str = Depends(get_token),
+    session: AsyncSession = Depends(get_db),
+    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+) -> Principal:
+    """
+    Authenticate the request and attach its principal to ``request.state``.
+
+    This is the only place access tokens are decoded. FastAPI resolves it
+    once per request however many dependencies use it, and a token seen
+    recently is answered from ``principal_cache`` without decoding or a
+    query.
+    """
+    principal = principal_cache.get(token)
+    if principal is None:
+        try:
+            token_info = jwt_manager.decode_access_token(token)
+        except TokenExpiredError as error:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail=str(error)
+            )
+        except BaseSecurityError as error:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail=str(error)
+            )
+
+        user = await session.scalar(
+            select(UserModel)
+            .options(joinedload(UserModel.group))
+            .where(UserModel.id == token_info.get("user_id"))
+        )
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found."
+            )
+        principal = Principal.from_user(user)
+        principal_cache.set(token, principal, token_info["exp"])
+
+    request.state.principal = principal
+    return principal
+
+
 def get_user_repository(
     session: AsyncSession = Depends(get_db),
-    JWTmanager: JWTAuthManager = Depends(get_jwt_auth_manager),
-    token: str = Depends(get_token),
+    principal: Principal = Depends(get_principal),
 ) -> UserRepository:
-    return UserRepository(session=session, JWTmanager=JWTmanager, token=token)
+    return UserRepository(session=session, principal=principal)
 
 
 def get_s3_storage_client() -> S3StorageInterface:
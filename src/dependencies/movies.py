@@ -2,17 +2,21 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database import get_db
+from database.session import AsyncPostgresqlSessionLocal
 from dependencies.accounts import get_user_repository
 from repositories.accounts_rep import UserRepository
 from repositories.movies_rep.certification import CertificationRepository
 from repositories.movies_rep.director import DirectorRepository
 from repositories.movies_rep.genre import GenreRepository
+from repositories.movies_rep.importer import MovieImportRepository
 from repositories.movies_rep.movie import MovieRepository
 from repositories.movies_rep.star import StarRepository
 from repositories.movies_rep.comment import CommentRepository
 from services.movie_service.certification import CertificationService
 from services.movie_service.director import DirectorService
+from services.movie_service.exporter import MovieExportService
 from services.movie_service.genre import GenreService
+from services.movie_service.importer import MovieImportService
 from services.movie_service.movie import MovieService
 from services.movie_service.star import StarService
 from services.movie_service.comment import CommentService
@@ -48,6 +52,12 @@ def _get_movie_repository(
     return MovieRepository(db=session)
 
 
+def _get_movie_import_repository(
+    session: AsyncSession = Depends(get_db),
+):
+    return MovieImportRepository(db=session)
+
+
 def _get_comment_repository(
     session: AsyncSession = Depends(get_db),
 ):
@@ -103,7 +113,7 @@ def get_movie_service(
 ) -> MovieService:
     return MovieService(movie_rep=movie_repository, user_rep=user_repository, db=db)
 
-  
+
 def get_comment_service(
     comment_repository: CommentRepository = Depends(_get_comment_repository),
     user_repository: UserRepository = Depends(get_user_repository),
@@ -112,3 +122,14 @@ def get_comment_service(
     return CommentService(
         comment_rep=comment_repository, user_rep=user_repository, db=db
     )
+
+
+def get_movie_import_service(
+    import_repository: MovieImportRepository = Depends(_get_movie_import_repository),
+    db: AsyncSession = Depends(get_db),
+) -> MovieImportService:
+    return MovieImportService(import_rep=import_repository, db=db)
+
+
+def get_movie_export_service() -> MovieExportService:
+    return MovieExportService(session_factory=AsyncPostgresqlSessionLocal)
@@ -1,7 +1,12 @@
 from exceptions.email import (
     BaseEmailError,
 )
-from exceptions.security import BaseSecurityError, InvalidTokenError, TokenExpiredError
+from exceptions.security import (
+    BaseSecurityError,
+    InvalidTokenError,
+    PasswordHasherBusyError,
+    TokenExpiredError,
+)
 from exceptions.storage import (
     BaseS3Error,
     S3BucketNotFoundError,
@@ -0,0 +1,14 @@
+class MovieException(Exception):
+    pass
+
+
+class InvalidCursorError(MovieException):
+    pass
+
+
+class MovieNotFoundError(MovieException):
+    pass
+
+
+class RelatedNotFoundError(MovieException):
+    pass
@@ -19,3 +19,10 @@ class InvalidTokenError(BaseSecurityError):
 
     def __init__(self, message="Invalid token."):
         super().__init__(message)
+
+
+class PasswordHasherBusyError(BaseSecurityError):
+    """Raised when too many password hashing operations are already pending."""
+
+    def __init__(self, message="Too many password hashing requests, try again later."):
+        super().__init__(message)
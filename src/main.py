@@ -1,6 +1,14 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 
+from cache import reference_cache
+from database.session import AsyncPostgresqlSessionLocal, postgresql_engine
+from repositories.movies_rep.reactions import reaction_buffer
+from repositories.movies_rep.trending import trending_aggregator
 from routes import (
     accounts_router,
     certification_router,
@@ -12,10 +20,56 @@ from routes import (
     profiles_router,
     shopping_cart_router,
     star_router,
+    well_known_router,
 )
+from security.key_ring import JWT_KEY_RING_ENABLED, jwt_key_ring
+from security.password_policy import load_password_policy
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The listener loads the reference data and the suggestion index as soon
+    # as it is subscribed, so nothing changed in between is missed.
+    reference_listener = asyncio.create_task(
+        reference_cache.listen(postgresql_engine, AsyncPostgresqlSessionLocal)
+    )
+    if not await reference_cache.wait_loaded(timeout=30):
+        logging.error("Timed out loading the reference data and suggestion index")
+    try:
+        async with AsyncPostgresqlSessionLocal() as session:
+            policy = await load_password_policy(session)
+        logging.info(f"Password hashing policy: {policy}")
+    except Exception as error:
+        logging.error(f"Failed to configure the password hashing policy: {error}")
+
+    if JWT_KEY_RING_ENABLED:
+        try:
+            async with AsyncPostgresqlSessionLocal() as session:
+                await jwt_key_ring.refresh(session)
+        except Exception as error:
+            logging.error(f"Failed to load the JWT signing keys: {error}")
+
+    reaction_flusher = asyncio.create_task(
+        reaction_buffer.run(AsyncPostgresqlSessionLocal)
+    )
+    trending_refresher = asyncio.create_task(
+        trending_aggregator.run(AsyncPostgresqlSessionLocal)
+    )
+    tasks = [trending_refresher, reference_listener, reaction_flusher]
+    if JWT_KEY_RING_ENABLED:
+        tasks.append(asyncio.create_task(jwt_key_ring.run(AsyncPostgresqlSessionLocal)))
+    yield
+    for task in tasks:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
 
 app = FastAPI(
     title="Online Cinema",
+    lifespan=lifespan,
 )
 
 api_version_prefix = "/api"
@@ -64,5 +118,6 @@ app.include_router(
     tags=["shopping cart"],
 )
 app.include_router(order_router, prefix=f"{api_version_prefix}/orders", tags=["orders"])
+app.include_router(well_known_router, prefix="/.well-known", tags=["well-known"])
 
 app.openapi = custom_openapi
@@ -3,14 +3,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from database import UserGroupEnum, UserModel, UserPurchasedMoviesModel
-from security.jwt_auth_manager import JWTAuthManager
+from security.principal import Principal
 
 
 class UserRepository:
-    def __init__(self, session: AsyncSession, JWTmanager: JWTAuthManager, token: str):
+    def __init__(self, session: AsyncSession, principal: Principal):
         self.session = session
-        self.jwt_manager = JWTmanager
-        self.token = token
+        self.principal = principal
+        self._user = None
 
     async def get_user_by_id(self, user_id) -> UserModel:
         result = await self.session.execute(
@@ -20,13 +20,16 @@ class UserRepository:
         )
         return result.scalars().first()
 
-    async def get_user_from_token(self) -> UserModel:
-        token_info = self.jwt_manager.decode_access_token(self.token)
-        return await self.get_user_by_id(token_info["user_id"])
+    async def get_current_user(self) -> UserModel:
+        """
+        Load the full model of the authenticated user, once per request.
+        """
+        if self._user is None:
+            self._user = await self.get_user_by_id(self.principal.id)
+        return self._user
 
-    async def check_user_is_admin(self):
-        user = await self.get_user_from_token()
-        return user.group.name == UserGroupEnum.ADMIN
+    def is_admin(self) -> bool:
+        return self.principal.has_group(UserGroupEnum.ADMIN)
 
     async def is_movie_in_purchased(self, user_id: int, movie_id: int) -> bool:
         query = select(UserPurchasedMoviesModel).where(
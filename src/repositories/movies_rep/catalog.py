@@ -0,0 +1,246 @@
+from sqlalchemy import Select, exists, func, literal, select, tuple_, union_all
+
+from database.models import (
+    CertificationModel,
+    DirectorModel,
+    GenreModel,
+    MovieModel,
+    MovieTrendingModel,
+    StarModel,
+)
+from database.models.movies import (
+    MovieDirectorsModel,
+    MovieGenresModel,
+    MovieStarsModel,
+)
+from repositories.movies_rep.search import search_filter, search_rank
+
+# sort_by value -> (sort column, descending). Every ordering is completed with
+# movies.id in the same direction, which keeps it total and keyset-friendly.
+CATALOG_ORDERINGS = {
+    "price": (MovieModel.price, False),
+    "release_year": (MovieModel.year, False),
+    "popularity": (MovieModel.votes, True),
+}
+
+# facet name -> (association table, its foreign key column, facet model)
+CATALOG_FACETS = {
+    "genres": (MovieGenresModel, MovieGenresModel.c.genre_id, GenreModel),
+    "stars": (MovieStarsModel, MovieStarsModel.c.star_id, StarModel),
+    "directors": (
+        MovieDirectorsModel,
+        MovieDirectorsModel.c.director_id,
+        DirectorModel,
+    ),
+}
+
+
+class MovieCatalogPlan:
+    """
+    Everything needed to answer one catalog request.
+
+    The plan is built once per request and produces exactly one listing
+    statement and one count statement that share the same filter predicate.
+    """
+
+    def __init__(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        q: str = None,
+        name: str = None,
+        year: int = None,
+        rating: float = None,
+        genre_ids: list[int] = None,
+        star_ids: list[int] = None,
+        director_ids: list[int] = None,
+        certification_ids: list[int] = None,
+        sort_by: str = None,
+        after: tuple = None,
+        approximate_count: bool = False,
+        facet_limit: int = 20,
+    ) -> None:
+        self.page = page
+        self.page_size = page_size
+        self.q = q.strip() if q and q.strip() else None
+        self.name = name
+        self.year = year
+        self.rating = rating
+        self.facet_ids = {
+            "genres": tuple(sorted(set(genre_ids or ()))),
+            "stars": tuple(sorted(set(star_ids or ()))),
+            "directors": tuple(sorted(set(director_ids or ()))),
+        }
+        self.certification_ids = tuple(sorted(set(certification_ids or ())))
+        self.sort_by = sort_by if sort_by in CATALOG_ORDERINGS else None
+        self.trending = sort_by == "trending"
+        self.after = after
+        self.approximate_count = approximate_count
+        self.facet_limit = facet_limit
+
+    @property
+    def filters(self) -> list:
+        return self._filters()
+
+    def _filters(self, exclude_facet: str = None) -> list:
+        """
+        Build the filter predicate, leaving out the selection of
+        ``exclude_facet`` if given.
+        """
+        filters = []
+        if self.q:
+            filters.append(search_filter(self.q))
+        if self.name:
+            filters.append(MovieModel.name.ilike(f"%{self.name}%"))
+        if self.year:
+            filters.append(MovieModel.year == self.year)
+        if self.rating:
+            filters.append(MovieModel.imdb >= self.rating)
+        for facet, ids in self.facet_ids.items():
+            if ids and facet != exclude_facet:
+                association, column, _ = CATALOG_FACETS[facet]
+                filters.append(
+                    exists().where(
+                        association.c.movie_id == MovieModel.id, column.in_(ids)
+                    )
+                )
+        if self.certification_ids and exclude_facet != "certifications":
+            filters.append(MovieModel.certification_id.in_(self.certification_ids))
+        return filters
+
+    @property
+    def count_key(self) -> tuple:
+        """
+        Normalized filter tuple identifying the count of this plan.
+        """
+        return (
+            self.q,
+            self.name.lower() if self.name else None,
+            self.year or None,
+            self.rating or None,
+            *self.facet_ids.values(),
+            self.certification_ids,
+            self.trending,
+        )
+
+    @property
+    def ranked(self) -> bool:
+        """
+        Whether rows are ordered by search relevance rather than a sort key.
+
+        Relevance ordering has no stable keyset, so it is only paginated with
+        OFFSET.
+        """
+        return self.q is not None and self.sort_by is None and not self.trending
+
+    @property
+    def keyset(self) -> bool:
+        """
+        Whether the ordering supports cursor pagination. Relevance has no
+        stable keyset and the trending list is short enough for OFFSET.
+        """
+        return not self.ranked and not self.trending
+
+    def listing_statement(self) -> Select:
+        """
+        Select the ids of the movies on the requested page, in display order.
+        """
+        column, descending = CATALOG_ORDERINGS.get(self.sort_by, (None, True))
+        sort_columns = [MovieModel.id] if column is None else [column, MovieModel.id]
+
+        query = select(MovieModel.id).where(*self.filters)
+        if self.trending:
+            return (
+                self._join_trending(query)
+                .order_by(MovieTrendingModel.rank)
+                .offset((self.page - 1) * self.page_size)
+                .limit(self.page_size)
+            )
+        if self.ranked:
+            return (
+                query.order_by(search_rank(self.q).desc(), MovieModel.id.desc())
+                .offset((self.page - 1) * self.page_size)
+                .limit(self.page_size)
+            )
+
+        if self.after is not None:
+            position = tuple_(*sort_columns)
+            query = query.where(
+                position < self.after if descending else position > self.after
+            )
+        else:
+            query = query.offset((self.page - 1) * self.page_size)
+
+        return query.order_by(
+            *(col.desc() if descending else col for col in sort_columns)
+        ).limit(self.page_size)
+
+    def count_statement(self) -> Select:
+        query = select(func.count()).select_from(MovieModel).where(*self.filters)
+        return self._join_trending(query) if self.trending else query
+
+    @staticmethod
+    def _join_trending(query: Select) -> Select:
+        """
+        Restrict a query to the precomputed top trending movies.
+        """
+        return query.join(
+            MovieTrendingModel, MovieTrendingModel.movie_id == MovieModel.id
+        ).where(MovieTrendingModel.rank.is_not(None))
+
+    def facet_statement(self) -> Select:
+        """
+        Count matching movies per genre, star, director and certification.
+
+        All facets come back from a single ``UNION ALL`` aggregate over the
+        association tables. Each facet counts the movies matching every filter
+        but its own selection, so picking one genre still shows how many
+        movies the other genres would add; facets without a selection share
+        one set of matching movies. Each facet keeps its ``facet_limit`` most
+        frequent values.
+        """
+        selected = {facet for facet, ids in self.facet_ids.items() if ids}
+        if self.certification_ids:
+            selected.add("certifications")
+
+        matching_sets, facet_queries = {}, []
+        for facet, model, association, column in (
+            *(
+                (facet, model, association, column)
+                for facet, (association, column, model) in CATALOG_FACETS.items()
+            ),
+            ("certifications", CertificationModel, None, None),
+        ):
+            excluded = facet if facet in selected else None
+            if excluded not in matching_sets:
+                matching_sets[excluded] = self._matching_movies(excluded)
+            matching = matching_sets[excluded]
+            query = select(
+                literal(facet).label("facet"),
+                model.id,
+                model.name,
+                func.count().label("count"),
+            ).select_from(matching)
+            if association is None:
+                column = matching.c.certification_id
+            else:
+                query = query.join(association, association.c.movie_id == matching.c.id)
+            facet_queries.append(
+                select(
+                    query.join(model, model.id == column)
+                    .group_by(model.id, model.name)
+                    .order_by(func.count().desc(), model.id)
+                    .limit(self.facet_limit)
+                    .subquery()
+                )
+            )
+        return union_all(*facet_queries)
+
+    def _matching_movies(self, exclude_facet: str = None):
+        query = select(MovieModel.id, MovieModel.certification_id).where(
+            *self._filters(exclude_facet)
+        )
+        if self.trending:
+            query = self._join_trending(query)
+        suffix = f"_without_{exclude_facet}" if exclude_facet else ""
+        return query.cte(f"matching_movies{suffix}")
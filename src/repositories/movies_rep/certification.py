@@ -1,6 +1,7 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import reference_cache
 from database.models import CertificationModel
 from schemas.movie import BaseCreateSchema
 
@@ -12,8 +13,13 @@ class CertificationRepository:
     async def create(self, certification: BaseCreateSchema):
         db_certification = CertificationModel(name=certification.name)
         self.db.add(db_certification)
+        await self.db.flush()
+        await reference_cache.publish(
+            self.db, "certification", db_certification.id, db_certification.name
+        )
         await self.db.commit()
         await self.db.refresh(db_certification)
+        reference_cache.put("certification", db_certification.id, db_certification.name)
         return db_certification
 
     async def get(self, certification_id: int):
@@ -23,12 +29,17 @@ class CertificationRepository:
         return result.scalars().first()
 
     async def get_all(self):
+        cached = reference_cache.all("certification")
+        if cached is not None:
+            return cached
         result = await self.db.execute(select(CertificationModel))
         return result.scalars().all()
 
     async def delete(self, certification_id: int):
-        certification = self.get(certification_id)
+        certification = await self.get(certification_id)
         if certification:
             await self.db.delete(certification)
+            await reference_cache.publish(self.db, "certification", certification_id)
             await self.db.commit()
+            reference_cache.discard("certification", certification_id)
         return certification
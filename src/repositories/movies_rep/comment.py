@@ -1,6 +1,8 @@
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import CommentModel
+from cache import movie_cache, movie_cache_key
+from database.models import CommentModel, MovieModel
 from schemas.movie import CommentCreateSchema
 
 
@@ -11,7 +13,31 @@ class CommentRepository:
     async def create(self, movie_id: int, user_id: int, comment: CommentCreateSchema):
         db_comment = CommentModel(user_id=user_id, movie_id=movie_id, text=comment.text)
         self.db.add(db_comment)
+        await self.db.execute(
+            update(MovieModel)
+            .where(MovieModel.id == movie_id)
+            .values(comment_count=MovieModel.comment_count + 1, updated_at=func.now())
+        )
         await self.db.commit()
+        await movie_cache.delete(movie_cache_key(movie_id))
         await self.db.refresh(db_comment)
 
         return db_comment
+
+    async def get_for_movie(
+        self, movie_id: int, before_id: int = None, limit: int = 20
+    ) -> list[CommentModel]:
+        """
+        Return up to ``limit`` comments of a movie, newest first, starting
+        right below ``before_id`` when given.
+
+        Served by the ``(movie_id, id)`` index, so every page costs the same
+        regardless of how deep the client has scrolled.
+        """
+        query = select(CommentModel).where(CommentModel.movie_id == movie_id)
+        if before_id is not None:
+            query = query.where(CommentModel.id < before_id)
+        result = await self.db.execute(
+            query.order_by(CommentModel.id.desc()).limit(limit)
+        )
+        return list(result.scalars())
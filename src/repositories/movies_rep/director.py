@@ -1,7 +1,13 @@
-from sqlalchemy import select
+from typing import Optional
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import movie_cache, reference_cache, suggestion_index
 from database.models import DirectorModel
+from database.models.movies import MovieDirectorsModel
+from repositories.movies_rep.people import person_page_statement
+from repositories.movies_rep.search import search_vector_update
 from schemas.movie import BaseCreateSchema
 
 
@@ -12,8 +18,14 @@ class DirectorRepository:
     async def create(self, director: BaseCreateSchema):
         db_director = DirectorModel(name=director.name)
         self.db.add(db_director)
+        await self.db.flush()
+        await reference_cache.publish(
+            self.db, "director", db_director.id, db_director.name
+        )
         await self.db.commit()
         await self.db.refresh(db_director)
+        reference_cache.put("director", db_director.id, db_director.name)
+        suggestion_index.add("director", db_director.id, db_director.name)
         return db_director
 
     async def get(self, director_id: int):
@@ -22,13 +34,39 @@ class DirectorRepository:
         )
         return result.scalars().first()
 
-    async def get_all(self):
-        result = await self.db.execute(select(DirectorModel))
-        return result.scalars().all()
+    async def get_page(
+        self,
+        prefix: Optional[str] = None,
+        after: Optional[tuple[str, int]] = None,
+        limit: int = 50,
+    ):
+        result = await self.db.execute(
+            person_page_statement(
+                DirectorModel, MovieDirectorsModel.c.director_id, prefix, after, limit
+            )
+        )
+        return result.all()
 
     async def delete(self, director_id: int):
-        director = self.get(director_id)
+        director = await self.get(director_id)
         if director:
+            movie_ids = list(
+                await self.db.scalars(
+                    select(MovieDirectorsModel.c.movie_id).where(
+                        MovieDirectorsModel.c.director_id == director_id
+                    )
+                )
+            )
             await self.db.delete(director)
+            await self.db.flush()
+            if movie_ids:
+                # The name is gone from these movies' search text as well.
+                await self.db.execute(
+                    search_vector_update(movie_ids).values(updated_at=func.now())
+                )
+            await reference_cache.publish(self.db, "director", director_id)
             await self.db.commit()
+            reference_cache.discard("director", director_id)
+            await movie_cache.clear()
+            suggestion_index.remove("director", director_id)
         return director
@@ -0,0 +1,75 @@
+from sqlalchemy import Select, func, select
+
+from database.models import (
+    CertificationModel,
+    DirectorModel,
+    GenreModel,
+    MovieModel,
+    StarModel,
+)
+from database.models.movies import (
+    MovieDirectorsModel,
+    MovieGenresModel,
+    MovieStarsModel,
+)
+
+EXPORT_COLUMNS = (
+    "id",
+    "uuid",
+    "name",
+    "year",
+    "time",
+    "imdb",
+    "votes",
+    "meta_score",
+    "gross",
+    "description",
+    "price",
+    "certification",
+    "genres",
+    "stars",
+    "directors",
+)
+
+
+def _names(model, association, column):
+    return (
+        select(func.array_agg(model.name))
+        .join(association, column == model.id)
+        .where(association.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+
+
+def catalog_export_statement() -> Select:
+    """
+    Select every movie as plain column tuples, in ``EXPORT_COLUMNS`` order.
+
+    Only core columns are selected, so streamed rows never enter the identity
+    map. Genre, star and director names are aggregated into arrays by
+    correlated subqueries over the association primary keys, which keeps the
+    result at one row per movie. The column set matches the bulk import format.
+    """
+    return (
+        select(
+            MovieModel.id,
+            MovieModel.uuid,
+            MovieModel.name,
+            MovieModel.year,
+            MovieModel.time,
+            MovieModel.imdb,
+            MovieModel.votes,
+            MovieModel.meta_score,
+            MovieModel.gross,
+            MovieModel.description,
+            MovieModel.price,
+            CertificationModel.name,
+            _names(GenreModel, MovieGenresModel, MovieGenresModel.c.genre_id),
+            _names(StarModel, MovieStarsModel, MovieStarsModel.c.star_id),
+            _names(
+                DirectorModel, MovieDirectorsModel, MovieDirectorsModel.c.director_id
+            ),
+        )
+        .join(CertificationModel, CertificationModel.id == MovieModel.certification_id)
+        .order_by(MovieModel.id)
+    )
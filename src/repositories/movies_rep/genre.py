@@ -1,7 +1,9 @@
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.models import GenreModel
+from cache import movie_cache, reference_cache, suggestion_index
+from database.models import GenreModel, MovieModel
+from database.models.movies import MovieGenresModel
 from schemas.movie import BaseCreateSchema
 
 
@@ -12,8 +14,12 @@ class GenreRepository:
     async def create(self, genre: BaseCreateSchema):
         db_genre = GenreModel(name=genre.name)
         self.db.add(db_genre)
+        await self.db.flush()
+        await reference_cache.publish(self.db, "genre", db_genre.id, db_genre.name)
         await self.db.commit()
         await self.db.refresh(db_genre)
+        reference_cache.put("genre", db_genre.id, db_genre.name)
+        suggestion_index.add("genre", db_genre.id, db_genre.name)
         return db_genre
 
     async def get(self, genre_id: int):
@@ -23,12 +29,30 @@ class GenreRepository:
         return result.scalars().first()
 
     async def get_all(self):
+        cached = reference_cache.all("genre")
+        if cached is not None:
+            return cached
         result = await self.db.execute(select(GenreModel))
         return result.scalars().all()
 
     async def delete(self, genre_id: int):
-        genre = self.get(genre_id)
+        genre = await self.get(genre_id)
         if genre:
+            await self.db.execute(
+                update(MovieModel)
+                .where(
+                    MovieModel.id.in_(
+                        select(MovieGenresModel.c.movie_id).where(
+                            MovieGenresModel.c.genre_id == genre_id
+                        )
+                    )
+                )
+                .values(updated_at=func.now())
+            )
             await self.db.delete(genre)
+            await reference_cache.publish(self.db, "genre", genre_id)
             await self.db.commit()
+            reference_cache.discard("genre", genre_id)
+            await movie_cache.clear()
+            suggestion_index.remove("genre", genre_id)
         return genre
@@ -0,0 +1,167 @@
+import uuid
+from typing import Optional
+
+from sqlalchemy import String, any_, bindparam, func, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import REFERENCE_MODELS, reference_cache
+from repositories.movies_rep.search import search_vector_update
+from schemas.movie import MovieImportRowSchema
+
+_STAGING_COLUMNS = (
+    "uuid",
+    "name",
+    "year",
+    "time",
+    "imdb",
+    "votes",
+    "meta_score",
+    "gross",
+    "description",
+    "price",
+    "certification_id",
+)
+
+
+class MovieImportRepository:
+    """
+    Loads batches of movies with ``COPY`` instead of one INSERT per row.
+
+    Each batch runs in its own transaction: referenced names are upserted,
+    movies are copied into a temporary staging table and inserted from there
+    (skipping titles that already exist), then association rows are copied
+    straight into ``movie_genres``, ``movie_stars`` and ``movie_directors``.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        # Reference data kinds that gained names; announcing them once the
+        # whole import is done is left to the caller.
+        self.created_kinds: set[str] = set()
+
+    async def import_batch(
+        self, rows: list[MovieImportRowSchema]
+    ) -> list[Optional[int]]:
+        """
+        Insert a batch of movies and return the new movie id of every row,
+        or None for rows skipped because the movie already exists.
+        """
+        created = {}
+        certifications = await self._upsert_names(
+            "certification", {row.certification for row in rows}, created
+        )
+        genres = await self._upsert_names(
+            "genre", {name for row in rows for name in row.genres}, created
+        )
+        stars = await self._upsert_names(
+            "star", {name for row in rows for name in row.stars}, created
+        )
+        directors = await self._upsert_names(
+            "director", {name for row in rows for name in row.directors}, created
+        )
+
+        await self.db.execute(
+            text(
+                "CREATE TEMP TABLE movie_import_staging ("
+                "uuid uuid, name varchar(255), year integer, time integer, "
+                "imdb double precision, votes integer, meta_score double precision, "
+                "gross double precision, description text, price numeric(10, 2), "
+                "certification_id integer"
+                ") ON COMMIT DROP"
+            )
+        )
+        row_uuids = [uuid.uuid4() for _ in rows]
+        connection = await self._driver_connection()
+        await connection.copy_records_to_table(
+            "movie_import_staging",
+            columns=_STAGING_COLUMNS,
+            records=[
+                (
+                    row_uuid,
+                    row.name,
+                    row.year,
+                    row.time,
+                    row.imdb,
+                    row.votes,
+                    row.meta_score,
+                    row.gross,
+                    row.description,
+                    row.price,
+                    certifications[row.certification],
+                )
+                for row_uuid, row in zip(row_uuids, rows)
+            ],
+        )
+
+        columns = ", ".join(f'"{column}"' for column in _STAGING_COLUMNS)
+        result = await self.db.execute(
+            text(
+                f"INSERT INTO movies ({columns}, likes, dislikes) "
+                f'SELECT DISTINCT ON (name, year, "time") {columns}, 0, 0 '
+                "FROM movie_import_staging "
+                "ON CONFLICT ON CONSTRAINT unique_movie_constraint DO NOTHING "
+                "RETURNING id, uuid"
+            )
+        )
+        movie_ids = {str(row_uuid): movie_id for movie_id, row_uuid in result}
+        row_movie_ids = [movie_ids.get(str(row_uuid)) for row_uuid in row_uuids]
+
+        for table, column, names, ids in (
+            ("movie_genres", "genre_id", "genres", genres),
+            ("movie_stars", "star_id", "stars", stars),
+            ("movie_directors", "director_id", "directors", directors),
+        ):
+            records = [
+                (movie_id, ids[name])
+                for movie_id, row in zip(row_movie_ids, rows)
+                if movie_id is not None
+                for name in getattr(row, names)
+            ]
+            if records:
+                await connection.copy_records_to_table(
+                    table, columns=("movie_id", column), records=records
+                )
+
+        new_ids = [movie_id for movie_id in row_movie_ids if movie_id is not None]
+        if new_ids:
+            await self.db.execute(search_vector_update(new_ids))
+        await self.db.commit()
+        self.created_kinds.update(created)
+        for kind, names in created.items():
+            for entry_id, name in names:
+                reference_cache.put(kind, entry_id, name)
+        return row_movie_ids
+
+    async def _upsert_names(
+        self, kind: str, names: set[str], created: dict[str, list]
+    ) -> dict[str, int]:
+        """
+        Make sure every name of a reference data kind exists and map names to
+        ids. Rows that had to be inserted are collected in ``created``.
+        """
+        model = REFERENCE_MODELS[kind]
+        if not names:
+            return {}
+        # Bound as one array parameter, so batches are not limited by the
+        # number of query parameters. Sorting keeps lock order stable across
+        # concurrent imports.
+        names = bindparam("names", sorted(names), type_=ARRAY(String))
+        result = await self.db.execute(
+            insert(model)
+            .from_select(["name"], select(func.unnest(names)))
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(model.id, model.name)
+        )
+        inserted = result.all()
+        if inserted:
+            created[kind] = inserted
+        result = await self.db.execute(
+            select(model.name, model.id).where(model.name == any_(names))
+        )
+        return dict(result.all())
+
+    async def _driver_connection(self):
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
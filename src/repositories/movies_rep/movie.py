@@ -1,31 +1,72 @@
-from sqlalchemy import func, select, update
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import func, literal, literal_column, select, text, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
+from cache import (
+    movie_cache,
+    movie_cache_key,
+    movie_count_cache,
+    reference_cache,
+    suggestion_index,
+)
 from database import UserPurchasedMoviesModel
 from database.models import (
+    CatalogVersionModel,
+    CertificationModel,
     DirectorModel,
     GenreModel,
     MovieModel,
+    MovieRatingModel,
+    MovieReactionModel,
+    MovieSimilarityModel,
+    MovieTrendingModel,
+    ReactionKindEnum,
     StarModel,
 )
-from schemas.movie import MovieCreateSchema
+from database.models.movies import (
+    MovieDirectorsModel,
+    MovieGenresModel,
+    MovieStarsModel,
+)
+from exceptions.movies import MovieNotFoundError, RelatedNotFoundError
+from repositories.movies_rep.catalog import MovieCatalogPlan
+from repositories.movies_rep.reactions import reaction_buffer
+from repositories.movies_rep.search import search_vector_update
+from schemas.movie import MovieCreateSchema, MovieSchema
+
+# ``catalog_versions`` row counting deleted movies.
+MOVIE_DELETIONS = "movie_deletions"
+# SQLSTATE that Postgres reports for a foreign key violation.
+_FOREIGN_KEY_VIOLATION = "23503"
 
 
 class MovieRepository:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def create(self, movie: MovieCreateSchema):
-        genres = await self.db.execute(
-            select(GenreModel).where(GenreModel.id.in_(movie.genres))
-        )
-        stars = await self.db.execute(
-            select(StarModel).where(StarModel.id.in_(movie.stars))
-        )
-        directors = await self.db.execute(
-            select(DirectorModel).where(DirectorModel.id.in_(movie.directors))
-        )
+    async def create(self, movie: MovieCreateSchema) -> MovieSchema:
+        """
+        Insert a movie with its relations and return it ready for the response.
+
+        Genres, stars, directors and the certification are resolved from the
+        reference data cache, association rows are inserted directly, and the
+        response is built from the values already in hand instead of being
+        reloaded.
+        Unknown genre, star and director ids are ignored.
+
+        :raises RelatedNotFoundError: If the certification does not exist, or
+            a relation was deleted after the cache was read.
+        """
+        related = await self._get_related_names(movie)
+        if not related["certification"]:
+            raise RelatedNotFoundError(
+                f"Certification {movie.certification_id} not found"
+            )
 
         db_movie = MovieModel(
             name=movie.name,
@@ -37,17 +78,96 @@ class MovieRepository:
             gross=movie.gross,
             description=movie.description,
             price=movie.price,
-            genres=list(genres.scalars()),
-            stars=list(stars.scalars()),
-            directors=list(directors.scalars()),
             certification_id=movie.certification_id,
         )
-        self.db.add(db_movie)
-        await self.db.commit()
-        await self.db.refresh(
-            db_movie, ["genres", "stars", "directors", "certification", "comments"]
+        try:
+            self.db.add(db_movie)
+            await self.db.flush()
+
+            for association, column, kind in (
+                (MovieGenresModel, "genre_id", "genre"),
+                (MovieStarsModel, "star_id", "star"),
+                (MovieDirectorsModel, "director_id", "director"),
+            ):
+                if related[kind]:
+                    await self.db.execute(
+                        association.insert().values(
+                            [
+                                {"movie_id": db_movie.id, column: related_id}
+                                for related_id in related[kind]
+                            ]
+                        )
+                    )
+            await self.db.execute(search_vector_update([db_movie.id]))
+            await reference_cache.publish(self.db, "movie", db_movie.id, db_movie.name)
+            await self.db.commit()
+        except IntegrityError as error:
+            await self.db.rollback()
+            if getattr(error.orig, "sqlstate", None) != _FOREIGN_KEY_VIOLATION:
+                raise
+            raise RelatedNotFoundError(
+                "A genre, star, director or the certification no longer exists"
+            )
+        movie_count_cache.clear()
+        await movie_cache.delete(movie_cache_key(db_movie.id))
+        suggestion_index.add("movie", db_movie.id, db_movie.name)
+
+        return MovieSchema(
+            id=db_movie.id,
+            name=db_movie.name,
+            uuid=db_movie.uuid,
+            year=db_movie.year,
+            time=db_movie.time,
+            imdb=db_movie.imdb,
+            votes=db_movie.votes,
+            meta_score=db_movie.meta_score,
+            gross=db_movie.gross,
+            description=db_movie.description,
+            price=db_movie.price,
+            genres=self._named(related["genre"]),
+            stars=self._named(related["star"]),
+            directors=self._named(related["director"]),
+            certification=self._named(related["certification"])[0],
+            likes=0,
+            dislikes=0,
+            rate=0.0,
+            rate_count=0,
+            comment_count=0,
         )
-        return db_movie
+
+    async def _get_related_names(self, movie: MovieCreateSchema) -> dict[str, dict]:
+        """
+        Resolve the names of a new movie's relations.
+
+        Names come from the reference data cache; only ids it does not know
+        are looked up, all kinds together in one round trip.
+
+        :return: ``{kind: {id: name}}`` for genre, star, director and
+            certification.
+        """
+        related, lookups = {}, []
+        for kind, model, ids in (
+            ("genre", GenreModel, movie.genres),
+            ("star", StarModel, movie.stars),
+            ("director", DirectorModel, movie.directors),
+            ("certification", CertificationModel, [movie.certification_id]),
+        ):
+            related[kind], missing = reference_cache.lookup(kind, ids)
+            if missing:
+                lookups.append(
+                    select(literal(kind).label("kind"), model.id, model.name).where(
+                        model.id.in_(missing)
+                    )
+                )
+        if lookups:
+            result = await self.db.execute(union_all(*lookups))
+            for kind, related_id, name in result:
+                related[kind][related_id] = name
+        return related
+
+    @staticmethod
+    def _named(names: dict[int, str]) -> list[dict]:
+        return [{"id": related_id, "name": name} for related_id, name in names.items()]
 
     async def get(self, movie_id: int):
         result = await self.db.execute(
@@ -56,101 +176,260 @@ class MovieRepository:
                 joinedload(MovieModel.genres),
                 joinedload(MovieModel.stars),
                 joinedload(MovieModel.directors),
-                joinedload(MovieModel.comments),
                 joinedload(MovieModel.certification),
             )
             .where(MovieModel.id == movie_id)
         )
         return result.scalars().first()
 
-    async def get_movies_with_params(
-        self,
-        page: int = 1,
-        page_size: int = 10,
-        name: str = None,
-        year: int = None,
-        rating: float = None,
-        sort_by: str = None,
-    ):
-        query = select(MovieModel).options(
-            joinedload(MovieModel.genres),
-            joinedload(MovieModel.stars),
-            joinedload(MovieModel.directors),
-            joinedload(MovieModel.comments),
-            joinedload(MovieModel.certification),
+    async def get_updated_at(self, movie_id: int):
+        result = await self.db.execute(
+            select(MovieModel.updated_at).where(MovieModel.id == movie_id)
         )
+        return result.scalar()
 
-        if name:
-            query = query.filter(MovieModel.name.ilike(f"%{name}%"))
-        if year:
-            query = query.filter(MovieModel.year == year)
-        if rating:
-            query = query.filter(MovieModel.imdb >= rating)
-
-        if sort_by:
-            if sort_by == "price":
-                query = query.order_by(MovieModel.price)
-            elif sort_by == "release_year":
-                query = query.order_by(MovieModel.year)
-            elif sort_by == "popularity":
-                query = query.order_by(MovieModel.votes.desc())
+    async def get_catalog_version(self) -> tuple:
+        """
+        Return ``(latest updated_at, movie deletions)``, which changes whenever
+        a movie is created, modified or deleted.
 
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
-
-        result = await self.db.execute(query)
-        movies = result.unique().scalars().all()
+        Both come from the database in one round trip, the maximum from
+        ``ix_movies_updated_at`` and the deletion counter that ``delete()``
+        bumps in ``catalog_versions``, so every worker agrees on the version.
+        """
+        deletions = (
+            select(CatalogVersionModel.version)
+            .where(CatalogVersionModel.name == MOVIE_DELETIONS)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(func.max(MovieModel.updated_at), deletions)
+        )
+        return tuple(result.one())
 
-        total_query = await self.db.execute(
-            select(func.count()).select_from(MovieModel)
+    async def get_trending_version(self) -> tuple:
+        """
+        Return ``(latest score update, ranked movie count)``, which changes
+        whenever the trending list is re-ranked.
+        """
+        result = await self.db.execute(
+            select(
+                func.max(MovieTrendingModel.updated_at),
+                func.count(MovieTrendingModel.rank),
+            )
         )
-        total = total_query.scalar()
+        return tuple(result.one())
 
+    async def get_movies_with_params(self, plan: MovieCatalogPlan):
+        result = await self.db.execute(plan.listing_statement())
+        movie_ids = result.scalars().all()
+        movies = await self._get_movies_by_ids(movie_ids)
+        total = await self.count_movies(plan)
         return movies, total
 
+    async def count_movies(self, plan: MovieCatalogPlan) -> int:
+        """
+        Count the movies matching the plan's filters.
+
+        Exact counts are cached per normalized filter combination, except
+        within trending: rankings are recomputed behind the cache's back and
+        the ranked list is short enough to count every time. For an
+        unfiltered catalog ``plan.approximate_count`` reads the planner's row
+        estimate from ``pg_class`` instead of scanning the table, and falls back
+        to an exact count when the table has not been analyzed yet.
+        """
+        if plan.approximate_count and not plan.filters and not plan.trending:
+            result = await self.db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table_name AS regclass)"
+                ),
+                {"table_name": MovieModel.__tablename__},
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+
+        if plan.trending:
+            result = await self.db.execute(plan.count_statement())
+            return result.scalar()
+
+        total = movie_count_cache.get(plan.count_key)
+        if total is None:
+            result = await self.db.execute(plan.count_statement())
+            total = result.scalar()
+            movie_count_cache.set(plan.count_key, total)
+        return total
+
+    async def get_facet_counts(self, plan: MovieCatalogPlan) -> dict[str, list]:
+        """
+        Count the movies matching the plan per genre, star, director and
+        certification, in a single query.
+        """
+        facets = {"genres": [], "stars": [], "directors": [], "certifications": []}
+        result = await self.db.execute(plan.facet_statement())
+        for facet, facet_id, name, count in result:
+            facets[facet].append({"id": facet_id, "name": name, "count": count})
+        return facets
+
+    async def _get_movies_by_ids(self, movie_ids: list[int]) -> list[MovieModel]:
+        """
+        Load full movie rows for an already paginated list of ids.
+
+        Collections are fetched with one ``IN`` query each instead of being
+        joined into the page query, so every movie comes back exactly once and
+        the original ordering of ``movie_ids`` is preserved.
+        """
+        if not movie_ids:
+            return []
+
+        result = await self.db.execute(
+            select(MovieModel)
+            .options(
+                selectinload(MovieModel.genres),
+                selectinload(MovieModel.stars),
+                selectinload(MovieModel.directors),
+                joinedload(MovieModel.certification),
+            )
+            .where(MovieModel.id.in_(movie_ids))
+        )
+        movies_by_id = {movie.id: movie for movie in result.scalars()}
+        return [
+            movies_by_id[movie_id] for movie_id in movie_ids if movie_id in movies_by_id
+        ]
+
     async def delete(self, movie_id: int):
-        movie = self.get(movie_id)
+        movie = await self.get(movie_id)
         if movie:
             await self.db.delete(movie)
+            await self.db.execute(
+                update(CatalogVersionModel)
+                .where(CatalogVersionModel.name == MOVIE_DELETIONS)
+                .values(version=CatalogVersionModel.version + 1)
+            )
+            await reference_cache.publish(self.db, "movie", movie_id)
             await self.db.commit()
+            movie_count_cache.clear()
+            await movie_cache.delete(movie_cache_key(movie_id))
+            suggestion_index.remove("movie", movie_id)
         return movie
 
-    async def increment_likes(self, movie_id: int):
-        await self.db.execute(
-            update(MovieModel)
-            .where(MovieModel.id == movie_id)
-            .values(likes=MovieModel.likes + 1)
-        )
-        await self.db.commit()
+    async def react(self, movie_id: int, user_id: int, kind: ReactionKindEnum) -> None:
+        """
+        Record a user's like or dislike of a movie.
 
-    async def increment_dislikes(self, movie_id: int):
-        await self.db.execute(
-            update(MovieModel)
-            .where(MovieModel.id == movie_id)
-            .values(dislikes=MovieModel.dislikes + 1)
+        The reaction is upserted with ``ON CONFLICT DO UPDATE ... WHERE`` so a
+        repeated click matches no row and writes nothing. ``xmax = 0`` tells a
+        fresh insert from a switched reaction, and the resulting counter
+        deltas go through ``reaction_buffer`` instead of the ``movies`` row.
+
+        :raises MovieNotFoundError: If the movie does not exist.
+        """
+        statement = insert(MovieReactionModel).values(
+            user_id=user_id, movie_id=movie_id, kind=kind
         )
-        await self.db.commit()
+        statement = statement.on_conflict_do_update(
+            index_elements=[MovieReactionModel.user_id, MovieReactionModel.movie_id],
+            set_={"kind": statement.excluded.kind, "updated_at": func.now()},
+            where=MovieReactionModel.kind != statement.excluded.kind,
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        try:
+            result = await self.db.execute(statement)
+            inserted = result.scalar()
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise MovieNotFoundError(f"Movie {movie_id} not found")
+
+        if inserted is None:
+            return
+        delta = 1 if kind == ReactionKindEnum.LIKE else -1
+        if inserted:
+            reaction_buffer.add(movie_id, likes=max(delta, 0), dislikes=max(-delta, 0))
+        else:
+            reaction_buffer.add(movie_id, likes=delta, dislikes=-delta)
 
-    async def rate_movie(self, movie_id: int, user_rating: float):
-        movie = await self.db.get(MovieModel, movie_id)
-        if movie is None:
-            raise ValueError("Movie not found")
+    async def rate_movie(self, movie_id: int, user_id: int, user_rating: float):
+        """
+        Store a user's rating and fold it into the movie's rating aggregates.
 
+        The user's previous rating, if any, is locked and replaced, so
+        re-rating moves ``rating_sum`` by the difference instead of counting
+        twice. ``rating_sum``/``rating_count`` are then adjusted by a single
+        relative UPDATE, so concurrent raters never overwrite each other.
+
+        :raises MovieNotFoundError: If the movie does not exist.
+        """
         if not (1 <= user_rating <= 10):
             raise ValueError("Rating must be between 1 and 10")
+        rating = Decimal(str(user_rating)).quantize(Decimal("0.01"))
 
-        if movie.rate == 0:
-            movie.rate = user_rating
-        else:
-            current_rating = movie.rate
-            rate_count = movie.rate_count if movie.rate_count else 1
-            new_average = round(
-                ((current_rating * rate_count) + user_rating) / (rate_count + 1), 2
+        try:
+            previous = await self._lock_rating(movie_id, user_id)
+            if previous is None:
+                result = await self.db.execute(
+                    insert(MovieRatingModel)
+                    .values(user_id=user_id, movie_id=movie_id, rating=rating)
+                    .on_conflict_do_nothing()
+                    .returning(MovieRatingModel.movie_id)
+                )
+                if result.scalar() is None:
+                    # A concurrent request of the same user inserted first.
+                    previous = await self._lock_rating(movie_id, user_id)
+            if previous is not None:
+                await self.db.execute(
+                    update(MovieRatingModel)
+                    .where(
+                        MovieRatingModel.user_id == user_id,
+                        MovieRatingModel.movie_id == movie_id,
+                    )
+                    .values(rating=rating)
+                )
+
+            await self.db.execute(
+                update(MovieModel)
+                .where(MovieModel.id == movie_id)
+                .values(
+                    rating_sum=MovieModel.rating_sum + rating - (previous or 0),
+                    rating_count=MovieModel.rating_count
+                    + (1 if previous is None else 0),
+                )
             )
-            movie.rate = new_average
-            movie.rate_count = rate_count + 1
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise MovieNotFoundError(f"Movie {movie_id} not found")
+        await movie_cache.delete(movie_cache_key(movie_id))
 
-        await self.db.commit()
+    async def _lock_rating(self, movie_id: int, user_id: int) -> Optional[Decimal]:
+        result = await self.db.execute(
+            select(MovieRatingModel.rating)
+            .where(
+                MovieRatingModel.user_id == user_id,
+                MovieRatingModel.movie_id == movie_id,
+            )
+            .with_for_update()
+        )
+        return result.scalar()
+
+    async def get_related(self, movie_id: int, limit: int = 10):
+        """
+        Return the movies most similar to a movie, best first, from the
+        precomputed ``movie_similarity`` index.
+        """
+        result = await self.db.execute(
+            select(
+                MovieModel.id,
+                MovieModel.name,
+                MovieModel.year,
+                MovieSimilarityModel.score,
+            )
+            .join(MovieModel, MovieModel.id == MovieSimilarityModel.other_id)
+            .where(MovieSimilarityModel.movie_id == movie_id)
+            .order_by(MovieSimilarityModel.score.desc())
+            .limit(limit)
+        )
+        return result.all()
 
     async def movie_exists_in_purchases(self, movie_id: int) -> bool:
         query = select(UserPurchasedMoviesModel).where(
@@ -0,0 +1,57 @@
+from typing import Optional
+
+from sqlalchemy import Select, func, select, tuple_
+
+# Highest Unicode code point; a prefix ending in it has no upper bound.
+_MAX_CHAR = 0x10FFFF
+
+
+def person_name_key(model):
+    """
+    Case-insensitive sort key of a star or director, matching the
+    ``ix_<table>_name_key`` expression index.
+    """
+    return func.lower(model.name).collate("C")
+
+
+def person_page_statement(
+    model,
+    movie_column,
+    prefix: Optional[str] = None,
+    after: Optional[tuple[str, int]] = None,
+    limit: int = 50,
+) -> Select:
+    """
+    Select one page of stars or directors with the number of movies of each.
+
+    Rows are ordered by ``(name key, id)``. ``prefix`` is turned into a range
+    on the name key and ``after`` (the position of the previous page's last
+    row) into a row comparison, so both are served by an index range scan.
+    ``movie_count`` is a correlated count over ``movie_column`` and is only
+    evaluated for the rows on the page.
+    """
+    name_key = person_name_key(model)
+    movie_count = (
+        select(func.count())
+        .where(movie_column == model.id)
+        .correlate(model)
+        .scalar_subquery()
+    )
+    statement = select(
+        model.id,
+        model.name,
+        name_key.label("name_key"),
+        movie_count.label("movie_count"),
+    )
+
+    if prefix:
+        prefix = prefix.lower()
+        statement = statement.where(name_key >= prefix)
+        if ord(prefix[-1]) < _MAX_CHAR:
+            statement = statement.where(
+                name_key < prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            )
+    if after:
+        statement = statement.where(tuple_(name_key, model.id) > tuple_(*after))
+
+    return statement.order_by(name_key, model.id).limit(limit)
@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import os
+
+from sqlalchemy import Integer, column, func, update, values
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from cache import movie_cache, movie_cache_key
+from database.models import MovieModel
+
+
+class ReactionCounterBuffer:
+    """
+    Aggregates like/dislike deltas per movie in memory and writes them in bulk.
+
+    Clicks only touch a dict; a background task applies every pending delta
+    with one ``UPDATE ... FROM (VALUES ...)`` each ``flush_interval`` seconds,
+    or as soon as ``flush_threshold`` events have accumulated. Reads add
+    ``pending()`` on top of the stored counters so they stay consistent.
+    """
+
+    def __init__(self, flush_interval: float = 0.2, flush_threshold: int = 500) -> None:
+        self._flush_interval = flush_interval
+        self._flush_threshold = flush_threshold
+        self._pending: dict[int, list[int]] = {}
+        self._in_flight: dict[int, list[int]] = {}
+        self._events = 0
+        self._flush_requested = asyncio.Event()
+
+    def add(self, movie_id: int, likes: int = 0, dislikes: int = 0) -> None:
+        deltas = self._pending.setdefault(movie_id, [0, 0])
+        deltas[0] += likes
+        deltas[1] += dislikes
+        self._events += 1
+        if self._events >= self._flush_threshold:
+            self._flush_requested.set()
+
+    def pending(self, movie_id: int) -> tuple[int, int]:
+        """
+        Return the ``(likes, dislikes)`` not yet committed for a movie.
+        """
+        likes = dislikes = 0
+        for deltas in (self._pending.get(movie_id), self._in_flight.get(movie_id)):
+            if deltas:
+                likes += deltas[0]
+                dislikes += deltas[1]
+        return likes, dislikes
+
+    async def flush(self, session: AsyncSession) -> int:
+        """
+        Apply all pending deltas in one statement and return the number of
+        movies touched. Deltas are kept for the next attempt if the write fails.
+        """
+        if not self._pending:
+            return 0
+        self._in_flight, self._pending = self._pending, {}
+        self._events = 0
+        self._flush_requested.clear()
+
+        deltas = values(
+            column("movie_id", Integer),
+            column("likes", Integer),
+            column("dislikes", Integer),
+            name="deltas",
+        ).data(
+            [
+                (movie_id, likes, dislikes)
+                for movie_id, (likes, dislikes) in self._in_flight.items()
+            ]
+        )
+        try:
+            await session.execute(
+                update(MovieModel)
+                .where(MovieModel.id == deltas.c.movie_id)
+                .values(
+                    likes=func.coalesce(MovieModel.likes, 0) + deltas.c.likes,
+                    dislikes=func.coalesce(MovieModel.dislikes, 0) + deltas.c.dislikes,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            for movie_id, (likes, dislikes) in self._in_flight.items():
+                self.add(movie_id, likes, dislikes)
+            raise
+        finally:
+            flushed, self._in_flight = self._in_flight, {}
+
+        await movie_cache.delete(*(movie_cache_key(movie_id) for movie_id in flushed))
+        return len(flushed)
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """
+        Flush on a timer or when the event threshold is reached, until cancelled.
+        A final flush is attempted on cancellation.
+        """
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        self._flush_requested.wait(), self._flush_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    async with session_factory() as session:
+                        await self.flush(session)
+                except Exception as error:
+                    logging.error(f"Failed to flush reaction counters: {error}")
+        finally:
+            try:
+                async with session_factory() as session:
+                    await self.flush(session)
+            except Exception as error:
+                logging.error(f"Failed to flush reaction counters: {error}")
+
+
+reaction_buffer = ReactionCounterBuffer(
+    flush_interval=float(os.getenv("REACTION_FLUSH_INTERVAL_MS", 200)) / 1000,
+    flush_threshold=int(os.getenv("REACTION_FLUSH_EVENTS", 500)),
+)
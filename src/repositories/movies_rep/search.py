@@ -0,0 +1,66 @@
+from sqlalchemy import Update, func, literal_column, select, update
+
+from database.models import DirectorModel, MovieModel, StarModel
+from database.models.movies import MovieDirectorsModel, MovieStarsModel
+
+SEARCH_CONFIG = "english"
+
+_config = literal_column(f"'{SEARCH_CONFIG}'")
+
+
+def search_query(q: str):
+    """
+    Parse free-form user input (quotes, ``or``, ``-word``) into a tsquery.
+    """
+    return func.websearch_to_tsquery(_config, q)
+
+
+def search_rank(q: str):
+    return func.ts_rank_cd(MovieModel.search_vector, search_query(q))
+
+
+def search_filter(q: str):
+    return MovieModel.search_vector.op("@@")(search_query(q))
+
+
+def search_vector_update(movie_ids: list[int]) -> Update:
+    """
+    Recompute ``movies.search_vector`` for the given movies.
+
+    The movie name weighs most, the names of its stars and directors come
+    next and the description last, so ``ts_rank_cd`` prefers title matches.
+    """
+    star_names = (
+        select(func.string_agg(StarModel.name, " "))
+        .join(MovieStarsModel, MovieStarsModel.c.star_id == StarModel.id)
+        .where(MovieStarsModel.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+    director_names = (
+        select(func.string_agg(DirectorModel.name, " "))
+        .join(
+            MovieDirectorsModel, MovieDirectorsModel.c.director_id == DirectorModel.id
+        )
+        .where(MovieDirectorsModel.c.movie_id == MovieModel.id)
+        .scalar_subquery()
+    )
+    people = func.concat_ws(" ", star_names, director_names)
+
+    return (
+        update(MovieModel)
+        .where(MovieModel.id.in_(movie_ids))
+        .values(
+            search_vector=func.setweight(
+                func.to_tsvector(_config, MovieModel.name), literal_column("'A'")
+            )
+            .op("||")(
+                func.setweight(func.to_tsvector(_config, people), literal_column("'B'"))
+            )
+            .op("||")(
+                func.setweight(
+                    func.to_tsvector(_config, MovieModel.description),
+                    literal_column("'C'"),
+                )
+            )
+        )
+    )
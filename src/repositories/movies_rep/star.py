@@ -1,7 +1,13 @@
-from sqlalchemy import select
+from typing import Optional
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cache import movie_cache, reference_cache, suggestion_index
 from database.models import StarModel
+from database.models.movies import MovieStarsModel
+from repositories.movies_rep.people import person_page_statement
+from repositories.movies_rep.search import search_vector_update
 from schemas.movie import BaseCreateSchema
 
 
@@ -12,21 +18,51 @@ class StarRepository:
     async def create(self, star: BaseCreateSchema):
         db_star = StarModel(name=star.name)
         self.db.add(db_star)
+        await self.db.flush()
+        await reference_cache.publish(self.db, "star", db_star.id, db_star.name)
         await self.db.commit()
         await self.db.refresh(db_star)
+        reference_cache.put("star", db_star.id, db_star.name)
+        suggestion_index.add("star", db_star.id, db_star.name)
         return db_star
 
     async def get(self, star_id: int):
         result = await self.db.execute(select(StarModel).where(StarModel.id == star_id))
         return result.scalars().first()
 
-    async def get_all(self):
-        result = await self.db.execute(select(StarModel))
-        return result.scalars().all()
+    async def get_page(
+        self,
+        prefix: Optional[str] = None,
+        after: Optional[tuple[str, int]] = None,
+        limit: int = 50,
+    ):
+        result = await self.db.execute(
+            person_page_statement(
+                StarModel, MovieStarsModel.c.star_id, prefix, after, limit
+            )
+        )
+        return result.all()
 
     async def delete(self, star_id: int):
-        star = self.get(star_id)
+        star = await self.get(star_id)
         if star:
+            movie_ids = list(
+                await self.db.scalars(
+                    select(MovieStarsModel.c.movie_id).where(
+                        MovieStarsModel.c.star_id == star_id
+                    )
+                )
+            )
             await self.db.delete(star)
+            await self.db.flush()
+            if movie_ids:
+                # The name is gone from these movies' search text as well.
+                await self.db.execute(
+                    search_vector_update(movie_ids).values(updated_at=func.now())
+                )
+            await reference_cache.publish(self.db, "star", star_id)
             await self.db.commit()
+            reference_cache.discard("star", star_id)
+            await movie_cache.clear()
+            suggestion_index.remove("star", star_id)
         return star
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import math
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, delete, func, literal, select, union_all, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from database import UserPurchasedMoviesModel
+from database.locks import TRENDING_LOCK_ID
+from database.models import (
+    CartItemModel,
+    JobWatermarkModel,
+    MovieRatingModel,
+    MovieReactionModel,
+    MovieTrendingModel,
+    ReactionKindEnum,
+)
+
+TRENDING_WEIGHTS = {"like": 1.0, "rating": 2.0, "cart": 3.0, "purchase": 5.0}
+# ``job_watermarks`` row holding the end of the last aggregated time range.
+TRENDING_WATERMARK = "trending"
+
+
+class TrendingAggregator:
+    """
+    Maintains ``movie_trending``: time-decayed engagement scores per movie and
+    the rank of the ``top_n`` trending ones.
+
+    Every ``interval`` seconds the likes, ratings, cart adds and purchases
+    recorded since the previous run, whose end is kept in ``job_watermarks``,
+    are summed per movie, each weighted by ``weights`` and decayed with
+    ``half_life``, and merged into the stored scores after decaying those to
+    the same point in time. All scores decay at the same rate, so their order
+    only changes through new events and rows without activity are left
+    untouched. Rows that decayed below ``min_score`` are dropped, keeping the
+    table down to recently active movies. Events younger than ``settle`` wait
+    for the next run so that transactions still in flight are not skipped.
+
+    Likes and ratings count once, when they are first given: switching a
+    dislike to a like, or back and forth, and changing a rating are not new
+    engagement.
+    """
+
+    def __init__(
+        self,
+        interval: float = 300.0,
+        half_life: timedelta = timedelta(hours=24),
+        top_n: int = 1000,
+        min_score: float = 0.01,
+        settle: timedelta = timedelta(seconds=30),
+        weights: dict[str, float] = None,
+    ) -> None:
+        self._interval = interval
+        self._half_life = half_life
+        self._decay_rate = math.log(2) / half_life.total_seconds()
+        self._top_n = top_n
+        self._min_score = min_score
+        self._settle = settle
+        self._weights = weights or TRENDING_WEIGHTS
+
+    async def refresh(self, session: AsyncSession) -> bool:
+        """
+        Fold new events into the scores and re-rank the top list.
+
+        Returns False without doing anything if another worker holds the
+        aggregation lock.
+        """
+        locked = await session.scalar(
+            select(func.pg_try_advisory_xact_lock(TRENDING_LOCK_ID))
+        )
+        if not locked:
+            await session.rollback()
+            return False
+
+        until = await session.scalar(select(func.now())) - self._settle
+        since = await session.scalar(
+            select(JobWatermarkModel.watermark).where(
+                JobWatermarkModel.name == TRENDING_WATERMARK
+            )
+        )
+        # Events older than ten half-lives add less than 0.1% of their weight.
+        horizon = until - 10 * self._half_life
+        since = horizon if since is None else max(since, horizon)
+        await self._save_watermark(session, until)
+        until = literal(until, DateTime(timezone=True))
+
+        statement = insert(MovieTrendingModel).from_select(
+            ["movie_id", "score", "updated_at"], self._event_scores(since, until)
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[MovieTrendingModel.movie_id],
+            set_={
+                "score": MovieTrendingModel.score
+                * self._decay(
+                    MovieTrendingModel.updated_at, statement.excluded.updated_at
+                )
+                + statement.excluded.score,
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+        merged = (await session.execute(statement)).rowcount
+
+        decayed = MovieTrendingModel.score * self._decay(
+            MovieTrendingModel.updated_at, until
+        )
+        pruned = (
+            await session.execute(
+                delete(MovieTrendingModel).where(decayed < self._min_score)
+            )
+        ).rowcount
+
+        if merged or pruned:
+            await self._rank(session, decayed)
+        await session.commit()
+        return True
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """
+        Refresh every ``interval`` seconds until cancelled.
+        """
+        while True:
+            try:
+                async with session_factory() as session:
+                    await self.refresh(session)
+            except Exception as error:
+                logging.error(f"Failed to refresh trending movies: {error}")
+            await asyncio.sleep(self._interval)
+
+    @staticmethod
+    async def _save_watermark(session: AsyncSession, watermark: datetime) -> None:
+        statement = insert(JobWatermarkModel).values(
+            name=TRENDING_WATERMARK, watermark=watermark
+        )
+        await session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[JobWatermarkModel.name],
+                set_={"watermark": statement.excluded.watermark},
+            )
+        )
+
+    def _decay(self, since, until):
+        return func.exp(-self._decay_rate * func.extract("epoch", until - since))
+
+    def _event_scores(self, since: datetime, until):
+        """
+        Select ``(movie_id, score, until)`` summed over the events in
+        ``(since, until]``.
+        """
+        sources = (
+            (
+                "like",
+                MovieReactionModel.movie_id,
+                MovieReactionModel.created_at,
+                MovieReactionModel.kind == ReactionKindEnum.LIKE,
+            ),
+            ("rating", MovieRatingModel.movie_id, MovieRatingModel.created_at, None),
+            ("cart", CartItemModel.movie_id, CartItemModel.added_at, None),
+            (
+                "purchase",
+                UserPurchasedMoviesModel.c.movie_id,
+                UserPurchasedMoviesModel.c.purchased_at,
+                None,
+            ),
+        )
+        queries = []
+        for kind, movie_id, happened_at, condition in sources:
+            query = select(
+                movie_id.label("movie_id"),
+                (self._weights[kind] * self._decay(happened_at, until)).label("score"),
+            ).where(happened_at > since, happened_at <= until)
+            if condition is not None:
+                query = query.where(condition)
+            queries.append(query)
+
+        events = union_all(*queries).subquery()
+        return select(events.c.movie_id, func.sum(events.c.score), until).group_by(
+            events.c.movie_id
+        )
+
+    async def _rank(self, session: AsyncSession, decayed) -> None:
+        order = (decayed.desc(), MovieTrendingModel.movie_id)
+        ranked = (
+            select(
+                MovieTrendingModel.movie_id,
+                func.row_number().over(order_by=order).label("rank"),
+            )
+            .order_by(*order)
+            .limit(self._top_n)
+            .subquery()
+        )
+        await session.execute(
+            update(MovieTrendingModel)
+            .where(MovieTrendingModel.rank.is_not(None))
+            .values(rank=None)
+        )
+        await session.execute(
+            update(MovieTrendingModel)
+            .where(MovieTrendingModel.movie_id == ranked.c.movie_id)
+            .values(rank=ranked.c.rank)
+            .execution_options(synchronize_session=False)
+        )
+
+
+trending_aggregator = TrendingAggregator(
+    interval=float(os.getenv("TRENDING_REFRESH_INTERVAL", 300)),
+    half_life=timedelta(hours=float(os.getenv("TRENDING_HALF_LIFE_HOURS", 24))),
+    top_n=int(os.getenv("TRENDING_TOP_N", 1000)),
+)
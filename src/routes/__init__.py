@@ -8,3 +8,4 @@ from routes.order import router as order_router
 from routes.payments import router as payments_router
 from routes.profiles import router as profiles_router
 from routes.shopping_cart import router as shopping_cart_router
+from routes.well_known import router as well_known_router
@@ -7,11 +7,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from cache import principal_cache
 from database import RefreshTokenModel, UserGroupEnum, UserGroupModel, UserModel, get_db
 from database.models import ActivationTokenModel
 from database.models.accounts import PasswordResetTokenModel
 from dependencies.accounts import get_email_notificator, get_jwt_auth_manager
-from exceptions import BaseSecurityError
+from exceptions import BaseSecurityError, PasswordHasherBusyError
 from notifications import EmailSenderInterface
 from schemas import (
     MessageResponseSchema,
@@ -32,6 +33,14 @@ from security.interfaces import JWTAuthManagerInterface
 router = APIRouter()
 
 
+def password_hasher_busy(error: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(error),
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post(
     "/register/",
     response_model=UserRegistrationResponseSchema,
@@ -49,6 +58,16 @@ router = APIRouter()
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Password hashing is saturated.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password hashing requests, try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred during user creation.",
             "content": {
@@ -83,7 +102,7 @@ async def register_user(
         await db.refresh(user_group)
 
     try:
-        new_user = UserModel.create(
+        new_user = await UserModel.create(
             email=str(user_data.email),
             raw_password=user_data.password,
             group_id=user_group.id,
@@ -98,6 +117,8 @@ async def register_user(
         await db.refresh(new_user)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise password_hasher_busy(e)
     except SQLAlchemyError as e:
         await db.rollback()
         raise HTTPException(
@@ -138,6 +159,16 @@ async def register_user(
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Password hashing is saturated.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password hashing requests, try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred while processing the request.",
             "content": {
@@ -159,7 +190,13 @@ async def login_user(
     result = await db.execute(stmt)
     user = result.scalars().first()
 
-    if not user or not user.verify_password(login_data.password):
+    try:
+        password_valid = user is not None and await user.verify_password(
+            login_data.password
+        )
+    except PasswordHasherBusyError as e:
+        raise password_hasher_busy(e)
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password.",
@@ -255,6 +292,7 @@ async def activate_account(
     user.is_active = True
     await db.delete(token_record)
     await db.commit()
+    principal_cache.discard_user(user.id)
 
     return MessageResponseSchema(message="User account activated successfully.")
 
@@ -390,6 +428,16 @@ async def request_password_reset_token(
                 }
             },
         },
+        429: {
+            "description": "Too Many Requests - Password hashing is saturated.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": "Too many password hashing requests, try again later."
+                    }
+                }
+            },
+        },
         500: {
             "description": "Internal Server Error - An error occurred while resetting the password.",
             "content": {
@@ -435,7 +483,11 @@ async def reset_password(
         )
 
     try:
-        user.password = data.password
+        await user.set_password(data.password)
+    except PasswordHasherBusyError as e:
+        raise password_hasher_busy(e)
+
+    try:
         await db.run_sync(lambda s: s.delete(token_record))
         await db.commit()
     except SQLAlchemyError:
@@ -12,7 +12,7 @@ async def create_certification(
     certification: BaseCreateSchema,
     certification_service: CertificationService = Depends(get_certification_service),
 ):
-    if await certification_service.is_admin():
+    if certification_service.is_admin():
         return await certification_service.create_certification(certification)
     raise HTTPException(status_code=403, detail="You haven't appropriate permission")
 
@@ -40,13 +40,13 @@ async def delete_certification(
     certification_id: int,
     certification_service: CertificationService = Depends(get_certification_service),
 ):
-    db_certification = await certification_service.delete_certification(
-        certification_id
-    )
-    if not await certification_service.is_admin():
+    if not certification_service.is_admin():
         raise HTTPException(
             status_code=403, detail="You haven't appropriate permission"
         )
+    db_certification = await certification_service.delete_certification(
+        certification_id
+    )
     if db_certification is None:
         raise HTTPException(status_code=404, detail="certification not found")
     return db_certification
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from dependencies.movies import get_director_service
-from schemas.movie import BaseCreateSchema, BaseResponseSchema
+from exceptions.movies import InvalidCursorError
+from schemas.movie import (
+    BaseCreateSchema,
+    BaseResponseSchema,
+    PaginatedDirectorsResponse,
+)
 from services.movie_service.director import DirectorService
 
 router = APIRouter()
@@ -12,7 +19,7 @@ async def create_director(
     director: BaseCreateSchema,
     director_service: DirectorService = Depends(get_director_service),
 ):
-    if await director_service.is_admin():
+    if director_service.is_admin():
         return await director_service.create_director(director)
     raise HTTPException(status_code=403, detail="You haven't appropriate permission")
 
@@ -27,22 +34,30 @@ async def read_director(
     return db_director
 
 
-@router.get("/", response_model=list[BaseResponseSchema])
+@router.get("/", response_model=PaginatedDirectorsResponse)
 async def read_directors(
+    q: Optional[str] = Query(None, description="Case-insensitive name prefix."),
+    cursor: Optional[str] = Query(
+        None, description="`next_cursor` from the previous page."
+    ),
+    page_size: int = Query(50, ge=1, le=200),
     director_service: DirectorService = Depends(get_director_service),
 ):
-    return await director_service.get_all_directors()
+    try:
+        return await director_service.get_directors(q, cursor, page_size)
+    except InvalidCursorError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
 
 
 @router.delete("/{director_id}", response_model=BaseResponseSchema)
 async def delete_director(
     director_id: int, director_service: DirectorService = Depends(get_director_service)
 ):
-    db_director = await director_service.delete_director(director_id)
-    if not await director_service.is_admin():
+    if not director_service.is_admin():
         raise HTTPException(
             status_code=403, detail="You haven't appropriate permission"
         )
+    db_director = await director_service.delete_director(director_id)
     if db_director is None:
         raise HTTPException(status_code=404, detail="director not found")
     return db_director
@@ -11,7 +11,7 @@ router = APIRouter()
 async def create_genre(
     genre: BaseCreateSchema, genre_service: GenreService = Depends(get_genre_service)
 ):
-    if await genre_service.is_admin():
+    if genre_service.is_admin():
         return await genre_service.create_genre(genre)
     raise HTTPException(status_code=403, detail="You haven't appropriate permission")
 
@@ -35,11 +35,11 @@ async def read_genres(genre_service: GenreService = Depends(get_genre_service)):
 async def delete_genre(
     genre_id: int, genre_service: GenreService = Depends(get_genre_service)
 ):
-    db_genre = await genre_service.delete_genre(genre_id)
-    if not await genre_service.is_admin():
+    if not genre_service.is_admin():
         raise HTTPException(
             status_code=403, detail="You haven't appropriate permission"
         )
+    db_genre = await genre_service.delete_genre(genre_id)
     if db_genre is None:
         raise HTTPException(status_code=404, detail="genre not found")
     return db_genre
@@ -1,14 +1,50 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from dependencies.movies import get_movie_service, get_comment_service
+from typing import Annotated, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+
+from cache import suggestion_index
+from dependencies.accounts import get_principal
+from dependencies.movies import (
+    get_comment_service,
+    get_movie_export_service,
+    get_movie_import_service,
+    get_movie_service,
+)
+from exceptions.movies import (
+    InvalidCursorError,
+    MovieNotFoundError,
+    RelatedNotFoundError,
+)
 from schemas.movie import (
-    MovieSchema,
-    MovieCreateSchema,
-    PaginatedMoviesResponse,
     CommentCreateSchema,
     CommentResponseSchema,
+    MovieCatalogParams,
+    MovieCreateSchema,
+    MovieImportReportSchema,
+    MovieSchema,
+    PaginatedCommentsResponse,
+    PaginatedMoviesResponse,
+    RelatedMovieSchema,
+    SuggestionSchema,
 )
+from services.etags import etag_matches
 from services.movie_service.comment import CommentService
-
+from services.movie_service.exporter import EXPORT_FORMATS, MovieExportService
+from services.movie_service.importer import (
+    IMPORT_FORMATS,
+    MAX_BATCH_SIZE,
+    MovieImportService,
+)
 from services.movie_service.movie import MovieService
 
 router = APIRouter()
@@ -18,44 +54,115 @@ router = APIRouter()
 async def create_movie(
     movie: MovieCreateSchema, movie_service: MovieService = Depends(get_movie_service)
 ):
-    if await movie_service.is_admin():
+    if not movie_service.is_admin():
+        raise HTTPException(
+            status_code=403, detail="You haven't appropriate permission"
+        )
+    try:
         return await movie_service.create_movie(movie)
-    raise HTTPException(status_code=403, detail="You haven't appropriate permission")
+    except RelatedNotFoundError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
+
+
+@router.post("/import", response_model=MovieImportReportSchema)
+async def import_movies(
+    file: UploadFile = File(...),
+    file_format: Optional[str] = Query(
+        None, description="`csv` or `jsonl`; guessed from the file name if omitted."
+    ),
+    batch_size: int = Query(5000, ge=1, le=MAX_BATCH_SIZE),
+    movie_service: MovieService = Depends(get_movie_service),
+    import_service: MovieImportService = Depends(get_movie_import_service),
+):
+    """
+    Bulk-import movies from a CSV or JSON Lines file.
+
+    Genres, stars, directors and certifications are referenced by name and
+    created when missing. Invalid rows are reported and do not stop the import.
+    """
+    if not movie_service.is_admin():
+        raise HTTPException(
+            status_code=403, detail="You haven't appropriate permission"
+        )
+    file_format = file_format or (file.filename or "").rsplit(".", 1)[-1].lower()
+    if file_format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=400, detail="Unsupported file format, use csv or jsonl"
+        )
+    return await import_service.import_file(file.file, file_format, batch_size)
+
+
+@router.get("/export")
+async def export_movies(
+    file_format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    movie_service: MovieService = Depends(get_movie_service),
+    export_service: MovieExportService = Depends(get_movie_export_service),
+):
+    """
+    Stream the whole catalog as NDJSON or CSV, in the bulk import format.
+    """
+    if not movie_service.is_admin():
+        raise HTTPException(
+            status_code=403, detail="You haven't appropriate permission"
+        )
+    return StreamingResponse(
+        export_service.stream(file_format),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="movies.{file_format}"'},
+    )
+
+
+@router.get(
+    "/suggest",
+    response_model=list[SuggestionSchema],
+    dependencies=[Depends(get_principal)],
+)
+async def suggest(
+    prefix: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Autocomplete movie, genre, star and director names.
+
+    Requires an authenticated user like the rest of the catalog. Served from
+    the in-process prefix index; only a token missing from ``principal_cache``
+    touches the database.
+    """
+    return suggestion_index.suggest(prefix, limit)
 
 
 @router.get("/{movie_id}", response_model=MovieSchema)
 async def read_movie(
-    movie_id: int, movie_service: MovieService = Depends(get_movie_service)
+    movie_id: int,
+    if_none_match: Optional[str] = Header(None),
+    movie_service: MovieService = Depends(get_movie_service),
 ):
-    db_movie = await movie_service.get_movie(movie_id)
-    if db_movie is None:
+    etag, payload = await movie_service.get_movie_json(movie_id, if_none_match)
+    if etag is None:
         raise HTTPException(status_code=404, detail="movie not found")
-    return db_movie
+    if payload is None:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=payload, media_type="application/json", headers={"ETag": etag}
+    )
 
 
 @router.get("/", response_model=PaginatedMoviesResponse)
 async def read_movies(
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1),
-    name: str = Query(None),
-    year: int = Query(None),
-    rating: float = Query(None),
-    sort_by: str = Query(None),
+    params: Annotated[MovieCatalogParams, Query()],
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     movie_service: MovieService = Depends(get_movie_service),
 ):
-    paginated_movies = await movie_service.get_movies_with_params(
-        page=page,
-        page_size=page_size,
-    )
-    if name or year or rating or sort_by:
-        paginated_movies = await movie_service.get_movies_with_params(
-            page=page,
-            page_size=page_size,
-            name=name,
-            year=year,
-            rating=rating,
-            sort_by=sort_by,
-        )
+    etag = await movie_service.get_catalog_etag(params)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    try:
+        paginated_movies = await movie_service.get_movies_with_params(params)
+    except InvalidCursorError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
+    response.headers["ETag"] = etag
     return PaginatedMoviesResponse(**paginated_movies)
 
 
@@ -63,8 +170,7 @@ async def read_movies(
 async def delete_movie(
     movie_id: int, movie_service: MovieService = Depends(get_movie_service)
 ):
-    db_movie = await movie_service.delete_movie(movie_id)
-    if not await movie_service.is_admin():
+    if not movie_service.is_admin():
         raise HTTPException(
             status_code=403, detail="You haven't appropriate permission"
         )
@@ -73,6 +179,7 @@ async def delete_movie(
             status_code=400,
             detail="Cannot delete movie because it has been purchased by at least one user",
         )
+    db_movie = await movie_service.delete_movie(movie_id)
     if db_movie is None:
         raise HTTPException(status_code=404, detail="movie not found")
     return db_movie
@@ -82,7 +189,10 @@ async def delete_movie(
 async def like_movie(
     movie_id: int, movie_service: MovieService = Depends(get_movie_service)
 ):
-    await movie_service.like_movie(movie_id)
+    try:
+        await movie_service.like_movie(movie_id)
+    except MovieNotFoundError:
+        raise HTTPException(status_code=404, detail="movie not found")
     return {"message": "Movie liked successfully"}
 
 
@@ -90,7 +200,10 @@ async def like_movie(
 async def dislike_movie(
     movie_id: int, movie_service: MovieService = Depends(get_movie_service)
 ):
-    await movie_service.dislike_movie(movie_id)
+    try:
+        await movie_service.dislike_movie(movie_id)
+    except MovieNotFoundError:
+        raise HTTPException(status_code=404, detail="movie not found")
     return {"message": "Movie disliked successfully"}
 
 
@@ -102,7 +215,10 @@ async def rate_movie(
 ):
     if not (1 <= user_rating <= 10):
         raise HTTPException(status_code=400, detail="Rating must be between 1 and 10")
-    await movie_service.rate_movie(movie_id, user_rating)
+    try:
+        await movie_service.rate_movie(movie_id, user_rating)
+    except MovieNotFoundError:
+        raise HTTPException(status_code=404, detail="movie not found")
     return {"message": "Movie rated successfully"}
 
 
@@ -116,3 +232,29 @@ async def create_comment(
     new_comment = await comment_service.create_comment(movie_id, comment)
 
     return new_comment
+
+
+@router.get("/{movie_id}/comments", response_model=PaginatedCommentsResponse)
+async def read_comments(
+    movie_id: int,
+    cursor: Optional[int] = Query(
+        None, description="`next_cursor` from the previous page."
+    ),
+    page_size: int = Query(20, ge=1, le=100),
+    comment_service: CommentService = Depends(get_comment_service),
+):
+    return await comment_service.get_comments(movie_id, cursor, page_size)
+
+
+@router.get("/{movie_id}/related", response_model=list[RelatedMovieSchema])
+async def read_related_movies(
+    movie_id: int,
+    limit: int = Query(10, ge=1, le=50),
+    movie_service: MovieService = Depends(get_movie_service),
+):
+    """
+    Movies sharing the most genres, stars and directors with this one, best
+    first. Served from the index rebuilt by ``python -m cli.compute_similarity``;
+    movies added since the last run have no related movies yet.
+    """
+    return await movie_service.get_related_movies(movie_id, limit)
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from dependencies.movies import get_star_service
-from schemas.movie import BaseCreateSchema, BaseResponseSchema
+from exceptions.movies import InvalidCursorError
+from schemas.movie import (
+    BaseCreateSchema,
+    BaseResponseSchema,
+    PaginatedStarsResponse,
+)
 from services.movie_service.star import StarService
 
 router = APIRouter()
@@ -11,7 +18,7 @@ router = APIRouter()
 async def create_star(
     star: BaseCreateSchema, star_service: StarService = Depends(get_star_service)
 ):
-    if await star_service.is_admin():
+    if star_service.is_admin():
         return await star_service.create_star(star)
     raise HTTPException(status_code=403, detail="You haven't appropriate permission")
 
@@ -26,20 +33,30 @@ async def read_star(
     return db_star
 
 
-@router.get("/", response_model=list[BaseResponseSchema])
-async def read_stars(star_service: StarService = Depends(get_star_service)):
-    return await star_service.get_all_stars()
+@router.get("/", response_model=PaginatedStarsResponse)
+async def read_stars(
+    q: Optional[str] = Query(None, description="Case-insensitive name prefix."),
+    cursor: Optional[str] = Query(
+        None, description="`next_cursor` from the previous page."
+    ),
+    page_size: int = Query(50, ge=1, le=200),
+    star_service: StarService = Depends(get_star_service),
+):
+    try:
+        return await star_service.get_stars(q, cursor, page_size)
+    except InvalidCursorError as exception:
+        raise HTTPException(status_code=400, detail=str(exception))
 
 
 @router.delete("/{star_id}", response_model=BaseResponseSchema)
 async def delete_star(
     star_id: int, star_service: StarService = Depends(get_star_service)
 ):
-    db_star = await star_service.delete_star(star_id)
-    if not await star_service.is_admin():
+    if not star_service.is_admin():
         raise HTTPException(
             status_code=403, detail="You haven't appropriate permission"
         )
+    db_star = await star_service.delete_star(star_id)
     if db_star is None:
         raise HTTPException(status_code=404, detail="star not found")
     return db_star
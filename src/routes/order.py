@@ -43,7 +43,7 @@ async def get_orders(
     status: Optional[OrderStatus] = Query(None),
     date_order: Optional[date] = Query(None),
 ):
-    if await order.user_crud.check_user_is_admin():
+    if order.user_crud.is_admin():
         if user_id or status or date_order:
             orders = await order.get_order_with_params(
                 user_id=user_id, status=status, date_order=date_order
@@ -51,7 +51,7 @@ async def get_orders(
         else:
             orders = await order.get_all_orders()
     else:
-        user = await order.user_crud.get_user_from_token()
+        user = order.user_crud.principal
         orders = await order.get_orders(user.id)
 
     result = []
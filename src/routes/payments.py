@@ -29,7 +29,7 @@ async def payment_success(
     payment_ = await payment.payment_repository.get_payment_by_session_id(session_id)
     await order.set_paid_status(payment_.order_id)
     await order.add_order_to_purchased(payment_.order_id)
-    user_ = await user.get_user_from_token()
+    user_ = await user.get_current_user()
     await email.send_payment_complete_email(email=user_.email, payment=payment_)
     return {"status": "success", "message": "Payment completed successfully"}
 
@@ -54,7 +54,7 @@ async def get_payments(
     status: Optional[PaymentStatus] = Query(None),
     date_payment: Optional[date] = Query(None),
 ):
-    if await user.check_user_is_admin():
+    if user.is_admin():
         if user_id or status or date_payment:
             payments = await payment.get_payments_with_params(
                 user_id=user_id, status=status, date_order=date_payment
@@ -62,7 +62,7 @@ async def get_payments(
         else:
             payments = await payment.get_all_payments()
     else:
-        user = await user.get_user_from_token()
+        user = user.principal
         payments = await payment.get_payments(user.id)
 
     result = [
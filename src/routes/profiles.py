@@ -9,15 +9,13 @@ from database import get_db
 from database.models.accounts import (
     GenderEnum,
     UserGroupEnum,
-    UserGroupModel,
     UserModel,
     UserProfileModel,
 )
-from dependencies.accounts import get_jwt_auth_manager, get_s3_storage_client
-from exceptions import BaseSecurityError, S3FileUploadError
+from dependencies.accounts import get_principal, get_s3_storage_client
+from exceptions import S3FileUploadError
 from schemas.profiles import ProfileCreateSchema, ProfileResponseSchema
-from security.http import get_token
-from security.interfaces import JWTAuthManagerInterface
+from security.principal import Principal
 from storages import S3StorageInterface
 
 router = APIRouter()
@@ -31,25 +29,13 @@ router = APIRouter()
 )
 async def create_profile(
     user_id: int,
-    token: str = Depends(get_token),
-    jwt_manager: JWTAuthManagerInterface = Depends(get_jwt_auth_manager),
+    principal: Principal = Depends(get_principal),
     db: AsyncSession = Depends(get_db),
     s3_client: S3StorageInterface = Depends(get_s3_storage_client),
     profile_data: ProfileCreateSchema = Depends(ProfileCreateSchema.from_form),
 ) -> ProfileResponseSchema:
-    try:
-        payload = jwt_manager.decode_access_token(token)
-        token_user_id = payload.get("user_id")
-    except BaseSecurityError as e:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
-
-    if user_id != token_user_id:
-        stmt = (
-            select(UserGroupModel).join(UserModel).where(UserModel.id == token_user_id)
-        )
-        result = await db.execute(stmt)
-        user_group = result.scalars().first()
-        if not user_group or user_group.name == UserGroupEnum.USER:
+    if user_id != principal.id:
+        if principal.has_group(UserGroupEnum.USER):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to edit this profile.",
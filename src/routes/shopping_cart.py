@@ -5,7 +5,6 @@ from starlette.requests import Request
 
 from database import UserGroupEnum
 from dependencies.shopping_cart import get_shopping_cart_service
-from exceptions import InvalidTokenError, TokenExpiredError
 from exceptions.cart_item import (
     CartItemAlreadyInCartError,
     CartItemException,
@@ -51,14 +50,6 @@ async def get_cart(
             create_order_url=create_order_url,
             clear_cart_url=clear_cart_url,
         )
-    except TokenExpiredError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exception)
-        )
-    except InvalidTokenError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=str(exception)
-        )
     except (CartItemException, ShoppingCartException):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -89,14 +80,6 @@ async def add_to_cart(
 ) -> CartItemDetailSchema:
     try:
         cart = await cart_service.get_user_cart()
-    except TokenExpiredError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exception)
-        )
-    except InvalidTokenError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=str(exception)
-        )
     except (CartItemException, ShoppingCartException):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -138,14 +121,6 @@ async def remove_from_cart(
 ) -> None:
     try:
         cart = await cart_service.get_user_cart()
-    except TokenExpiredError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exception)
-        )
-    except InvalidTokenError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=str(exception)
-        )
     except (CartItemException, ShoppingCartException):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -179,16 +154,7 @@ async def remove_from_cart(
 async def clear_cart(
     cart_service: Annotated[ShoppingCartService, Depends(get_shopping_cart_service)],
 ):
-    try:
-        cart = await cart_service.get_user_cart()
-    except TokenExpiredError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exception)
-        )
-    except InvalidTokenError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=str(exception)
-        )
+    cart = await cart_service.get_user_cart()
     if not cart.items:
         raise HTTPException(status_code=400, detail="Cart is already empty.")
 
@@ -212,16 +178,7 @@ async def get_cart_admin(
     cart_id: int,
     cart_service: Annotated[ShoppingCartService, Depends(get_shopping_cart_service)],
 ) -> CartDetailSchema:
-    try:
-        user = await cart_service.user_repository.get_user_from_token()
-    except TokenExpiredError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exception)
-        )
-    except InvalidTokenError as exception:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN, detail=str(exception)
-        )
+    user = cart_service.user_repository.principal
     if not user.has_group(UserGroupEnum.ADMIN) and not user.has_group(
         UserGroupEnum.MODERATOR
     ):
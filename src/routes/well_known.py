@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Response
+
+from schemas.accounts import JWKSResponseSchema
+from security.key_ring import jwt_key_ring
+
+router = APIRouter()
+
+
+@router.get(
+    "/jwks.json",
+    response_model=JWKSResponseSchema,
+    summary="JSON Web Key Set",
+    description=(
+        "Public keys that verify access tokens, identified by the `kid` in the "
+        "token header. Empty unless tokens are signed with RS256."
+    ),
+)
+async def get_jwks(response: Response) -> dict:
+    # New keys are published a day before use, so a short cache is safe.
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return jwt_key_ring.jwks()
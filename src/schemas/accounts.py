@@ -53,3 +53,7 @@ class PasswordResetRequestSchema(BaseModel):
 
 class PasswordResetCompleteRequestSchema(BaseEmailPasswordSchema):
     token: str
+
+
+class JWKSResponseSchema(BaseModel):
+    keys: list[dict[str, str]]
@@ -2,7 +2,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class BaseResponseSchema(BaseModel):
@@ -16,6 +16,20 @@ class BaseCreateSchema(BaseModel):
     name: str
 
 
+class PersonSchema(BaseResponseSchema):
+    movie_count: int
+
+
+class PaginatedStarsResponse(BaseModel):
+    stars: list[PersonSchema]
+    next_cursor: Optional[str] = None
+
+
+class PaginatedDirectorsResponse(BaseModel):
+    directors: list[PersonSchema]
+    next_cursor: Optional[str] = None
+
+
 class CommentResponseSchema(BaseModel):
     id: int
     user_id: int
@@ -28,6 +42,11 @@ class CommentCreateSchema(BaseModel):
     text: str
 
 
+class PaginatedCommentsResponse(BaseModel):
+    comments: list[CommentResponseSchema]
+    next_cursor: Optional[int] = None
+
+
 class MovieSchema(BaseModel):
     id: int
     name: str
@@ -48,7 +67,7 @@ class MovieSchema(BaseModel):
     dislikes: Optional[int] = None
     rate: Optional[float] = None
     rate_count: Optional[int] = None
-    comments: Optional[list[CommentResponseSchema]] = None
+    comment_count: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -68,9 +87,165 @@ class MovieCreateSchema(BaseCreateSchema):
     certification_id: int
 
 
+def join_name_list(names: list[str]) -> str:
+    """
+    Join names into one CSV field, separated by ``|``. A ``|`` or ``\\``
+    inside a name is escaped with a backslash.
+    """
+    return "|".join(name.replace("\\", "\\\\").replace("|", "\\|") for name in names)
+
+
+def split_name_list(value: str) -> list[str]:
+    """
+    Split a field written by ``join_name_list`` back into names. Any other
+    backslash is kept as it is.
+    """
+    names, name = [], []
+    index = 0
+    while index < len(value):
+        char = value[index]
+        if char == "\\" and value[index + 1 : index + 2] in ("\\", "|"):
+            index += 1
+            char = value[index]
+        elif char == "|":
+            names.append("".join(name))
+            name = []
+            index += 1
+            continue
+        name.append(char)
+        index += 1
+    names.append("".join(name))
+    return names
+
+
+class MovieImportRowSchema(BaseModel):
+    """
+    One movie of a bulk import. Genres, stars and directors are given by name;
+    in CSV files they are separated by ``|``, see ``join_name_list``.
+    """
+
+    name: str = Field(..., min_length=1, max_length=255)
+    year: int
+    time: int
+    imdb: float
+    votes: int
+    meta_score: Optional[float] = None
+    gross: Optional[float] = None
+    description: str
+    price: Decimal = Field(..., max_digits=10, decimal_places=2)
+    certification: str = Field(..., min_length=1, max_length=255)
+    genres: list[str] = []
+    stars: list[str] = []
+    directors: list[str] = []
+
+    @field_validator("meta_score", "gross", mode="before")
+    @classmethod
+    def empty_to_none(cls, value):
+        return None if value == "" else value
+
+    @field_validator("genres", "stars", "directors", mode="before")
+    @classmethod
+    def split_names(cls, value):
+        if value is None:
+            return []
+        if isinstance(value, str):
+            value = split_name_list(value)
+        if not isinstance(value, list):
+            raise ValueError("Expected a list of names")
+        names = [str(name).strip() for name in value]
+        if any(len(name) > 255 for name in names):
+            raise ValueError("Names must be at most 255 characters long")
+        return list(dict.fromkeys(name for name in names if name))
+
+
+class MovieImportErrorSchema(BaseModel):
+    line: int
+    error: str
+
+
+class MovieImportReportSchema(BaseModel):
+    imported: int
+    skipped: int
+    failed: int
+    errors: list[MovieImportErrorSchema]
+
+
+class RelatedMovieSchema(BaseModel):
+    id: int
+    name: str
+    year: int
+    score: float
+
+    model_config = {"from_attributes": True}
+
+
+class SuggestionSchema(BaseModel):
+    kind: str
+    id: int
+    name: str
+
+
+class MovieCatalogParams(BaseModel):
+    page: int = Field(1, ge=1)
+    page_size: int = Field(10, ge=1)
+    cursor: Optional[str] = Field(
+        None,
+        description="Opaque `next_cursor` from a previous page. "
+        "When set, keyset pagination is used and `page` is ignored.",
+    )
+    q: Optional[str] = Field(
+        None,
+        description="Full-text search over titles, descriptions, stars and "
+        "directors. Results are ranked by relevance unless `sort_by` is set.",
+    )
+    name: Optional[str] = None
+    year: Optional[int] = None
+    rating: Optional[float] = None
+    genre_ids: list[int] = Field(
+        [], description="Match movies having any of these genres."
+    )
+    star_ids: list[int] = Field([], description="Match movies with any of these stars.")
+    director_ids: list[int] = Field(
+        [], description="Match movies by any of these directors."
+    )
+    certification_ids: list[int] = Field(
+        [], description="Match movies with any of these certifications."
+    )
+    include_facets: bool = Field(
+        False,
+        description="Return per-genre, star, director and certification counts "
+        "for the movies matching the current filters.",
+    )
+    sort_by: Optional[str] = Field(
+        None,
+        description="`price`, `release_year`, `popularity` or `trending`. "
+        "`trending` lists only the current top trending movies.",
+    )
+    approximate_count: bool = Field(
+        False,
+        description="Estimate `total_items` from planner statistics "
+        "instead of counting rows. Only applies to unfiltered listings.",
+    )
+
+
+class FacetValueSchema(BaseModel):
+    id: int
+    name: str
+    count: int
+
+
+class MovieFacetsSchema(BaseModel):
+    genres: list[FacetValueSchema] = []
+    stars: list[FacetValueSchema] = []
+    directors: list[FacetValueSchema] = []
+    certifications: list[FacetValueSchema] = []
+
+
 class PaginatedMoviesResponse(BaseModel):
     movies: list[MovieSchema]
     prev_page: Optional[str]
     next_page: Optional[str]
+    next_cursor: Optional[str] = None
     total_pages: int
     total_items: int
+    facets: Optional[MovieFacetsSchema] = None
@@ -5,6 +5,7 @@ from jose import ExpiredSignatureError, JWTError, jwt
 
 from exceptions import InvalidTokenError, TokenExpiredError
 from security.interfaces import JWTAuthManagerInterface
+from security.key_ring import JWT_KEY_ALGORITHM, JWTKeyRing
 
 
 class JWTAuthManager(JWTAuthManagerInterface):
@@ -15,16 +16,33 @@ class JWTAuthManager(JWTAuthManagerInterface):
     _ACCESS_KEY_TIMEDELTA_MINUTES = 60
     _REFRESH_KEY_TIMEDELTA_MINUTES = 60 * 24 * 7
 
-    def __init__(self, secret_key_access: str, secret_key_refresh: str, algorithm: str):
+    def __init__(
+        self,
+        secret_key_access: Optional[str],
+        secret_key_refresh: str,
+        algorithm: str,
+        key_ring: Optional[JWTKeyRing] = None,
+    ):
         """
         Initialize the manager with secret keys and algorithm for token operations.
+
+        With a ``key_ring``, access tokens are signed with its current RSA key
+        and carry the key's ``kid``, so anyone holding the published JWKS can
+        verify them; ``secret_key_access`` is then unused. Refresh tokens are
+        only ever read by this app and stay signed with the shared secret.
         """
         self._secret_key_access = secret_key_access
         self._secret_key_refresh = secret_key_refresh
         self._algorithm = algorithm
+        self._key_ring = key_ring
 
     def _create_token(
-        self, data: dict, secret_key: str, expires_delta: timedelta
+        self,
+        data: dict,
+        secret_key,
+        expires_delta: timedelta,
+        algorithm: Optional[str] = None,
+        headers: Optional[dict] = None,
     ) -> str:
         """
         Create a JWT token with provided data, secret key, and expiration time.
@@ -32,7 +50,12 @@ class JWTAuthManager(JWTAuthManagerInterface):
         to_encode = data.copy()
         expire = datetime.now(timezone.utc) + expires_delta
         to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, secret_key, algorithm=self._algorithm)
+        return jwt.encode(
+            to_encode,
+            secret_key,
+            algorithm=algorithm or self._algorithm,
+            headers=headers,
+        )
 
     def create_access_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
@@ -40,11 +63,19 @@ class JWTAuthManager(JWTAuthManagerInterface):
         """
         Create a new access token with a default or specified expiration time.
         """
-        return self._create_token(
-            data,
-            self._secret_key_access,
-            expires_delta or timedelta(minutes=self._ACCESS_KEY_TIMEDELTA_MINUTES),
+        expires_delta = expires_delta or timedelta(
+            minutes=self._ACCESS_KEY_TIMEDELTA_MINUTES
         )
+        if self._key_ring is not None:
+            kid, key = self._key_ring.signing_key()
+            return self._create_token(
+                data,
+                key,
+                expires_delta,
+                algorithm=JWT_KEY_ALGORITHM,
+                headers={"kid": kid},
+            )
+        return self._create_token(data, self._secret_key_access, expires_delta)
 
     def create_refresh_token(
         self, data: dict, expires_delta: Optional[timedelta] = None
@@ -63,6 +94,13 @@ class JWTAuthManager(JWTAuthManagerInterface):
         Decode and validate an access token, returning the token's data.
         """
         try:
+            if self._key_ring is not None:
+                key = self._key_ring.public_key(
+                    jwt.get_unverified_header(token).get("kid")
+                )
+                if key is None:
+                    raise InvalidTokenError
+                return jwt.decode(token, key, algorithms=[JWT_KEY_ALGORITHM])
             return jwt.decode(
                 token, self._secret_key_access, algorithms=[self._algorithm]
             )
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+import os
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk
+from jose.backends.base import Key
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from database.locks import KEY_ROTATION_LOCK_ID
+from database.models.accounts import JWTSigningKeyModel
+
+JWT_KEY_ALGORITHM = "RS256"
+JWT_KEY_RING_ENABLED = os.getenv("JWT_SIGNING_ALGORITHM", "HS256") == JWT_KEY_ALGORITHM
+
+
+class JWTKeyRing:
+    """
+    RSA keys that sign access tokens, shared by all workers through
+    ``jwt_signing_keys`` and rotated on a schedule.
+
+    Each key is created ``publish_lead`` before it takes over signing, one
+    ``rotation_interval`` after its predecessor did, so it is in the JWKS
+    document, and in the caches of whoever verifies our tokens, before the
+    first token carries its ``kid``. A replaced key stays published for
+    ``retention`` after its successor activated, long enough for the tokens
+    it signed to expire, and is then deleted. Every worker re-reads the table
+    each ``refresh_interval`` seconds, which must stay well below
+    ``publish_lead``.
+    """
+
+    def __init__(
+        self,
+        rotation_interval: timedelta = timedelta(days=30),
+        publish_lead: timedelta = timedelta(days=1),
+        retention: timedelta = timedelta(hours=2),
+        refresh_interval: float = 60.0,
+        key_size: int = 2048,
+    ) -> None:
+        self._rotation_interval = rotation_interval
+        self._publish_lead = publish_lead
+        self._retention = retention
+        self._refresh_interval = refresh_interval
+        self._key_size = key_size
+        # (kid, activates_at, private key), oldest activation first.
+        self._keys: list[tuple[str, datetime, Key]] = []
+        self._public_keys: dict[str, Key] = {}
+        self._jwks: dict = {"keys": []}
+
+    def signing_key(self) -> tuple[str, Key]:
+        """
+        Return the ``kid`` and private key of the newest active key.
+        """
+        now = datetime.now(timezone.utc)
+        for kid, activates_at, key in reversed(self._keys):
+            if activates_at <= now:
+                return kid, key
+        raise RuntimeError("No active JWT signing key has been loaded.")
+
+    def public_key(self, kid: str) -> Optional[Key]:
+        return self._public_keys.get(kid)
+
+    def jwks(self) -> dict:
+        """
+        Return the JSON Web Key Set with every published public key.
+        """
+        return self._jwks
+
+    async def refresh(self, session: AsyncSession) -> None:
+        await self.rotate(session)
+        await self.load(session)
+
+    async def load(self, session: AsyncSession) -> None:
+        """
+        Replace the in-memory keys with those stored in the database.
+        """
+        rows = (
+            await session.execute(
+                select(
+                    JWTSigningKeyModel.kid,
+                    JWTSigningKeyModel.activates_at,
+                    JWTSigningKeyModel.private_key,
+                ).order_by(JWTSigningKeyModel.activates_at)
+            )
+        ).all()
+        known = {kid: key for kid, _, key in self._keys}
+        keys = [
+            (
+                kid,
+                activates_at,
+                known.get(kid) or jwk.construct(private_key, JWT_KEY_ALGORITHM),
+            )
+            for kid, activates_at, private_key in rows
+        ]
+        public_keys = {kid: key.public_key() for kid, _, key in keys}
+        self._keys, self._public_keys = keys, public_keys
+        self._jwks = {
+            "keys": [
+                {**key.to_dict(), "kid": kid, "use": "sig"}
+                for kid, key in public_keys.items()
+            ]
+        }
+
+    async def rotate(self, session: AsyncSession) -> None:
+        """
+        Create the next key when it is due for publishing and delete keys
+        that are past their retention.
+        """
+        await session.execute(select(func.pg_advisory_xact_lock(KEY_ROTATION_LOCK_ID)))
+        now = await session.scalar(select(func.now()))
+        newest = await session.scalar(select(func.max(JWTSigningKeyModel.activates_at)))
+
+        if newest is None:
+            activates_at = now
+        elif newest + self._rotation_interval - self._publish_lead <= now:
+            activates_at = max(
+                newest + self._rotation_interval, now + self._publish_lead
+            )
+        else:
+            activates_at = None
+        if activates_at is not None:
+            private_key = await asyncio.to_thread(self._generate_private_key)
+            session.add(
+                JWTSigningKeyModel(
+                    kid=secrets.token_urlsafe(12),
+                    private_key=private_key,
+                    activates_at=activates_at,
+                )
+            )
+            logging.info(f"Created a JWT signing key activating at {activates_at}")
+
+        # Keys older than the newest one activated before the retention
+        # window have been replaced for at least that long.
+        retained_from = await session.scalar(
+            select(func.max(JWTSigningKeyModel.activates_at)).where(
+                JWTSigningKeyModel.activates_at <= now - self._retention
+            )
+        )
+        if retained_from is not None:
+            await session.execute(
+                delete(JWTSigningKeyModel).where(
+                    JWTSigningKeyModel.activates_at < retained_from
+                )
+            )
+        await session.commit()
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """
+        Rotate and reload every ``refresh_interval`` seconds until cancelled.
+        """
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                async with session_factory() as session:
+                    await self.refresh(session)
+            except Exception as error:
+                logging.error(f"Failed to refresh JWT signing keys: {error}")
+
+    def _generate_private_key(self) -> str:
+        private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=self._key_size
+        )
+        return private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode()
+
+
+jwt_key_ring = JWTKeyRing(
+    rotation_interval=timedelta(days=float(os.getenv("JWT_KEY_ROTATION_DAYS", 30))),
+    publish_lead=timedelta(hours=float(os.getenv("JWT_KEY_PUBLISH_LEAD_HOURS", 24))),
+    retention=timedelta(hours=float(os.getenv("JWT_KEY_RETENTION_HOURS", 2))),
+    refresh_interval=float(os.getenv("JWT_KEY_REFRESH_INTERVAL", 60)),
+)
@@ -0,0 +1,53 @@
+import asyncio
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.locks import PASSWORD_POLICY_LOCK_ID
+from database.models.accounts import PasswordHashPolicyModel
+from security.passwords import (
+    calibrate_rounds,
+    configure_password_policy,
+    password_policy_from_env,
+)
+
+
+async def load_password_policy(session: AsyncSession) -> dict:
+    """
+    Apply the password policy that all workers share through
+    ``password_hash_policies`` and return it.
+
+    A cost pinned in the environment is stored for the scheme. Otherwise the
+    first worker to start with a scheme calibrates it on its host and stores
+    the result, and every later worker reuses it, so that they all agree on
+    the cost and never rehash a login back and forth. Delete the row, or pin
+    the cost, to recalibrate after moving to different hardware.
+
+    Returns:
+        dict: The applied ``scheme``, ``rounds`` and, for argon2,
+        ``memory_cost``.
+    """
+    policy = password_policy_from_env()
+    scheme, memory_cost = policy["scheme"], policy["memory_cost"]
+    await session.execute(select(func.pg_advisory_xact_lock(PASSWORD_POLICY_LOCK_ID)))
+    stored = await session.get(PasswordHashPolicyModel, scheme)
+
+    if policy["rounds"] is None:
+        if stored is not None and stored.memory_cost == memory_cost:
+            policy["rounds"] = stored.rounds
+        else:
+            policy["rounds"] = await asyncio.to_thread(
+                calibrate_rounds, scheme, memory_cost
+            )
+    if stored is None:
+        session.add(
+            PasswordHashPolicyModel(
+                scheme=scheme, rounds=policy["rounds"], memory_cost=memory_cost
+            )
+        )
+    elif (stored.rounds, stored.memory_cost) != (policy["rounds"], memory_cost):
+        stored.rounds, stored.memory_cost = policy["rounds"], memory_cost
+    await session.commit()
+
+    configure_password_policy(scheme, policy["rounds"], memory_cost)
+    return policy
@@ -1,14 +1,130 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=14, deprecated="auto")
+from exceptions import PasswordHasherBusyError
+
+PASSWORD_HASH_SCHEMES = ("bcrypt", "argon2")
+# Cost bounds calibration never leaves, whatever the host measures.
+_COST_BOUNDS = {"bcrypt": (10, 16), "argon2": (1, 10)}
+
+pwd_context = CryptContext(
+    schemes=list(PASSWORD_HASH_SCHEMES), bcrypt__rounds=14, deprecated="auto"
+)
+
+
+def configure_password_policy(
+    scheme: str, rounds: int, memory_cost: int | None = None
+) -> None:
+    """
+    Make ``scheme`` with the given cost the policy for new hashes.
+
+    Hashes of the other scheme, or of the same scheme with a different cost,
+    still verify but are reported by ``needs_update`` so that they get
+    replaced on the next successful login.
+
+    Args:
+        scheme (str): ``bcrypt`` or ``argon2`` (argon2id).
+        rounds (int): The bcrypt log2 rounds or the argon2 time cost.
+        memory_cost (int | None): The argon2 memory cost in KiB.
+    """
+    if scheme not in PASSWORD_HASH_SCHEMES:
+        raise ValueError(f"Unknown password hash scheme: {scheme}")
+    settings = {
+        f"{scheme}__rounds": rounds,
+        f"{scheme}__min_rounds": rounds,
+        f"{scheme}__max_rounds": rounds,
+    }
+    if scheme == "argon2":
+        settings.update(argon2__type="ID", argon2__memory_cost=memory_cost)
+    pwd_context.update(
+        schemes=[
+            scheme,
+            *(other for other in PASSWORD_HASH_SCHEMES if other != scheme),
+        ],
+        deprecated="auto",
+        **settings,
+    )
+
+
+def password_policy_from_env() -> dict:
+    """
+    Read the password policy from the environment.
+
+    ``PASSWORD_HASH_SCHEME`` selects bcrypt or argon2id, and the cost may be
+    pinned with ``PASSWORD_BCRYPT_ROUNDS`` or ``PASSWORD_ARGON2_TIME_COST``.
+
+    Returns:
+        dict: The ``scheme``, the pinned ``rounds`` or None and, for argon2,
+        ``memory_cost``.
+    """
+    scheme = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+    memory_cost = None
+    if scheme == "argon2":
+        memory_cost = int(os.getenv("PASSWORD_ARGON2_MEMORY_KB", 65536))
+        pinned = os.getenv("PASSWORD_ARGON2_TIME_COST")
+    else:
+        pinned = os.getenv("PASSWORD_BCRYPT_ROUNDS")
+    return {
+        "scheme": scheme,
+        "rounds": int(pinned) if pinned else None,
+        "memory_cost": memory_cost,
+    }
+
+
+def calibrate_rounds(scheme: str, memory_cost: int | None = None) -> int:
+    """
+    Measure the cost at which one hash takes about ``PASSWORD_HASH_TARGET_MS``
+    on this host, so that login latency is a deliberate budget rather than a
+    property of whatever machine runs the app.
+    """
+    target = float(os.getenv("PASSWORD_HASH_TARGET_MS", 250)) / 1000
+    return _calibrated_rounds(scheme, target, memory_cost)
+
+
+def _calibrated_rounds(scheme: str, target: float, memory_cost: int | None) -> int:
+    """
+    Estimate the cost at which one hash takes ``target`` seconds.
+
+    bcrypt doubles its work with each round and argon2 grows linearly with
+    its time cost, so one cheap probe is enough to extrapolate from.
+    """
+    low, high = _COST_BOUNDS.get(scheme, (None, None))
+    if low is None:
+        raise ValueError(f"Unknown password hash scheme: {scheme}")
+    if scheme == "bcrypt":
+        probe = low
+        elapsed = _time_hash(pwd_context.handler("bcrypt").using(rounds=probe))
+        rounds = probe + round(math.log2(target / elapsed))
+    else:
+        probe = 2
+        handler = pwd_context.handler("argon2").using(
+            type="ID", rounds=probe, memory_cost=memory_cost
+        )
+        rounds = round(probe * target / _time_hash(handler))
+    return min(max(rounds, low), high)
+
+
+def _time_hash(handler, samples: int = 3) -> float:
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        handler.hash("calibration")
+        timings.append(time.perf_counter() - started)
+    return min(timings)
 
 
 def hash_password(password: str) -> str:
     """
     Hash a plain-text password using the configured password context.
 
-    This function takes a plain-text password and returns its bcrypt hash.
-    The bcrypt algorithm is used with a specified number of rounds for enhanced security.
+    This function takes a plain-text password and returns its hash under the
+    current password policy: bcrypt or argon2id with the configured cost.
 
     Args:
         password (str): The plain-text password to hash.
@@ -34,3 +150,68 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if the password is correct, False otherwise.
     """
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Runs password hashing and verification on a bounded thread pool.
+
+    bcrypt releases the GIL while it works, so ``max_workers`` threads hash in
+    parallel while the event loop keeps serving other requests. At most
+    ``max_pending`` operations may be running or queued at once; beyond that
+    ``PasswordHasherBusyError`` is raised straight away instead of letting the
+    queue, and the latency of every caller in it, grow without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash a plain-text password without blocking the event loop.
+
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated.
+        """
+        return await self._submit(hash_password, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        Verify a password and, if it matches a hash made under an outdated
+        policy, rehash it in the same pool job.
+
+        Returns:
+            tuple[bool, str | None]: Whether the password is correct and the
+            replacement hash, or None if the stored one is current.
+
+        Raises:
+            PasswordHasherBusyError: If the pool is saturated.
+        """
+        return await self._submit(
+            pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+    async def _submit(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusyError()
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the work itself finishes, even if the
+        # awaiting request is cancelled first.
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+_hash_workers = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+password_hasher = PasswordHasher(
+    max_workers=_hash_workers,
+    max_pending=int(os.getenv("PASSWORD_HASH_MAX_PENDING", 4 * _hash_workers)),
+)
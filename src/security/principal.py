@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+from database.models.accounts import UserGroupEnum, UserModel
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    The authenticated user as far as authorization needs to know it.
+
+    Cheap to cache and share, unlike a ``UserModel`` bound to a session.
+    """
+
+    id: int
+    group: UserGroupEnum
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: UserModel) -> "Principal":
+        return cls(id=user.id, group=user.group.name, is_active=user.is_active)
+
+    def has_group(self, group_name: UserGroupEnum) -> bool:
+        return self.group == group_name
@@ -0,0 +1,27 @@
+import hashlib
+from typing import Optional
+
+
+def make_weak_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values a representation is derived from.
+    """
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an ``If-None-Match`` header against an ETag using weak comparison.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
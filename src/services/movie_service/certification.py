@@ -1,4 +1,3 @@
-from database import UserGroupEnum
 from repositories.accounts_rep import UserRepository
 from repositories.movies_rep.certification import CertificationRepository
 from schemas.movie import BaseCreateSchema
@@ -23,6 +22,5 @@ class CertificationService:
     async def delete_certification(self, certification_id: int):
         return await self.certification_rep.delete(certification_id)
 
-    async def is_admin(self):
-        user = await self.user_rep.get_user_from_token()
-        return user.has_group(UserGroupEnum.ADMIN)
+    def is_admin(self) -> bool:
+        return self.user_rep.is_admin()
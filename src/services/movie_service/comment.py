@@ -14,8 +14,19 @@ class CommentService:
         self.db = db
 
     async def create_comment(self, movie_id: int, comment: CommentCreateSchema):
-        user = await self.user_rep.get_user_from_token()
+        user = self.user_rep.principal
 
         return await self.comment_rep.create(
             movie_id=movie_id, comment=comment, user_id=user.id
         )
+
+    async def get_comments(
+        self, movie_id: int, cursor: int = None, page_size: int = 20
+    ) -> dict:
+        comments = await self.comment_rep.get_for_movie(
+            movie_id=movie_id, before_id=cursor, limit=page_size
+        )
+        return {
+            "comments": comments,
+            "next_cursor": comments[-1].id if len(comments) == page_size else None,
+        }
@@ -1,7 +1,7 @@
-from database import UserGroupEnum
 from repositories.accounts_rep import UserRepository
 from repositories.movies_rep.director import DirectorRepository
 from schemas.movie import BaseCreateSchema
+from services.movie_service.people import decode_person_cursor, encode_person_cursor
 
 
 class DirectorService:
@@ -17,12 +17,24 @@ class DirectorService:
     async def get_director(self, director_id: int):
         return await self.director_rep.get(director_id)
 
-    async def get_all_directors(self):
-        return await self.director_rep.get_all()
+    async def get_directors(
+        self, q: str = None, cursor: str = None, page_size: int = 50
+    ) -> dict:
+        after = decode_person_cursor(cursor) if cursor else None
+        directors = await self.director_rep.get_page(
+            prefix=q, after=after, limit=page_size
+        )
+        return {
+            "directors": directors,
+            "next_cursor": (
+                encode_person_cursor(directors[-1])
+                if len(directors) == page_size
+                else None
+            ),
+        }
 
     async def delete_director(self, director_id: int):
         return await self.director_rep.delete(director_id)
 
-    async def is_admin(self):
-        user = await self.user_rep.get_user_from_token()
-        return user.has_group(UserGroupEnum.ADMIN)
+    def is_admin(self) -> bool:
+        return self.user_rep.is_admin()
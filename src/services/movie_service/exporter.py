@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from repositories.movies_rep.exporter import EXPORT_COLUMNS, catalog_export_statement
+from schemas.movie import join_name_list
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class MovieExportService:
+    """
+    Streams the whole catalog as NDJSON or CSV.
+
+    The export runs in its own session because the request-scoped one is
+    closed before a streaming response starts sending. Rows are fetched
+    through a server-side cursor ``yield_per`` at a time and every fetched
+    partition is sent as one chunk, so memory stays flat for any catalog size.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, yield_per: int = 1000):
+        self.session_factory = session_factory
+        self.yield_per = yield_per
+
+    async def stream(self, file_format: str) -> AsyncIterator[bytes]:
+        if file_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            async for rows in self._partitions():
+                for row in rows:
+                    writer.writerow(
+                        [
+                            join_name_list(value) if isinstance(value, list) else value
+                            for value in self._values(row)
+                        ]
+                    )
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue().encode()
+            return
+
+        async for rows in self._partitions():
+            yield "".join(
+                json.dumps(dict(zip(EXPORT_COLUMNS, self._values(row))), default=str)
+                + "\n"
+                for row in rows
+            ).encode()
+
+    async def _partitions(self) -> AsyncIterator[list]:
+        async with self.session_factory() as session:
+            result = await session.stream(
+                catalog_export_statement().execution_options(yield_per=self.yield_per)
+            )
+            async for rows in result.partitions():
+                yield rows
+
+    @staticmethod
+    def _values(row) -> list:
+        *values, genres, stars, directors = row
+        return [*values, genres or [], stars or [], directors or []]
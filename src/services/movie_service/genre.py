@@ -1,4 +1,3 @@
-from database import UserGroupEnum
 from repositories.accounts_rep import UserRepository
 from repositories.movies_rep.genre import GenreRepository
 from schemas.movie import BaseCreateSchema
@@ -21,6 +20,5 @@ class GenreService:
     async def delete_genre(self, genre_id: int):
         return await self.genre_rep.delete(genre_id)
 
-    async def is_admin(self):
-        user = await self.user_rep.get_user_from_token()
-        return user.has_group(UserGroupEnum.ADMIN)
+    def is_admin(self) -> bool:
+        return self.user_rep.is_admin()
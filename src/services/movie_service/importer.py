@@ -0,0 +1,153 @@
+import asyncio
+import csv
+import io
+import json
+import logging
+from typing import BinaryIO, Iterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import movie_count_cache, reference_cache
+from repositories.movies_rep.importer import MovieImportRepository
+from schemas.movie import MovieImportRowSchema
+
+IMPORT_FORMATS = ("csv", "jsonl")
+MAX_REPORTED_ERRORS = 1000
+MAX_BATCH_SIZE = 10000
+
+
+def read_import_rows(file: BinaryIO, file_format: str) -> Iterator[tuple[int, dict]]:
+    """
+    Stream ``(line number, raw row)`` pairs from a CSV or JSON Lines file.
+
+    Rows that cannot be decoded are yielded as an ``Exception`` instead of a
+    dict so that the caller can report them and carry on.
+    """
+    stream = io.TextIOWrapper(file, encoding="utf-8", errors="replace", newline="")
+    if file_format == "csv":
+        reader = csv.DictReader(stream, restkey="extra")
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            yield line_number, error
+            continue
+        if not isinstance(row, dict):
+            yield line_number, ValueError("Expected a JSON object")
+            continue
+        yield line_number, row
+
+
+def parse_import_batches(
+    file: BinaryIO, file_format: str, batch_size: int
+) -> Iterator[tuple[list[tuple[int, MovieImportRowSchema]], list[tuple[int, str]]]]:
+    """
+    Parse and validate an import file, yielding ``(valid rows, errors)`` once
+    ``batch_size`` rows of either kind have accumulated, and for the rest at
+    the end. Rows and errors carry their line number.
+
+    This is CPU-bound and blocking; run each step in a worker thread.
+    """
+    batch, errors = [], []
+    for line_number, row in read_import_rows(file, file_format):
+        if isinstance(row, Exception):
+            errors.append((line_number, str(row)))
+        else:
+            try:
+                batch.append((line_number, MovieImportRowSchema.model_validate(row)))
+            except ValidationError as error:
+                errors.append((line_number, _describe(error)))
+        if len(batch) >= batch_size or len(errors) >= batch_size:
+            yield batch, errors
+            batch, errors = [], []
+    if batch or errors:
+        yield batch, errors
+
+
+def _describe(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc']))}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class MovieImportService:
+    def __init__(self, import_rep: MovieImportRepository, db: AsyncSession) -> None:
+        self.import_rep = import_rep
+        self.db = db
+
+    async def import_file(
+        self, file: BinaryIO, file_format: str, batch_size: int = 5000
+    ) -> dict:
+        """
+        Import every movie of a CSV or JSON Lines file in batches.
+
+        Only one batch is held in memory at a time. Invalid rows and rows that
+        the database rejects are reported with their line number; movies that
+        already exist are counted as skipped.
+        """
+        report = {"imported": 0, "skipped": 0, "failed": 0, "errors": []}
+        batches = parse_import_batches(file, file_format, batch_size)
+
+        while True:
+            parsed = await asyncio.to_thread(next, batches, None)
+            if parsed is None:
+                break
+            batch, errors = parsed
+            for line_number, error in errors:
+                self._add_error(report, line_number, error)
+            if batch:
+                await self._import_batch(batch, report)
+
+        # One reload per kind for every worker, rather than one per batch.
+        # Together they also rebuild each worker's suggestion index once, this
+        # one's included, when the notifications come back.
+        kinds = sorted(self.import_rep.created_kinds)
+        if report["imported"]:
+            kinds.append("movie")
+            movie_count_cache.clear()
+        if kinds:
+            for kind in kinds:
+                await reference_cache.publish(self.db, kind)
+            await self.db.commit()
+        return report
+
+    async def _import_batch(
+        self, batch: list[tuple[int, MovieImportRowSchema]], report: dict
+    ) -> None:
+        """
+        Import a batch, splitting it in halves whenever it fails so that only
+        the rows the database rejects end up reported, each with its own error.
+        """
+        try:
+            movie_ids = await self.import_rep.import_batch([row for _, row in batch])
+        except Exception as error:
+            await self.db.rollback()
+            if len(batch) > 1:
+                middle = len(batch) // 2
+                await self._import_batch(batch[:middle], report)
+                await self._import_batch(batch[middle:], report)
+                return
+            line_number, _ = batch[0]
+            logging.error(f"Failed to import movie on line {line_number}: {error}")
+            self._add_error(report, line_number, str(error))
+            return
+
+        for (line_number, _), movie_id in zip(batch, movie_ids):
+            if movie_id is None:
+                report["skipped"] += 1
+            else:
+                report["imported"] += 1
+
+    @staticmethod
+    def _add_error(report: dict, line_number: int, error: str) -> None:
+        report["failed"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": line_number, "error": error})
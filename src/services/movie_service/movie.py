@@ -1,14 +1,25 @@
+import base64
+import binascii
+import json
+from decimal import Decimal, InvalidOperation
+from typing import Optional
+from urllib.parse import urlencode
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import UserGroupEnum
+from cache import movie_cache, movie_cache_key
+from database.models import ReactionKindEnum
+from exceptions.movies import InvalidCursorError
 from repositories.accounts_rep import UserRepository
+from repositories.movies_rep.catalog import CATALOG_ORDERINGS, MovieCatalogPlan
 from repositories.movies_rep.movie import MovieRepository
+from repositories.movies_rep.reactions import reaction_buffer
 from schemas.movie import (
-    CommentCreateSchema,
-    CommentResponseSchema,
+    MovieCatalogParams,
     MovieCreateSchema,
     MovieSchema,
 )
+from services.etags import etag_matches, make_weak_etag
 
 
 class MovieService:
@@ -25,55 +36,236 @@ class MovieService:
     async def get_movie(self, movie_id: int):
         return await self.movie_rep.get(movie_id)
 
-    async def get_movies_with_params(
-        self, page: int = 1, page_size: int = 10, **kwargs
-    ):
-        movies, total_items = await self.movie_rep.get_movies_with_params(
-            page=page, page_size=page_size, **kwargs
+    async def get_movie_json(
+        self, movie_id: int, if_none_match: str = None
+    ) -> tuple[Optional[str], Optional[bytes]]:
+        """
+        Return the weak ETag and the serialized ``MovieSchema`` of a movie.
+
+        Payloads are cached per movie together with their ETag. The session only
+        checks out a connection on first use, so cache hits never reach the
+        database. When ``if_none_match`` already matches, the payload is None
+        and nothing is loaded or serialized. Both are None for unknown movies.
+
+        Likes and dislikes still waiting in ``reaction_buffer`` are added on top
+        of the stored payload, and folded into the ETag.
+        """
+        likes, dislikes = reaction_buffer.pending(movie_id)
+        key = movie_cache_key(movie_id)
+        cached = await movie_cache.get(key)
+        if cached is not None:
+            etag, _, payload = cached.partition(b"\n")
+            etag = self._reaction_etag(etag.decode(), likes, dislikes)
+            if etag_matches(if_none_match, etag):
+                return etag, None
+            return etag, self._apply_reactions(payload, likes, dislikes)
+
+        if if_none_match:
+            updated_at = await self.movie_rep.get_updated_at(movie_id)
+            if updated_at is None:
+                return None, None
+            etag = self._reaction_etag(
+                make_weak_etag("movie", movie_id, updated_at.isoformat()),
+                likes,
+                dislikes,
+            )
+            if etag_matches(if_none_match, etag):
+                return etag, None
+
+        movie = await self.movie_rep.get(movie_id)
+        if movie is None:
+            return None, None
+        etag = make_weak_etag("movie", movie.id, movie.updated_at.isoformat())
+        payload = MovieSchema.model_validate(movie).model_dump_json().encode()
+        # A write that committed meanwhile, such as a reaction flush, has
+        # already invalidated the key; caching the older state would bring it
+        # back for the whole TTL.
+        if await self.movie_rep.get_updated_at(movie_id) == movie.updated_at:
+            await movie_cache.set(key, etag.encode() + b"\n" + payload)
+        return (
+            self._reaction_etag(etag, likes, dislikes),
+            self._apply_reactions(payload, likes, dislikes),
+        )
+
+    @staticmethod
+    def _reaction_etag(etag: str, likes: int, dislikes: int) -> str:
+        if not likes and not dislikes:
+            return etag
+        return make_weak_etag(etag, likes, dislikes)
+
+    @staticmethod
+    def _apply_reactions(payload: bytes, likes: int, dislikes: int) -> bytes:
+        if not likes and not dislikes:
+            return payload
+        movie = json.loads(payload)
+        movie["likes"] = (movie.get("likes") or 0) + likes
+        movie["dislikes"] = (movie.get("dislikes") or 0) + dislikes
+        return json.dumps(movie, separators=(",", ":")).encode()
+
+    async def get_catalog_etag(self, params: MovieCatalogParams) -> str:
+        """
+        Weak ETag of a catalog page, derived from the catalog version and the
+        normalized query parameters.
+
+        Only database state goes in, so every worker computes the same ETag.
+        Reactions still in a worker's ``reaction_buffer`` change it once they
+        are flushed, which bumps ``updated_at``.
+        """
+        updated_at, deletions = await self.movie_rep.get_catalog_version()
+        trending_version = None
+        if params.sort_by == "trending":
+            ranked_at, ranked_count = await self.movie_rep.get_trending_version()
+            trending_version = (
+                f"{ranked_at.isoformat() if ranked_at else None}:{ranked_count}"
+            )
+        return make_weak_etag(
+            "catalog",
+            updated_at.isoformat() if updated_at else None,
+            deletions,
+            trending_version,
+            params.model_dump_json(),
+        )
+
+    async def get_movies_with_params(self, params: MovieCatalogParams):
+        plan = MovieCatalogPlan(
+            page=params.page,
+            page_size=params.page_size,
+            q=params.q,
+            name=params.name,
+            year=params.year,
+            rating=params.rating,
+            genre_ids=params.genre_ids,
+            star_ids=params.star_ids,
+            director_ids=params.director_ids,
+            certification_ids=params.certification_ids,
+            sort_by=params.sort_by,
+            approximate_count=params.approximate_count,
+        )
+        if params.cursor:
+            if not plan.keyset:
+                raise InvalidCursorError(
+                    "Cursor pagination is not available for relevance-ordered "
+                    "search results or trending movies; use page"
+                )
+            plan.after = self._decode_cursor(params.cursor, plan.sort_by)
+
+        movies, total_items = await self.movie_rep.get_movies_with_params(plan)
+        facets = (
+            await self.movie_rep.get_facet_counts(plan)
+            if params.include_facets
+            else None
         )
+        page, page_size = plan.page, plan.page_size
         total_pages = (total_items + page_size - 1) // page_size
+        next_cursor = (
+            self._encode_cursor(movies[-1], plan.sort_by)
+            if len(movies) == page_size and plan.keyset
+            else None
+        )
+
+        if params.cursor:
+            prev_page = None
+            next_page = (
+                self._page_link(params, cursor=next_cursor) if next_cursor else None
+            )
+        else:
+            prev_page = self._page_link(params, page=page - 1) if page > 1 else None
+            next_page = (
+                self._page_link(params, page=page + 1) if page < total_pages else None
+            )
 
         return {
-            "movies": [MovieSchema.model_validate(movie) for movie in movies],
-            "prev_page": (
-                f"/api/movies/?page={page - 1}&per_page={page_size}"
-                if page > 1
-                else None
-            ),
-            "next_page": (
-                f"/api/movies/?page={page + 1}&per_page={page_size}"
-                if page < total_pages
-                else None
-            ),
+            "movies": [self._movie_schema(movie) for movie in movies],
+            "prev_page": prev_page,
+            "next_page": next_page,
+            "next_cursor": next_cursor,
             "total_pages": total_pages,
             "total_items": total_items,
+            "facets": facets,
         }
 
+    @staticmethod
+    def _page_link(params: MovieCatalogParams, **changes) -> str:
+        """
+        Link to the listing with the same filters, sort and page size as
+        ``params``, with ``changes`` applied.
+        """
+        query = params.model_dump(exclude_defaults=True, exclude={"page", "cursor"})
+        query["page_size"] = params.page_size
+        query.update(changes)
+        return f"/api/movies/?{urlencode(query, doseq=True)}"
+
+    @staticmethod
+    def _movie_schema(movie) -> MovieSchema:
+        schema = MovieSchema.model_validate(movie)
+        likes, dislikes = reaction_buffer.pending(movie.id)
+        if likes or dislikes:
+            schema.likes = (schema.likes or 0) + likes
+            schema.dislikes = (schema.dislikes or 0) + dislikes
+        return schema
+
+    @staticmethod
+    def _encode_cursor(movie, sort_by: str = None) -> str:
+        """
+        Build an opaque cursor pointing right after ``movie`` in the given ordering.
+        """
+        if sort_by is None:
+            position = [movie.id]
+        else:
+            column, _ = CATALOG_ORDERINGS[sort_by]
+            value = getattr(movie, column.key)
+            position = [str(value) if isinstance(value, Decimal) else value, movie.id]
+        payload = json.dumps([sort_by, *position], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort_by: str = None) -> tuple:
+        """
+        Turn a cursor back into the ``(sort value, id)`` position it encodes.
+
+        :raises InvalidCursorError: If the cursor is malformed or was issued for
+            a different ordering.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            cursor_sort_by, *position = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise InvalidCursorError("Malformed cursor")
+
+        if cursor_sort_by != sort_by:
+            raise InvalidCursorError("Cursor was issued for a different sort order")
+
+        try:
+            if sort_by is None:
+                (movie_id,) = position
+                return (int(movie_id),)
+            value, movie_id = position
+            if sort_by == "price":
+                return Decimal(value), int(movie_id)
+            return int(value), int(movie_id)
+        except (ValueError, TypeError, InvalidOperation):
+            raise InvalidCursorError("Malformed cursor")
+
+    async def get_related_movies(self, movie_id: int, limit: int = 10):
+        return await self.movie_rep.get_related(movie_id, limit)
+
     async def delete_movie(self, movie_id: int):
         return await self.movie_rep.delete(movie_id)
 
     async def like_movie(self, movie_id: int):
-        await self.movie_rep.increment_likes(movie_id)
+        user = self.user_rep.principal
+        await self.movie_rep.react(movie_id, user.id, ReactionKindEnum.LIKE)
 
     async def dislike_movie(self, movie_id: int):
-        await self.movie_rep.increment_dislikes(movie_id)
+        user = self.user_rep.principal
+        await self.movie_rep.react(movie_id, user.id, ReactionKindEnum.DISLIKE)
 
     async def rate_movie(self, movie_id: int, user_rating: float):
-        await self.movie_rep.rate_movie(movie_id, user_rating)
-
-    async def is_admin(self):
-        user = await self.user_rep.get_user_from_token()
-        return user.has_group(UserGroupEnum.ADMIN)
-
-    async def create_comment(self, movie_id: int, comment: CommentCreateSchema):
-        user = await self.user_rep.get_user_from_token()
-        db_comment = CommentModel(user_id=user.id, movie_id=movie_id, text=comment.text)
-        self.db.add(db_comment)
-        await self.db.commit()
-        await self.db.refresh(db_comment)
-        return CommentResponseSchema(
-            id=db_comment.id, user_id=user.id, text=db_comment.text
-        )
+        user = self.user_rep.principal
+        await self.movie_rep.rate_movie(movie_id, user.id, user_rating)
+
+    def is_admin(self) -> bool:
+        return self.user_rep.is_admin()
 
     async def cant_delete_movie(self, movie_id: int) -> bool:
         return await self.movie_rep.movie_exists_in_purchases(movie_id)
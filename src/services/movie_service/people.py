@@ -0,0 +1,29 @@
+import base64
+import binascii
+import json
+
+from exceptions.movies import InvalidCursorError
+
+
+def encode_person_cursor(person) -> str:
+    """
+    Build an opaque cursor pointing right after a star or director row.
+    """
+    payload = json.dumps([person.name_key, person.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_person_cursor(cursor: str) -> tuple[str, int]:
+    """
+    Turn a cursor back into the ``(name key, id)`` position it encodes.
+
+    :raises InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name_key, person_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(name_key, str):
+            raise TypeError(name_key)
+        return name_key, int(person_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursorError("Malformed cursor")
@@ -0,0 +1,174 @@
+import logging
+from array import array
+from typing import Iterator
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from database.models import MovieSimilarityModel
+from database.models.movies import (
+    MovieDirectorsModel,
+    MovieGenresModel,
+    MovieStarsModel,
+)
+
+SIMILARITY_WEIGHTS = {"genres": 1.0, "stars": 2.0, "directors": 3.0}
+_INCIDENCE_COLUMNS = {
+    "genres": MovieGenresModel.c.genre_id,
+    "stars": MovieStarsModel.c.star_id,
+    "directors": MovieDirectorsModel.c.director_id,
+}
+
+
+def top_similar(
+    incidence: list[tuple[sparse.csr_matrix, float]],
+    top_k: int = 20,
+    max_df: int = 2000,
+    chunk_size: int = 2000,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Yield ``(row, other row, score)`` arrays with every movie's ``top_k`` most
+    similar movies, one chunk of ``chunk_size`` movies at a time.
+
+    ``incidence`` holds one movie × genre/star/director 0/1 matrix per kind
+    with its weight; the score of a pair is the weighted number of shared
+    entries. Columns are scaled by the square root of their weight so that a
+    single product ``X @ X.T`` adds the kinds up.
+
+    Candidates come only from entries shared by at most ``max_df`` movies:
+    a broad genre would otherwise pair every movie with a large part of the
+    catalog. Such common entries still count towards the score of the
+    candidates found through rarer ones.
+    """
+    weighted = sparse.hstack(
+        [matrix * np.float32(np.sqrt(weight)) for matrix, weight in incidence],
+        format="csc",
+        dtype=np.float32,
+    )
+    is_common = np.diff(weighted.indptr) > max_df
+    rare = weighted[:, ~is_common].tocsr()
+    rare_transposed = rare.T.tocsr()
+    common = weighted[:, is_common].tocsr()
+
+    for start in range(0, weighted.shape[0], chunk_size):
+        product = (rare[start : start + chunk_size] @ rare_transposed).tocoo()
+        rows, others, scores = product.row, product.col, product.data
+        not_self = others != rows + start
+        rows, others, scores = (
+            rows[not_self] + start,
+            others[not_self],
+            scores[not_self],
+        )
+        if common.nnz and len(rows):
+            scores = (
+                scores
+                + np.asarray(common[rows].multiply(common[others]).sum(axis=1)).ravel()
+            )
+
+        # One float key orders pairs by row, then by descending score; far
+        # cheaper than a multi-key lexsort over millions of pairs.
+        order = np.argsort(
+            rows * np.float64(scores.max(initial=0) + 1) - scores, kind="stable"
+        )
+        rows, others, scores = rows[order], others[order], scores[order]
+        rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+        best = rank < top_k
+        yield rows[best], others[best], scores[best]
+
+
+class MovieSimilarityJob:
+    """
+    Rebuilds ``movie_similarity`` from the genre, star and director links.
+
+    The incidence lists are streamed into flat arrays, turned into sparse
+    matrices and multiplied chunk by chunk (see ``top_similar``), so memory
+    is bounded by the link count plus one chunk of candidate pairs. Old rows
+    are deleted and new ones copied in within a single transaction; readers
+    keep seeing the previous index until it commits.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        weights: dict[str, float] = None,
+        top_k: int = 20,
+        max_df: int = 2000,
+        chunk_size: int = 2000,
+    ) -> None:
+        self.session_factory = session_factory
+        self.weights = weights or SIMILARITY_WEIGHTS
+        self.top_k = top_k
+        self.max_df = max_df
+        self.chunk_size = chunk_size
+
+    async def run(self) -> int:
+        """
+        Recompute the index and return the number of rows written.
+        """
+        async with self.session_factory() as session:
+            links = {
+                kind: await self._load_links(session, column)
+                for kind, column in _INCIDENCE_COLUMNS.items()
+            }
+            movie_ids = np.unique(
+                np.concatenate([movie_ids for movie_ids, _ in links.values()])
+            )
+            incidence = [
+                (
+                    self._incidence_matrix(movie_ids, *links[kind]),
+                    self.weights[kind],
+                )
+                for kind in _INCIDENCE_COLUMNS
+            ]
+            del links
+
+            await session.execute(delete(MovieSimilarityModel))
+            connection = await session.connection()
+            raw_connection = await connection.get_raw_connection()
+            written = 0
+            for rows, others, scores in top_similar(
+                incidence, self.top_k, self.max_df, self.chunk_size
+            ):
+                await raw_connection.driver_connection.copy_records_to_table(
+                    MovieSimilarityModel.__tablename__,
+                    columns=("movie_id", "other_id", "score"),
+                    records=zip(
+                        movie_ids[rows].tolist(),
+                        movie_ids[others].tolist(),
+                        scores.tolist(),
+                    ),
+                )
+                written += len(rows)
+                logging.info(f"Wrote {written} movie similarity rows")
+            await session.commit()
+        return written
+
+    @staticmethod
+    async def _load_links(session: AsyncSession, column) -> tuple[np.ndarray, ...]:
+        movie_ids, related_ids = array("q"), array("q")
+        result = await session.stream(
+            select(column.table.c.movie_id, column).execution_options(yield_per=100000)
+        )
+        async for partition in result.partitions():
+            movie_column, related_column = zip(*partition)
+            movie_ids.extend(movie_column)
+            related_ids.extend(related_column)
+        return (
+            np.frombuffer(movie_ids, dtype=np.int64),
+            np.frombuffer(related_ids, dtype=np.int64),
+        )
+
+    @staticmethod
+    def _incidence_matrix(
+        movie_ids: np.ndarray, link_movie_ids: np.ndarray, related_ids: np.ndarray
+    ) -> sparse.csr_matrix:
+        _, columns = np.unique(related_ids, return_inverse=True)
+        return sparse.csr_matrix(
+            (
+                np.ones(len(columns), dtype=np.float32),
+                (np.searchsorted(movie_ids, link_movie_ids), columns),
+            ),
+            shape=(len(movie_ids), columns.max(initial=-1) + 1),
+        )
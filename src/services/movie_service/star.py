@@ -1,7 +1,7 @@
-from database import UserGroupEnum
 from repositories.accounts_rep import UserRepository
 from repositories.movies_rep.star import StarRepository
 from schemas.movie import BaseCreateSchema
+from services.movie_service.people import decode_person_cursor, encode_person_cursor
 
 
 class StarService:
@@ -15,12 +15,20 @@ class StarService:
     async def get_star(self, star_id: int):
         return await self.star_rep.get(star_id)
 
-    async def get_all_stars(self):
-        return await self.star_rep.get_all()
+    async def get_stars(
+        self, q: str = None, cursor: str = None, page_size: int = 50
+    ) -> dict:
+        after = decode_person_cursor(cursor) if cursor else None
+        stars = await self.star_rep.get_page(prefix=q, after=after, limit=page_size)
+        return {
+            "stars": stars,
+            "next_cursor": (
+                encode_person_cursor(stars[-1]) if len(stars) == page_size else None
+            ),
+        }
 
     async def delete_star(self, star_id: int):
         return await self.star_rep.delete(star_id)
 
-    async def is_admin(self):
-        user = await self.user_rep.get_user_from_token()
-        return user.has_group(UserGroupEnum.ADMIN)
+    def is_admin(self) -> bool:
+        return self.user_rep.is_admin()
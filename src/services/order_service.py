@@ -33,7 +33,7 @@ class OrderService:
 
     async def create_order(self) -> OrderModel:
         try:
-            user = await self.user_crud.get_user_from_token()
+            user = self.user_crud.principal
             user_cart = await self.cart_crud.get_user_cart(user.id)
 
             if not user_cart:
@@ -101,7 +101,7 @@ class OrderService:
         await self.order_crud.set_status(order_id, "paid")
 
     async def add_order_to_purchased(self, order_id: int) -> None:
-        user = await self.user_crud.get_user_from_token()
+        user = self.user_crud.principal
         order_items = await self.order_crud.get_order_items(order_id)
         for order_item in order_items.order_items:
             await self.user_crud.add_movie_to_purchased(user.id, order_item.movie_id)
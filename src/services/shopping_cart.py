@@ -28,7 +28,7 @@ class ShoppingCartService:
         create_order_url: Optional[str] = None,
         clear_cart_url: Optional[str] = None,
     ) -> CartDetailSchema:
-        user = await self.user_repository.get_user_from_token()
+        user = self.user_repository.principal
 
         cart = await self.shopping_cart_repository.get_or_create_cart(user.id)
         items = await self.get_cart_items_details(cart)
@@ -0,0 +1,14 @@
+import os
+
+from dotenv import load_dotenv
+
+# database.session builds its engine URL on import, so settings must be in
+# place before the conftest imports the app.
+load_dotenv()
+for name, default in (
+    ("POSTGRES_HOST", "localhost"),
+    ("POSTGRES_DB_PORT", "5432"),
+    ("SECRET_KEY_ACCESS", "test-access"),
+    ("SECRET_KEY_REFRESH", "test-refresh"),
+):
+    os.environ.setdefault(name, default)
@@ -0,0 +1,155 @@
+"""
+Fixtures for tests that run against Postgres.
+
+The database is the one configured through the ``POSTGRES_*`` variables or
+``.env``, migrated to head, such as the one from ``docker-compose-local.yml``.
+Tests that use it are skipped when it cannot be reached. Every test creates
+its own rows and deletes them afterwards.
+"""
+
+import uuid
+
+import httpx
+import pytest
+from sqlalchemy import delete, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from cache import movie_count_cache
+from database import UserGroupEnum, get_db
+from database.models import (
+    CertificationModel,
+    DirectorModel,
+    GenreModel,
+    MovieModel,
+    StarModel,
+)
+from database.models.movies import MovieGenresModel, MovieStarsModel
+from database.session import POSTGRESQL_DATABASE_URL
+from dependencies.accounts import get_principal
+from main import app
+from security.principal import Principal
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        POSTGRESQL_DATABASE_URL, pool_size=20, max_overflow=0, pool_timeout=120
+    )
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as error:
+        await engine.dispose()
+        pytest.skip(f"Postgres is not reachable: {error}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def statements(engine):
+    """
+    Collect the SQL of every statement sent to the database.
+    """
+    executed = []
+
+    def record(connection, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+async def catalog(session_factory):
+    """
+    Three movies sharing a new genre, star and certification.
+
+    Movies created with that certification during the test are deleted
+    along with them.
+    """
+    suffix = uuid.uuid4().hex[:12]
+    async with session_factory() as session:
+        certification = CertificationModel(name=f"cert-{suffix}")
+        genre = GenreModel(name=f"genre-{suffix}")
+        star = StarModel(name=f"star-{suffix}")
+        director = DirectorModel(name=f"director-{suffix}")
+        session.add_all([certification, genre, star, director])
+        await session.flush()
+        movies = [
+            MovieModel(
+                name=f"movie-{suffix}-{number}",
+                year=2001,
+                time=90 + number,
+                imdb=7.0,
+                votes=100 * number,
+                description="A test movie.",
+                price=number + 0.99,
+                certification_id=certification.id,
+            )
+            for number in range(3)
+        ]
+        session.add_all(movies)
+        await session.flush()
+        for association, column, related_id in (
+            (MovieGenresModel, "genre_id", genre.id),
+            (MovieStarsModel, "star_id", star.id),
+        ):
+            await session.execute(
+                association.insert().values(
+                    [{"movie_id": movie.id, column: related_id} for movie in movies]
+                )
+            )
+        await session.commit()
+        ids = {
+            "certification_id": certification.id,
+            "genre_id": genre.id,
+            "star_id": star.id,
+            "director_id": director.id,
+            "movie_ids": [movie.id for movie in movies],
+        }
+
+    movie_count_cache.clear()
+    yield ids
+
+    async with session_factory() as session:
+        await session.execute(
+            delete(MovieModel).where(
+                MovieModel.certification_id == ids["certification_id"]
+            )
+        )
+        for model, key in (
+            (GenreModel, "genre_id"),
+            (StarModel, "star_id"),
+            (DirectorModel, "director_id"),
+            (CertificationModel, "certification_id"),
+        ):
+            await session.execute(delete(model).where(model.id == ids[key]))
+        await session.commit()
+    movie_count_cache.clear()
+
+
+@pytest.fixture
+async def client(session_factory):
+    """
+    HTTP client for the app, using the test engine and an admin principal.
+    """
+
+    async def get_test_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_principal] = lambda: Principal(
+        id=0, group=UserGroupEnum.ADMIN, is_active=True
+    )
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+    app.dependency_overrides.clear()
@@ -0,0 +1,293 @@
+"""
+Compare the catalog listing against the joinedload query it replaced.
+
+Seeds a catalog of ``bench-`` movies with realistic cast sizes (three
+genres, eight stars, one or two directors and a few comments per movie) the
+first time it runs, then reports the statements, rows sent by Postgres and
+latency of each listing for a few typical requests.
+Usage (from the ``src`` directory)::
+
+    python -m tests.perf.catalog_listing
+    python -m tests.perf.catalog_listing --movies 20000 --repeat 50
+    python -m tests.perf.catalog_listing --cleanup
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import joinedload
+
+from cache import movie_count_cache
+from database import UserModel
+from database.models import (
+    CertificationModel,
+    CommentModel,
+    DirectorModel,
+    GenreModel,
+    MovieModel,
+    StarModel,
+)
+from repositories.movies_rep.catalog import MovieCatalogPlan
+from repositories.movies_rep.movie import MovieRepository
+from tests.perf.common import (
+    StatementCounter,
+    create_engine,
+    create_users,
+    driver_connection,
+    summarize,
+)
+
+PREFIX = "bench-"
+COMMENTER_EMAIL = f"{PREFIX}commenter@example.com"
+YEARS = range(1950, 2025)
+# reference kind -> rows seeded
+REFERENCE_SIZES = {
+    "certifications": 5,
+    "genres": 20,
+    "stars": 20000,
+    "directors": 5000,
+}
+
+
+def legacy_statement(page: int, page_size: int, year: int = None, sort_by: str = None):
+    """
+    The listing statement as it was before the two-phase catalog: every
+    relationship joined into the paginated query.
+    """
+    query = select(MovieModel).options(
+        joinedload(MovieModel.genres),
+        joinedload(MovieModel.stars),
+        joinedload(MovieModel.directors),
+        joinedload(MovieModel.comments),
+        joinedload(MovieModel.certification),
+    )
+    if year:
+        query = query.filter(MovieModel.year == year)
+    if sort_by == "price":
+        query = query.order_by(MovieModel.price)
+    elif sort_by == "release_year":
+        query = query.order_by(MovieModel.year)
+    elif sort_by == "popularity":
+        query = query.order_by(MovieModel.votes.desc())
+    return query.offset((page - 1) * page_size).limit(page_size)
+
+
+async def legacy_listing(session: AsyncSession, page, page_size, year, sort_by):
+    result = await session.execute(legacy_statement(page, page_size, year, sort_by))
+    movies = result.unique().scalars().all()
+    query = select(func.count()).select_from(MovieModel)
+    if year:
+        query = query.filter(MovieModel.year == year)
+    total = (await session.execute(query)).scalar()
+    return movies, total
+
+
+async def catalog_listing(session: AsyncSession, page, page_size, year, sort_by):
+    movie_count_cache.clear()
+    plan = MovieCatalogPlan(page=page, page_size=page_size, year=year, sort_by=sort_by)
+    return await MovieRepository(session).get_movies_with_params(plan)
+
+
+async def seeded_movies(session: AsyncSession) -> int:
+    return await session.scalar(
+        select(func.count()).where(MovieModel.name.like(f"{PREFIX}movie-%"))
+    )
+
+
+async def seed(session: AsyncSession, movies: int) -> None:
+    connection = await driver_connection(session)
+    reference_ids = {}
+    for table, size in REFERENCE_SIZES.items():
+        await connection.copy_records_to_table(
+            table,
+            records=[(f"{PREFIX}{table}-{number}",) for number in range(size)],
+            columns=["name"],
+        )
+        reference_ids[table] = [
+            row[0]
+            for row in await connection.fetch(
+                f"SELECT id FROM {table} WHERE name LIKE $1", f"{PREFIX}%"
+            )
+        ]
+    (commenter_id,) = await create_users(session, [COMMENTER_EMAIL])
+
+    await connection.copy_records_to_table(
+        "movies",
+        records=[
+            (
+                uuid.uuid4(),
+                f"{PREFIX}movie-{number}",
+                random.choice(YEARS),
+                random.randint(80, 180),
+                round(random.uniform(1, 10), 1),
+                random.randint(100, 2_000_000),
+                round(random.uniform(10, 100), 1),
+                round(random.uniform(1e5, 5e8), 2),
+                f"Description of benchmark movie {number}.",
+                Decimal(random.randint(199, 2999)) / 100,
+                random.choice(reference_ids["certifications"]),
+            )
+            for number in range(movies)
+        ],
+        columns=[
+            "uuid",
+            "name",
+            "year",
+            "time",
+            "imdb",
+            "votes",
+            "meta_score",
+            "gross",
+            "description",
+            "price",
+            "certification_id",
+        ],
+    )
+    movie_ids = [
+        row[0]
+        for row in await connection.fetch(
+            "SELECT id FROM movies WHERE name LIKE $1", f"{PREFIX}movie-%"
+        )
+    ]
+
+    for table, column, reference, per_movie in (
+        ("movie_genres", "genre_id", "genres", lambda: 3),
+        ("movie_stars", "star_id", "stars", lambda: 8),
+        ("movie_directors", "director_id", "directors", lambda: random.randint(1, 2)),
+    ):
+        await connection.copy_records_to_table(
+            table,
+            records=[
+                (movie_id, reference_id)
+                for movie_id in movie_ids
+                for reference_id in random.sample(reference_ids[reference], per_movie())
+            ],
+            columns=["movie_id", column],
+        )
+    await connection.copy_records_to_table(
+        "comments",
+        records=[
+            (f"Comment {number} on movie {movie_id}.", commenter_id, movie_id)
+            for movie_id in movie_ids
+            for number in range(random.randint(0, 6))
+        ],
+        columns=["text", "user_id", "movie_id"],
+    )
+    await connection.execute(
+        "UPDATE movies SET comment_count = counts.total "
+        "FROM (SELECT movie_id, count(*) AS total FROM comments "
+        "GROUP BY movie_id) AS counts "
+        "WHERE movies.id = counts.movie_id AND movies.name LIKE $1",
+        f"{PREFIX}movie-%",
+    )
+    await session.commit()
+
+
+async def cleanup(session: AsyncSession) -> None:
+    commenters = select(UserModel.id).where(UserModel.email == COMMENTER_EMAIL)
+    await session.execute(
+        delete(CommentModel).where(CommentModel.user_id.in_(commenters))
+    )
+    await session.execute(delete(UserModel).where(UserModel.email == COMMENTER_EMAIL))
+    for model in (MovieModel, GenreModel, StarModel, DirectorModel, CertificationModel):
+        await session.execute(delete(model).where(model.name.like(f"{PREFIX}%")))
+    await session.commit()
+
+
+async def measure(session_factory, engine, listing, repeat: int, **request) -> tuple:
+    latencies = []
+    with StatementCounter(engine) as counter:
+        for _ in range(repeat):
+            async with session_factory() as session:
+                started = time.perf_counter()
+                await listing(session, **request)
+                latencies.append((time.perf_counter() - started) * 1000)
+    return counter.statements // repeat, counter.rows // repeat, latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_engine()
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as session:
+            if args.cleanup:
+                await cleanup(session)
+                print("Removed the benchmark catalog")
+                return
+            existing = await seeded_movies(session)
+            if existing:
+                print(f"Reusing {existing} seeded movies")
+            else:
+                started = time.perf_counter()
+                await seed(session, args.movies)
+                print(
+                    f"Seeded {args.movies} movies "
+                    f"in {time.perf_counter() - started:.1f} s"
+                )
+                # Settle visibility maps and statistics now rather than under
+                # autovacuum in the middle of the measurements.
+                async with engine.connect() as connection:
+                    await connection.execution_options(isolation_level="AUTOCOMMIT")
+                    await connection.execute(text("VACUUM ANALYZE"))
+            total = await session.scalar(select(func.count()).select_from(MovieModel))
+
+        size = args.page_size
+        scenarios = {
+            "first page": dict(page=1, page_size=size, year=None, sort_by=None),
+            "deep page by price": dict(
+                page=max(1, total // size // 2),
+                page_size=size,
+                year=None,
+                sort_by="price",
+            ),
+            "one year by popularity": dict(
+                page=1, page_size=size, year=2001, sort_by="popularity"
+            ),
+        }
+        print(
+            f"{'request':<24} {'listing':<11} {'statements':>10} {'rows':>7}  latency"
+        )
+        for scenario, request in scenarios.items():
+            for name, listing in (
+                ("joinedload", legacy_listing),
+                ("two-phase", catalog_listing),
+            ):
+                # Warm up the connection pool, statement caches and shared buffers.
+                await measure(session_factory, engine, listing, 2, **request)
+                statements, rows, latencies = await measure(
+                    session_factory, engine, listing, args.repeat, **request
+                )
+                print(
+                    f"{scenario:<24} {name:<11} {statements:>10} {rows:>7}  "
+                    f"{summarize(latencies)}"
+                )
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--movies", type=int, default=100_000, help="movies seeded on the first run"
+    )
+    parser.add_argument("--page-size", type=int, default=20, help="movies per page")
+    parser.add_argument(
+        "--repeat", type=int, default=30, help="timed requests per listing"
+    )
+    parser.add_argument(
+        "--cleanup", action="store_true", help="remove the seeded catalog and exit"
+    )
+    args = parser.parse_args()
+    if min(args.movies, args.page_size, args.repeat) < 1:
+        parser.error("--movies, --page-size and --repeat must be positive")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
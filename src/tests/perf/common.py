@@ -0,0 +1,93 @@
+"""
+Helpers shared by the benchmarks in this package.
+"""
+
+import statistics
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from database import UserGroupEnum, UserGroupModel, UserModel
+from database.session import POSTGRESQL_DATABASE_URL
+
+
+def create_engine(**kwargs) -> AsyncEngine:
+    return create_async_engine(POSTGRESQL_DATABASE_URL, **kwargs)
+
+
+async def driver_connection(session: AsyncSession):
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def create_users(
+    session: AsyncSession, emails: list[str], hashed_password: str = "!"
+) -> list[int]:
+    """
+    Insert active users in the ``USER`` group and return their ids.
+
+    The default password hash matches no password, which is enough for
+    everything but logging in.
+    """
+    await session.execute(
+        pg_insert(UserGroupModel)
+        .values(name=UserGroupEnum.USER)
+        .on_conflict_do_nothing()
+    )
+    group_id = await session.scalar(
+        select(UserGroupModel.id).where(UserGroupModel.name == UserGroupEnum.USER)
+    )
+    result = await session.execute(
+        insert(UserModel)
+        .values(
+            [
+                {
+                    "email": email,
+                    "hashed_password": hashed_password,
+                    "is_active": True,
+                    "group_id": group_id,
+                }
+                for email in emails
+            ]
+        )
+        .returning(UserModel.id)
+    )
+    return result.scalars().all()
+
+
+class StatementCounter:
+    """
+    Count the statements sent through an engine and the rows they return
+    while the ``with`` block is active.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine.sync_engine
+        self.statements = 0
+        self.rows = 0
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(self._engine, "after_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._engine, "after_cursor_execute", self._record)
+
+    def _record(self, connection, cursor, statement, parameters, context, many):
+        self.statements += 1
+        self.rows += max(cursor.rowcount, 0)
+
+
+def summarize(samples_ms: list[float]) -> str:
+    """
+    Format latency samples in milliseconds as p50 / p95 / p99 / max.
+    """
+    if len(samples_ms) < 2:
+        return f"{samples_ms[0]:.1f} ms" if samples_ms else "no samples"
+    cuts = statistics.quantiles(samples_ms, n=100, method="inclusive")
+    return (
+        f"p50 {cuts[49]:.1f} ms, p95 {cuts[94]:.1f} ms, "
+        f"p99 {cuts[98]:.1f} ms, max {max(samples_ms):.1f} ms"
+    )
@@ -0,0 +1,167 @@
+"""
+Load test logins and the latency they add to unrelated requests.
+
+Runs the app in process with its real startup, so the password hashing
+policy is the calibrated or configured one. Concurrent clients log in over
+and over while a probe keeps requesting ``/api/movies/suggest``, which is
+served from memory and therefore only slows down when the event loop is
+blocked. Each run is repeated with the hashing done inline on the event
+loop, as it was before ``password_hasher``.
+Usage (from the ``src`` directory)::
+
+    python -m tests.perf.login_load
+    python -m tests.perf.login_load --clients 32 --duration 20
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from unittest import mock
+
+import httpx
+from sqlalchemy import delete
+
+from database import UserModel
+from database.models import accounts as accounts_models
+from database.session import AsyncPostgresqlSessionLocal
+from main import app
+from security.passwords import PasswordHasher, hash_password, password_hasher
+from tests.perf.common import create_users, summarize
+
+PREFIX = "bench-"
+PASSWORD = "Bench-password-1"
+# Pause of a client whose login was turned away, so it does not spin.
+BUSY_BACKOFF = 0.05
+# Two logins of one user within the same second mint the same refresh token,
+# which must be unique, so every client rotates through its own users.
+USERS_PER_CLIENT = 20
+
+
+class InlinePasswordHasher(PasswordHasher):
+    """
+    Hashes on the calling thread, which blocks the event loop like the
+    synchronous hashing did before the pool.
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    async def _submit(self, func, *args):
+        return func(*args)
+
+
+async def login(client: httpx.AsyncClient, email: str) -> httpx.Response:
+    return await client.post(
+        "/api/accounts/login/", json={"email": email, "password": PASSWORD}
+    )
+
+
+async def load(client, emails_per_client, token, args) -> tuple:
+    deadline = time.perf_counter() + args.duration
+    turned_away, login_latencies, probe_latencies = 0, [], []
+
+    async def log_in(emails: list[str]) -> None:
+        nonlocal turned_away
+        attempt = 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await login(client, emails[attempt % len(emails)])
+            attempt += 1
+            if response.status_code == 429:
+                turned_away += 1
+                await asyncio.sleep(BUSY_BACKOFF)
+                continue
+            response.raise_for_status()
+            login_latencies.append((time.perf_counter() - started) * 1000)
+
+    async def probe() -> None:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.get(
+                "/api/movies/suggest",
+                params={"prefix": "a"},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            response.raise_for_status()
+            probe_latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(args.probe_interval)
+
+    await asyncio.gather(probe(), *map(log_in, emails_per_client))
+    return turned_away, login_latencies, probe_latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    suffix = uuid.uuid4().hex[:12]
+    emails = [
+        f"{PREFIX}login-{suffix}-{number}@example.com"
+        for number in range(args.clients * USERS_PER_CLIENT)
+    ]
+    probe_email = f"{PREFIX}login-{suffix}-probe@example.com"
+    emails_per_client = [
+        emails[start : start + USERS_PER_CLIENT]
+        for start in range(0, len(emails), USERS_PER_CLIENT)
+    ]
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with AsyncPostgresqlSessionLocal() as session:
+            user_ids = await create_users(
+                session, [probe_email, *emails], hash_password(PASSWORD)
+            )
+            await session.commit()
+        try:
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=None
+            ) as client:
+                response = await login(client, probe_email)
+                response.raise_for_status()
+                token = response.json()["access_token"]
+
+                print(
+                    f"{args.clients} clients logging in for {args.duration:g} s, "
+                    f"probing /api/movies/suggest every "
+                    f"{args.probe_interval * 1000:g} ms"
+                )
+                for name, hasher in (
+                    ("inline", InlinePasswordHasher()),
+                    ("pool", password_hasher),
+                ):
+                    with mock.patch.object(accounts_models, "password_hasher", hasher):
+                        turned_away, logins, probes = await load(
+                            client, emails_per_client, token, args
+                        )
+                    print(
+                        f"{name:<7} logins {len(logins) / args.duration:6.1f}/s "
+                        f"({turned_away} turned away)  {summarize(logins)}"
+                    )
+                    print(f"{'':<7} suggest {summarize(probes)}")
+        finally:
+            async with AsyncPostgresqlSessionLocal() as session:
+                await session.execute(
+                    delete(UserModel).where(UserModel.id.in_(user_ids))
+                )
+                await session.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--clients", type=int, default=16, help="clients logging in concurrently"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=10, help="seconds of load per run"
+    )
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=0.02,
+        help="seconds between two requests of the probe",
+    )
+    args = parser.parse_args()
+    if args.clients < 1 or args.duration <= 0 or args.probe_interval < 0:
+        parser.error("--clients and --duration must be positive")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Load test concurrent likes on a single movie.
+
+Compares the per-click ``UPDATE movies SET likes = likes + 1`` and commit that
+likes used to cost with ``MovieRepository.react``, which records the user's
+reaction and leaves the counter to ``reaction_buffer``. Every like comes from
+a different user, and each run checks that the stored counter ends up exact.
+Usage (from the ``src`` directory)::
+
+    python -m tests.perf.reaction_counters
+    python -m tests.perf.reaction_counters --likes 20000 --connections 40
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from cache import movie_cache, movie_cache_key
+from database import UserModel
+from database.models import CertificationModel, MovieModel, ReactionKindEnum
+from repositories.movies_rep.movie import MovieRepository
+from repositories.movies_rep.reactions import reaction_buffer
+from tests.perf.common import create_engine, create_users, summarize
+
+PREFIX = "bench-"
+USER_BATCH = 5000
+
+
+async def update_like(session: AsyncSession, movie_id: int, user_id: int) -> None:
+    await session.execute(
+        update(MovieModel)
+        .where(MovieModel.id == movie_id)
+        .values(likes=MovieModel.likes + 1)
+    )
+    await session.commit()
+    await movie_cache.delete(movie_cache_key(movie_id))
+
+
+async def buffered_like(session: AsyncSession, movie_id: int, user_id: int) -> None:
+    await MovieRepository(session).react(movie_id, user_id, ReactionKindEnum.LIKE)
+
+
+async def stored_likes(session_factory: async_sessionmaker, movie_id: int) -> int:
+    async with session_factory() as session:
+        return await session.scalar(
+            select(MovieModel.likes).where(MovieModel.id == movie_id)
+        )
+
+
+async def create_movie(session: AsyncSession, suffix: str) -> int:
+    certification = CertificationModel(name=f"{PREFIX}likes-{suffix}")
+    session.add(certification)
+    await session.flush()
+    movie = MovieModel(
+        name=f"{PREFIX}liked-movie-{suffix}",
+        year=2001,
+        time=120,
+        imdb=7.5,
+        votes=1000,
+        description="Benchmark movie.",
+        price=9.99,
+        certification_id=certification.id,
+        likes=0,
+        dislikes=0,
+    )
+    session.add(movie)
+    await session.flush()
+    return movie.id
+
+
+async def load(session_factory, movie_id, user_ids, like) -> tuple:
+    latencies = []
+
+    async def click(user_id: int) -> None:
+        started = time.perf_counter()
+        async with session_factory() as session:
+            await like(session, movie_id, user_id)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(click(user_id) for user_id in user_ids))
+    return time.perf_counter() - started, latencies
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_engine(pool_size=args.connections, max_overflow=0, pool_timeout=300)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    suffix = uuid.uuid4().hex[:12]
+    async with session_factory() as session:
+        movie_ids = [await create_movie(session, f"{suffix}-{mode}") for mode in "ab"]
+        user_ids = []
+        for start in range(0, args.likes, USER_BATCH):
+            user_ids += await create_users(
+                session,
+                [
+                    f"{PREFIX}liker-{suffix}-{number}@example.com"
+                    for number in range(start, min(start + USER_BATCH, args.likes))
+                ],
+            )
+        await session.commit()
+
+    try:
+        print(
+            f"{args.likes} concurrent likes on one movie "
+            f"over {args.connections} connections"
+        )
+        for (name, like), movie_id in zip(
+            (("UPDATE per click", update_like), ("react + buffer", buffered_like)),
+            movie_ids,
+        ):
+            flusher = asyncio.create_task(reaction_buffer.run(session_factory))
+            elapsed, latencies = await load(session_factory, movie_id, user_ids, like)
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+            likes = await stored_likes(session_factory, movie_id)
+            print(
+                f"{name:<17} {args.likes / elapsed:>8.0f} likes/s  "
+                f"{summarize(latencies)}  stored {likes}"
+                + ("" if likes == args.likes else f" (expected {args.likes})")
+            )
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(UserModel).where(UserModel.id.in_(user_ids)))
+            await session.execute(
+                delete(MovieModel).where(MovieModel.id.in_(movie_ids))
+            )
+            await session.execute(
+                delete(CertificationModel).where(
+                    CertificationModel.name.like(f"{PREFIX}likes-{suffix}-%")
+                )
+            )
+            await session.commit()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--likes", type=int, default=10_000, help="concurrent likes, one per user"
+    )
+    parser.add_argument(
+        "--connections", type=int, default=20, help="size of the connection pool"
+    )
+    args = parser.parse_args()
+    if min(args.likes, args.connections) < 1:
+        parser.error("--likes and --connections must be positive")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# The catalog version for the ETag, the page of ids, the movies with their
+# certification, one IN query each for genres, stars and directors, and the
+# total.
+LISTING_STATEMENTS = 7
+
+
+async def test_filtered_listing_runs_one_listing_and_one_count(
+    client, catalog, statements
+):
+    statements.clear()
+    response = await client.get(
+        "/api/movies/",
+        params={"genre_ids": [catalog["genre_id"]], "year": 2001, "page_size": 2},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    newest_first = sorted(catalog["movie_ids"], reverse=True)
+    assert [movie["id"] for movie in body["movies"]] == newest_first[:2]
+    assert body["total_items"] == 3
+    assert len(statements) == LISTING_STATEMENTS
+
+
+async def test_listing_reuses_the_cached_count(client, catalog, statements):
+    params = {"star_ids": [catalog["star_id"]], "sort_by": "price", "page_size": 1}
+    await client.get("/api/movies/", params=params)
+
+    statements.clear()
+    response = await client.get("/api/movies/", params={**params, "page": 2})
+
+    assert response.status_code == 200
+    assert response.json()["total_items"] == 3
+    assert len(statements) == LISTING_STATEMENTS - 1
+
+
+async def test_facets_add_a_single_query(client, catalog, statements):
+    statements.clear()
+    response = await client.get(
+        "/api/movies/",
+        params={"genre_ids": [catalog["genre_id"]], "include_facets": True},
+    )
+
+    assert response.status_code == 200
+    stars = response.json()["facets"]["stars"]
+    assert [(star["id"], star["count"]) for star in stars] == [(catalog["star_id"], 3)]
+    assert len(statements) == LISTING_STATEMENTS + 1
@@ -0,0 +1,55 @@
+from sqlalchemy import select
+
+from cache import reference_cache
+from database.models import MovieModel
+
+# With an empty reference data cache: one lookup for the genre, star and
+# certification names together, the movie, its genre and star rows, its
+# search vector and the change notification.
+CREATE_STATEMENTS = 6
+
+
+def movie_payload(catalog: dict, **changes) -> dict:
+    return {
+        "name": "A created movie",
+        "year": 2024,
+        "time": 101,
+        "imdb": 7.5,
+        "votes": 10,
+        "description": "Created by a test.",
+        "price": "4.99",
+        "genres": [catalog["genre_id"]],
+        "stars": [catalog["star_id"]],
+        "directors": [],
+        "certification_id": catalog["certification_id"],
+        **changes,
+    }
+
+
+async def test_create_movie_statement_count(client, catalog, statements):
+    assert reference_cache.all("genre") is None
+
+    statements.clear()
+    response = await client.post("/api/movies/", json=movie_payload(catalog))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [genre["id"] for genre in body["genres"]] == [catalog["genre_id"]]
+    assert [star["id"] for star in body["stars"]] == [catalog["star_id"]]
+    assert body["certification"]["id"] == catalog["certification_id"]
+    assert len(statements) == CREATE_STATEMENTS
+
+
+async def test_create_movie_rejects_unknown_certification(
+    client, catalog, session_factory
+):
+    payload = movie_payload(catalog, certification_id=-1)
+
+    response = await client.post("/api/movies/", json=payload)
+
+    assert response.status_code == 400
+    async with session_factory() as session:
+        created = await session.scalar(
+            select(MovieModel.id).where(MovieModel.name == payload["name"])
+        )
+    assert created is None
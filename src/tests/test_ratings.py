@@ -0,0 +1,88 @@
+import asyncio
+import random
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from database import UserGroupEnum, UserGroupModel, UserModel
+from database.models import MovieModel, MovieRatingModel
+from repositories.movies_rep.movie import MovieRepository
+
+RATERS = 250
+# Every rater rates several times at once, so both first ratings and
+# re-ratings race with each other.
+RATINGS_PER_RATER = 4
+RATINGS = [Decimal(step) / 4 for step in range(4, 41)]
+
+
+@pytest.fixture
+async def raters(session_factory):
+    suffix = uuid.uuid4().hex[:12]
+    async with session_factory() as session:
+        await session.execute(
+            pg_insert(UserGroupModel)
+            .values(name=UserGroupEnum.USER)
+            .on_conflict_do_nothing()
+        )
+        group_id = await session.scalar(
+            select(UserGroupModel.id).where(UserGroupModel.name == UserGroupEnum.USER)
+        )
+        result = await session.execute(
+            insert(UserModel)
+            .values(
+                [
+                    {
+                        "email": f"rater-{suffix}-{number}@example.com",
+                        "hashed_password": "!",
+                        "is_active": True,
+                        "group_id": group_id,
+                    }
+                    for number in range(RATERS)
+                ]
+            )
+            .returning(UserModel.id)
+        )
+        user_ids = result.scalars().all()
+        await session.commit()
+
+    yield user_ids
+
+    async with session_factory() as session:
+        await session.execute(delete(UserModel).where(UserModel.id.in_(user_ids)))
+        await session.commit()
+
+
+async def test_concurrent_ratings_keep_exact_aggregates(
+    session_factory, catalog, raters
+):
+    movie_id = catalog["movie_ids"][0]
+    calls = [
+        (user_id, random.choice(RATINGS))
+        for user_id in raters
+        for _ in range(RATINGS_PER_RATER)
+    ]
+    random.shuffle(calls)
+
+    async def rate(user_id: int, rating: Decimal) -> None:
+        async with session_factory() as session:
+            await MovieRepository(session).rate_movie(movie_id, user_id, float(rating))
+
+    await asyncio.gather(*(rate(user_id, rating) for user_id, rating in calls))
+
+    async with session_factory() as session:
+        movie = await session.get(MovieModel, movie_id)
+        stored_count, stored_sum = (
+            await session.execute(
+                select(func.count(), func.sum(MovieRatingModel.rating)).where(
+                    MovieRatingModel.movie_id == movie_id
+                )
+            )
+        ).one()
+
+    assert stored_count == RATERS
+    assert movie.rating_count == stored_count
+    assert movie.rating_sum == stored_sum
+    assert movie.rate == round(float(stored_sum) / stored_count, 2)